@@ -10,6 +10,12 @@ import os
 import sys
 import pandas as pd
 
+# Shared readiness checks live in the revify_flow package
+REVIFY_FLOW_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "revify_flow")
+if REVIFY_FLOW_DIR not in sys.path:
+    sys.path.insert(0, REVIFY_FLOW_DIR)
+from src.revify_flow.tools.page_readiness import PageWaitMetrics, wait_for_reviews, click_next_and_wait
+
 # Load environment variables
 load_dotenv()
 username = os.getenv('NUMBER')
@@ -84,14 +90,13 @@ def scrape_reviews(url, target_reviews):
         sign_in_button.click()
         
         page_count = 1
+        metrics = PageWaitMetrics()
+        wait_for_reviews(driver, timeout=20, metrics=metrics, page=page_count)
         max_pages = 10  # Maximum number of pages to scrape to avoid excessive scraping
         
         # Continue until we reach target_reviews or max_pages
         while len(reviews) < target_reviews and page_count <= max_pages:
             print(f"Scraping page {page_count}...")
-            # Wait for reviews to load
-            time.sleep(5)  # Give more time for page to load
-            
             tables = driver.page_source
             
             soup = BeautifulSoup(tables, 'html.parser')
@@ -119,13 +124,17 @@ def scrape_reviews(url, target_reviews):
                 next_button = WebDriverWait(driver, 10).until(
                     EC.element_to_be_clickable((By.CSS_SELECTOR, "li.a-last a"))
                 )
-                next_button.click()
-                page_count += 1
-                time.sleep(2)  # Brief pause after clicking
             except Exception as e:
                 print(f"No more pages available: {str(e)}")
                 break
+
+            page_count += 1
+            if not click_next_and_wait(driver, next_button, metrics=metrics, page=page_count):
+                print("Next page did not load in time, stopping.")
+                break
                 
+        summary = metrics.summary()
+        print(f"Page readiness: {summary['pages']} pages, avg {summary['avg_ms']:.0f} ms wait")
         print(f"Scraping complete. Retrieved {len(reviews)} reviews.")
         
     except Exception as e:
@@ -31,6 +31,12 @@ if sys.platform == 'win32':
     import ctypes
     ctypes.windll.kernel32.SetErrorMode(0x0001 | 0x0002)
 
+# Optional raw page archive shared with the revify_flow scraper (REVIFY_PAGE_ARCHIVE_DIR)
+REVIFY_FLOW_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "revify_flow")
+if REVIFY_FLOW_DIR not in sys.path:
+    sys.path.insert(0, REVIFY_FLOW_DIR)
+from src.revify_flow.tools.page_archive import get_page_archive
+
 # Load credentials
 load_dotenv()
 USERNAME = os.getenv("NUMBER")
@@ -162,12 +168,14 @@ def scrape_reviews(url):
         reviews = []
         ratings = []
         pages_to_scrape = 10
+        page_archive = get_page_archive()
         for _ in range(pages_to_scrape):
             random_sleep(1, 2)
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            with open("amazon_reviews_page.txt", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
+            html = driver.page_source
+            soup = BeautifulSoup(html, "html.parser")
+            if page_archive is not None:
+                page_archive.submit(html)
 
             titles = soup.find_all("a", {"data-hook": "review-title"})
             bodies = soup.find_all("span", {"data-hook": "review-body"})
@@ -11,6 +11,7 @@ Rewritten to use undetected_chromedriver and a few anti-detection techniques:
 """
 
 import os
+import sys
 import time
 import random
 from dotenv import load_dotenv
@@ -23,6 +24,12 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Optional raw page archive shared with the revify_flow scraper (REVIFY_PAGE_ARCHIVE_DIR)
+REVIFY_FLOW_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "revify_flow")
+if REVIFY_FLOW_DIR not in sys.path:
+    sys.path.insert(0, REVIFY_FLOW_DIR)
+from src.revify_flow.tools.page_archive import get_page_archive
+
 load_dotenv()
 username = os.getenv("NUMBER")
 password = os.getenv("PASSWORD")
@@ -185,6 +192,7 @@ def scrape_reviews(url):
     review_titles = []
     reviews = []
     ratings = []
+    page_archive = get_page_archive()
 
     while a != 0:
         a -= 1
@@ -194,8 +202,8 @@ def scrape_reviews(url):
         tables = driver.page_source
         soup = BeautifulSoup(tables, "html.parser")
 
-        with open("amazon_reviews_page.txt", "w", encoding="utf-8") as f:
-            f.write(tables)
+        if page_archive is not None:
+            page_archive.submit(tables)
 
         ret_bodies = soup.find_all("span", {"data-hook": "review-body"})
         ret_titles = soup.find_all("a", {"data-hook": "review-title"})
@@ -14,8 +14,19 @@ from crewai import Crew, Process
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 # Import your existing functions
-from main import run_workflow, extract_json_from_markdown, summarize_reviews_chunked
-from src.revify_flow.crews.team_revify.team_revify import TeamRevify
+from main import run_workflow, extract_json_from_markdown, parses_as_json, summarize_reviews_chunked, summarize_reviews_streaming, reduce_summaries, record_to_review_dict, analysis_mode, analyze_features_by_evidence
+from src.revify_flow.crews.team_revify.team_factory import get_team, get_team_factory
+from src.revify_flow.tools.amazon_scraper_tool import AmazonScraperTool
+from src.revify_flow.tools.driver_pool import get_driver_pool
+from src.revify_flow.tools.review_store import get_review_store
+from src.revify_flow.tools.amazon_urls import product_key, same_product
+from src.revify_flow.tools.scrape_cache import get_fresh_crawl
+from src.revify_flow.tools.review_normalizer import normalize_reviews, normalize_review_dicts
+from src.revify_flow.tools.columnar_store import write_chunk_summaries, write_feature_analyses
+from src.revify_flow.tools.job_workspace import JobWorkspace, atomic_write_json, prune_workspaces
+from src.revify_flow.tools.results_catalog import get_results_catalog
+from src.revify_flow.tools.llm_cache import cached_kickoff, get_llm_cache
+from src.revify_flow.tools.prompt_encoding import track_prompt_savings
 
 app = Flask(__name__)
 CORS(app)  # Allow cross-origin requests from your Next.js frontend
@@ -52,15 +63,17 @@ def update_status(progress, phase, error=None):
         analysis_status['error'] = error
         analysis_status['is_running'] = False
 
-def run_analysis_workflow(product_url, product_name, selected_features=None):
+def run_analysis_workflow(product_url, product_name, selected_features=None, workspace=None):
     """Run the analysis workflow in a separate thread"""
+    workspace = workspace or JobWorkspace()
+    job_savings = track_prompt_savings()
     try:
         global analysis_status
         analysis_status['is_running'] = True
         analysis_status['start_time'] = datetime.now()
         
         update_status(10, "Initializing TeamRevify...")
-        team = TeamRevify()
+        team = get_team(workspace)
 
         # Check if features are provided
         if selected_features:
@@ -81,7 +94,8 @@ def run_analysis_workflow(product_url, product_name, selected_features=None):
                 verbose=False  # Reduce console output
             )
             
-            feature_result = feature_crew.kickoff(inputs={"product_input": product_url})
+            feature_result = cached_kickoff(feature_crew, label="feature extraction",
+                                            inputs={"product_input": product_url}, validate=parses_as_json)
             feature_raw = feature_result.raw
             
             update_status(40, "Processing extracted features...")
@@ -120,107 +134,49 @@ def run_analysis_workflow(product_url, product_name, selected_features=None):
         
         update_status(70, "Processing scraped reviews...")
         
-        # Phase 3: Load and process reviews
-        import pandas as pd
-        
-        if not os.path.exists("scraped_reviews.csv"):
-            raise Exception("No reviews were scraped. Please check the product URL.")
-            
-        df = pd.read_csv("scraped_reviews.csv")
+        # Phase 3: Load this product's reviews from the review store
+        df = get_review_store().reviews_dataframe(product_key(product_url), limit=50)
         if df.empty:
-            raise Exception("No reviews found in the scraped data.")
+            raise Exception("No reviews were scraped. Please check the product URL.")
         
-        df_filtered = df[['name', 'brand', 'reviews.rating', 'reviews.title', 'reviews.text']]
+        df_filtered = normalize_reviews(df)[['name', 'brand', 'reviews.rating', 'reviews.title', 'reviews.text']]
         review_dicts = df_filtered.to_dict(orient='records')
         
         update_status(80, "Analyzing reviews by features...")
         
         # Phase 4: Analyze reviews
-        chunk_summaries = summarize_reviews_chunked(review_dicts, team, chunk_size=30)
-        reviews_input = "\n\n".join(chunk_summaries)
-        
-        review_agent = team.review_analysis_agent()
-        analysis_task = team.comprehensive_review_analysis_task()
-        
-        analysis_crew = Crew(
-            agents=[review_agent],
-            tasks=[analysis_task],
-            process=Process.sequential,
-            verbose=False
-        )
-        
-        result = analysis_crew.kickoff(inputs={
-            "features": ", ".join(features),
-            "reviews": reviews_input
-        })
-        
-        update_status(95, "Finalizing results...")
-        
-        # Process results with better error handling
-        raw_output = result.raw
-        print(f"DEBUG: Raw output preview: {raw_output[:500]}...")
-        
-        # Extract and clean JSON
-        json_str = extract_json_from_markdown(raw_output)
-        print(f"DEBUG: Extracted JSON preview: {json_str[:500]}...")
-        
-        # Try to parse JSON with multiple fallback strategies
-        analysis_results = None
-
-
-        # Strategy 1: Direct parsing
-        try:
-            analysis_results = json.loads(json_str)
-            print("✅ JSON parsed successfully on first attempt")
-        except json.JSONDecodeError as e:
-            print(f"⚠️ First JSON parse attempt failed: {e}")
+        mode = analysis_mode()
+        if mode != "summaries":
+            analysis_results = analyze_features_by_evidence(review_dicts, features, team, fast=mode == "fast")
+        else:
+            chunk_summaries = summarize_reviews_chunked(review_dicts, team)
+            write_chunk_summaries(product_key(product_url), chunk_summaries)
+            reviews_input = "\n\n".join(reduce_summaries(chunk_summaries, team))
             
-            # Strategy 2: Try with additional cleaning
-            try:
-                # More aggressive cleaning
-                cleaned_json = json_str.replace('\\"', '"')  # Fix over-escaped quotes
-                cleaned_json = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_json)  # Remove control chars
-                analysis_results = json.loads(cleaned_json)
-                print("✅ JSON parsed successfully after cleaning")
-            except json.JSONDecodeError as e2:
-                print(f"⚠️ Second JSON parse attempt failed: {e2}")
-                
-                # Strategy 3: Try to extract just the array part if it's wrapped
-                try:
-                    # Look for array pattern
-                    array_match = re.search(r'\[(.*)\]', json_str, re.DOTALL)
-                    if array_match:
-                        array_content = '[' + array_match.group(1) + ']'
-                        analysis_results = json.loads(array_content)
-                        print("✅ JSON parsed successfully by extracting array")
-                    else:
-                        raise Exception("No valid JSON array found")
-                except Exception as e3:
-                    print(f"⚠️ Third JSON parse attempt failed: {e3}")
-                    
-                    # Strategy 4: Create a fallback result
-                    print("Creating fallback result from raw text...")
-                    analysis_results = create_fallback_result(raw_output, features)
-        
-        if not analysis_results:
-            raise Exception("Could not parse analysis results into valid JSON")
+            review_agent = team.review_analysis_agent()
+            analysis_task = team.comprehensive_review_analysis_task()
+            
+            analysis_crew = Crew(
+                agents=[review_agent],
+                tasks=[analysis_task],
+                process=Process.sequential,
+                verbose=False
+            )
+            
+            result = cached_kickoff(analysis_crew, label="feature analysis", inputs={
+                "features": ", ".join(features),
+                "reviews": reviews_input
+            }, validate=parses_as_json)
+            analysis_results = parse_analysis_output(result.raw, features)
         
-        # Ensure analysis_results is a list
-        if not isinstance(analysis_results, list):
-            if isinstance(analysis_results, dict):
-                analysis_results = [analysis_results]
-            else:
-                raise Exception("Analysis results is not in expected format")
+        update_status(95, "Finalizing results...")
 
-        # Save results
-        os.makedirs("output", exist_ok=True)
-        
-        # Create unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"output/feature_analysis_{timestamp}.json"
-        
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        # Save results (the job id is unique, so concurrent jobs never share a file)
+        filename = f"output/feature_analysis_{workspace.job_id}.json"
+        atomic_write_json(filename, analysis_results)
+        write_feature_analyses(product_key(product_url), analysis_results, filename)
+        get_results_catalog().record(filename, analysis_results, product_key(product_url), product_name,
+                                     len(review_dicts), workspace.job_id)
         
         update_status(100, "Analysis completed successfully!")
         
@@ -229,117 +185,112 @@ def run_analysis_workflow(product_url, product_name, selected_features=None):
             'features': features,
             'analysis': analysis_results,
             'total_reviews': len(review_dicts),
-            'filename': filename
+            'filename': filename,
+            'job_id': workspace.job_id,
+            'prompt_savings': job_savings.totals()
         }
         analysis_status['is_running'] = False
+        workspace.close()
+        print(f"🏗️ Team setup: {get_team_factory().overhead_summary()}")
+        get_llm_cache().log_summary()
+        job_savings.log_summary()
         
     except Exception as e:
         error_msg = f"Error during analysis: {str(e)}"
         print(f"Analysis error: {error_msg}")
         print(traceback.format_exc())
         update_status(0, "Analysis failed", error_msg)
+        workspace.close(succeeded=False)
 
 import threading
 from queue import Queue
 import pandas as pd
 
-def run_analysis_workflow_optimized(product_url, product_name, selected_features=None):
+def run_analysis_workflow_optimized(product_url, product_name, selected_features=None, workspace=None):
     """Optimized parallel workflow"""
+    workspace = workspace or JobWorkspace()
+    job_savings = track_prompt_savings()
     try:
         global analysis_status
         analysis_status['is_running'] = True
         analysis_status['start_time'] = datetime.now()
         
         update_status(10, "Initializing parallel tasks...")
-        team = TeamRevify()
+        team = get_team(workspace)
+        mode = analysis_mode()
         
         result_queue = Queue()
         features = None
         reviews_df = None
+        review_dicts = None
+        chunk_summaries = None
 
         if selected_features:
                 # User already selected features - use pre-scraped reviews
                 features = selected_features
                 update_status(20, "Using pre-selected features...")
                 
-                # Check if reviews are cached for THIS specific product
-                if (analysis_status['reviews_cached'] and 
-                    analysis_status['cached_product_url'] == product_url and 
-                    os.path.exists("scraped_reviews.csv")):
+                # Check if reviews are cached for THIS specific product (by marketplace + ASIN)
+                if get_fresh_crawl(product_url, 50) or (
+                    analysis_status['reviews_cached'] and
+                    same_product(analysis_status['cached_product_url'], product_url) and
+                    get_review_store().count(product_key(product_url)) > 0):
                     # Use cached reviews from this session
                     update_status(30, "Loading pre-scraped reviews...")
-                    reviews_df = pd.read_csv("scraped_reviews.csv")
+                    reviews_df = get_review_store().reviews_dataframe(product_key(product_url), limit=50)
                     print(f"✅ Using pre-scraped reviews: {len(reviews_df)} reviews loaded")
                 else:
-                    # Different product or reviews not cached - scrape fresh
-                    update_status(30, "Scraping reviews for selected features...")
-                    scrape_thread = threading.Thread(
-                        target=scrape_reviews_parallel,
-                        args=(product_url, product_name, result_queue, update_status)
-                    )
-                    scrape_thread.start()
-                    scrape_thread.join()
-                    
-                    # Collect scraping results
-                    while not result_queue.empty():
-                        result_type, result_data = result_queue.get()
-                        if result_type == "reviews":
-                            reviews_df = result_data
+                    # Different product or reviews not cached - scrape fresh,
+                    # summarizing each chunk as soon as its pages arrive
+                    update_status(30, "Scraping and summarizing reviews for selected features...")
+                    review_dicts, chunk_summaries = stream_scrape_and_summarize(product_url, product_name, team, summarize=mode == "summaries")
                     
                     # Update cache markers
                     analysis_status['reviews_cached'] = True
                     analysis_status['cached_product_url'] = product_url
         else:
-                # Run feature extraction AND review scraping in PARALLEL
+                # Run feature extraction in parallel with streamed scraping + summarization
                 update_status(20, "Running feature extraction and review scraping in parallel...")
                 
                 feature_thread = threading.Thread(
                     target=extract_features_parallel,
-                    args=(product_url, result_queue, update_status)
-                )
-                
-                scrape_thread = threading.Thread(
-                    target=scrape_reviews_parallel,
-                    args=(product_url, product_name, result_queue, update_status)
+                    args=(product_url, result_queue, update_status),
+                    name=workspace.thread_name("features")
                 )
-                
-                # Start both threads
                 feature_thread.start()
-                scrape_thread.start()
-                
-                # Wait for both to complete
+
+                review_dicts, chunk_summaries = stream_scrape_and_summarize(product_url, product_name, team, summarize=mode == "summaries")
+
                 feature_thread.join()
-                scrape_thread.join()
 
                 # Collect results from queue
                 while not result_queue.empty():
                     result_type, result_data = result_queue.get()
                     if result_type == "features":
                         features = result_data
-                    elif result_type == "reviews":
-                        reviews_df = result_data
         
         if features is None:
                 raise Exception("Feature extraction failed")
-        if reviews_df is None or reviews_df.empty:
-            raise Exception("No reviews were scraped")
         
         if len(features) > 10:
                 features = features[:10]
-            
-        update_status(70, f"Processing {len(reviews_df)} reviews for {len(features)} features...")
 
         # ══════════════════════════════════════════════════
         # PHASE 2: INCREMENTAL SUMMARIZATION
         # ══════════════════════════════════════════════════
-        
-        # Process reviews in chunks (already done during scraping)
-        df_filtered = reviews_df[['name', 'brand', 'reviews.rating', 'reviews.title', 'reviews.text']]
-        review_dicts = df_filtered.to_dict(orient='records')
-        
-        # Summarize in batches
-        chunk_summaries = summarize_reviews_chunked(review_dicts, team, chunk_size=30)
-        reviews_input = "\n\n".join(chunk_summaries)
+
+        if chunk_summaries is None:
+            # Cached reviews: nothing was streamed, load (and summarize) them now
+            if reviews_df is None or reviews_df.empty:
+                raise Exception("No reviews were scraped")
+            df_filtered = normalize_reviews(reviews_df)[['name', 'brand', 'reviews.rating', 'reviews.title', 'reviews.text']]
+            review_dicts = df_filtered.to_dict(orient='records')
+
+            update_status(70, f"Processing {len(review_dicts)} reviews for {len(features)} features...")
+            if mode == "summaries":
+                chunk_summaries = summarize_reviews_chunked(review_dicts, team)
+        elif not review_dicts:
+            raise Exception("No reviews were scraped")
 
         # ══════════════════════════════════════════════════
         # PHASE 3: FINAL ANALYSIS
@@ -347,85 +298,34 @@ def run_analysis_workflow_optimized(product_url, product_name, selected_features
         
         update_status(80, "Running final AI analysis...")
         
-        review_agent = team.review_analysis_agent()
-        analysis_task = team.comprehensive_review_analysis_task()
-        
-        analysis_crew = Crew(
-            agents=[review_agent],
-            tasks=[analysis_task],
-            process=Process.sequential,
-            verbose=False
-        )
-        
-        result = analysis_crew.kickoff(inputs={
-            "features": ", ".join(features),
-            "reviews": reviews_input
-        })
-        
-        # Process results with better error handling
-        raw_output = result.raw
-        print(f"DEBUG: Raw output preview: {raw_output[:500]}...")
-        
-        # Extract and clean JSON
-        json_str = extract_json_from_markdown(raw_output)
-        print(f"DEBUG: Extracted JSON preview: {json_str[:500]}...")
-        
-        # Try to parse JSON with multiple fallback strategies
-        analysis_results = None
+        if mode != "summaries":
+            analysis_results = analyze_features_by_evidence(review_dicts, features, team, fast=mode == "fast")
+        else:
+            write_chunk_summaries(product_key(product_url), chunk_summaries)
+            reviews_input = "\n\n".join(reduce_summaries(chunk_summaries, team))
 
-        # Strategy 1: Direct parsing
-        try:
-            analysis_results = json.loads(json_str)
-            print("✅ JSON parsed successfully on first attempt")
-        except json.JSONDecodeError as e:
-            print(f"⚠️ First JSON parse attempt failed: {e}")
+            review_agent = team.review_analysis_agent()
+            analysis_task = team.comprehensive_review_analysis_task()
             
-            # Strategy 2: Try with additional cleaning
-            try:
-                # More aggressive cleaning
-                cleaned_json = json_str.replace('\\"', '"')  # Fix over-escaped quotes
-                cleaned_json = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_json)  # Remove control chars
-                analysis_results = json.loads(cleaned_json)
-                print("✅ JSON parsed successfully after cleaning")
-            except json.JSONDecodeError as e2:
-                print(f"⚠️ Second JSON parse attempt failed: {e2}")
-                
-                # Strategy 3: Try to extract just the array part if it's wrapped
-                try:
-                    # Look for array pattern
-                    array_match = re.search(r'\[(.*)\]', json_str, re.DOTALL)
-                    if array_match:
-                        array_content = '[' + array_match.group(1) + ']'
-                        analysis_results = json.loads(array_content)
-                        print("✅ JSON parsed successfully by extracting array")
-                    else:
-                        raise Exception("No valid JSON array found")
-                except Exception as e3:
-                    print(f"⚠️ Third JSON parse attempt failed: {e3}")
-                    
-                    # Strategy 4: Create a fallback result
-                    print("Creating fallback result from raw text...")
-                    analysis_results = create_fallback_result(raw_output, features)
-        
-        if not analysis_results:
-            raise Exception("Could not parse analysis results into valid JSON")
-        
-        # Ensure analysis_results is a list
-        if not isinstance(analysis_results, list):
-            if isinstance(analysis_results, dict):
-                analysis_results = [analysis_results]
-            else:
-                raise Exception("Analysis results is not in expected format")
-
-        # Save results
-        os.makedirs("output", exist_ok=True)
-        
-        # Create unique filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"output/feature_analysis_{timestamp}.json"
-        
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+            analysis_crew = Crew(
+                agents=[review_agent],
+                tasks=[analysis_task],
+                process=Process.sequential,
+                verbose=False
+            )
+            
+            result = cached_kickoff(analysis_crew, label="feature analysis", inputs={
+                "features": ", ".join(features),
+                "reviews": reviews_input
+            }, validate=parses_as_json)
+            analysis_results = parse_analysis_output(result.raw, features)
+
+        # Save results (the job id is unique, so concurrent jobs never share a file)
+        filename = f"output/feature_analysis_{workspace.job_id}.json"
+        atomic_write_json(filename, analysis_results)
+        write_feature_analyses(product_key(product_url), analysis_results, filename)
+        get_results_catalog().record(filename, analysis_results, product_key(product_url), product_name,
+                                     len(review_dicts), workspace.job_id)
         
         update_status(100, "Analysis completed successfully!")
         
@@ -434,22 +334,29 @@ def run_analysis_workflow_optimized(product_url, product_name, selected_features
             'features': features,
             'analysis': analysis_results,
             'total_reviews': len(review_dicts),
-            'filename': filename
+            'filename': filename,
+            'job_id': workspace.job_id,
+            'prompt_savings': job_savings.totals()
         }
         analysis_status['is_running'] = False
+        workspace.close()
+        print(f"🏗️ Team setup: {get_team_factory().overhead_summary()}")
+        get_llm_cache().log_summary()
+        job_savings.log_summary()
 
     except Exception as e:
         error_msg = f"Error during analysis: {str(e)}"
         print(f"Analysis error: {error_msg}")
         print(traceback.format_exc())
         update_status(0, "Analysis failed", error_msg)
+        workspace.close(succeeded=False)
 
 def extract_features_parallel(product_url, result_queue, update_callback):
     """Extract features in parallel thread"""
     try:
         update_callback(30, "🔍 Extracting features...")
         
-        team = TeamRevify()
+        team = get_team()
         feature_agent = team.feature_extractor()
         feature_task = team.extract_features_task()
         
@@ -460,7 +367,8 @@ def extract_features_parallel(product_url, result_queue, update_callback):
             verbose=False
         )
         
-        feature_result = feature_crew.kickoff(inputs={"product_input": product_url})
+        feature_result = cached_kickoff(feature_crew, label="feature extraction",
+                                        inputs={"product_input": product_url}, validate=parses_as_json)
         
         # Process features
         extracted_json = extract_json_from_markdown(feature_result.raw)
@@ -478,12 +386,19 @@ def extract_features_parallel(product_url, result_queue, update_callback):
         print(f"❌ Feature extraction error: {e}")
         result_queue.put(("features", None))
 
-def scrape_reviews_parallel(product_url, product_name, result_queue, update_callback):
+def scrape_reviews_parallel(product_url, product_name, result_queue, update_callback, workspace=None):
     """Scrape reviews in parallel thread with incremental processing"""
     try:
+        # Fresh reviews from a recent crawl skip the scraper crew entirely
+        if get_fresh_crawl(product_url, 50):
+            reviews_df = get_review_store().reviews_dataframe(product_key(product_url), limit=50)
+            result_queue.put(("reviews", reviews_df))
+            print(f"⚡ Using {len(reviews_df)} cached reviews, scraping skipped")
+            return
+
         update_callback(40, "📚 Scraping reviews...")
         
-        team = TeamRevify()
+        team = get_team(workspace)
         review_scraper = team.review_scraper()
         scrape_reviews_task = team.scrape_reviews_task()
         
@@ -501,12 +416,11 @@ def scrape_reviews_parallel(product_url, product_name, result_queue, update_call
             "product_name": product_name or "Product"
         })
         
-        # Load scraped reviews
-        if not os.path.exists("scraped_reviews.csv"):
+        # Load this product's reviews from the review store
+        reviews_df = get_review_store().reviews_dataframe(product_key(product_url), limit=50)
+        if reviews_df.empty:
             raise Exception("No reviews were scraped")
         
-        reviews_df = pd.read_csv("scraped_reviews.csv")
-        
         result_queue.put(("reviews", reviews_df))
         print(f"✅ Review scraping complete: {len(reviews_df)} reviews scraped")
         
@@ -516,6 +430,100 @@ def scrape_reviews_parallel(product_url, product_name, result_queue, update_call
 
         
 
+def stream_scrape_and_summarize(product_url, product_name, team, target_reviews=50, chunk_size=None,
+                                summarize=True):
+    """
+    Scrape reviews page by page and summarize each full chunk as it fills.
+
+    Calls AmazonScraperTool directly instead of through the scraper agent, so
+    summarization of the first chunks runs while later pages are still loading.
+    With summarize=False (evidence analysis) the reviews are only collected.
+    Returns (review_dicts, chunk_summaries).
+    """
+    product_name = product_name or "Product"
+    scraper = team.amazon_scraper_tool()
+    review_dicts = []
+    seen_keys = set()  # dedup across pages
+
+    def review_batches():
+        for page in scraper.iter_review_pages(product_url, target_reviews, product_name):
+            batch = normalize_review_dicts(
+                [record_to_review_dict(record, product_name) for record in page], seen_keys
+            )
+            review_dicts.extend(batch)
+            update_status(40 + 30 * len(review_dicts) // target_reviews,
+                          f"📚 Scraped {len(review_dicts)}/{target_reviews} reviews"
+                          + (", summarizing as they arrive..." if summarize else "..."))
+            yield batch
+
+    if not summarize:
+        for _ in review_batches():
+            pass
+        print(f"✅ Streamed {len(review_dicts)} reviews")
+        return review_dicts, []
+
+    chunk_summaries = summarize_reviews_streaming(review_batches(), team, chunk_size=chunk_size)
+    print(f"✅ Streamed {len(review_dicts)} reviews into {len(chunk_summaries)} chunk summaries")
+    return review_dicts, chunk_summaries
+
+def parse_analysis_output(raw_output, features):
+    """Analysis list from the comprehensive analysis output, trying progressively looser parses"""
+    print(f"DEBUG: Raw output preview: {raw_output[:500]}...")
+    
+    # Extract and clean JSON
+    json_str = extract_json_from_markdown(raw_output)
+    print(f"DEBUG: Extracted JSON preview: {json_str[:500]}...")
+    
+    # Try to parse JSON with multiple fallback strategies
+    analysis_results = None
+
+    # Strategy 1: Direct parsing
+    try:
+        analysis_results = json.loads(json_str)
+        print("✅ JSON parsed successfully on first attempt")
+    except json.JSONDecodeError as e:
+        print(f"⚠️ First JSON parse attempt failed: {e}")
+        
+        # Strategy 2: Try with additional cleaning
+        try:
+            # More aggressive cleaning
+            cleaned_json = json_str.replace('\\"', '"')  # Fix over-escaped quotes
+            cleaned_json = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', cleaned_json)  # Remove control chars
+            analysis_results = json.loads(cleaned_json)
+            print("✅ JSON parsed successfully after cleaning")
+        except json.JSONDecodeError as e2:
+            print(f"⚠️ Second JSON parse attempt failed: {e2}")
+            
+            # Strategy 3: Try to extract just the array part if it's wrapped
+            try:
+                # Look for array pattern
+                array_match = re.search(r'\[(.*)\]', json_str, re.DOTALL)
+                if array_match:
+                    array_content = '[' + array_match.group(1) + ']'
+                    analysis_results = json.loads(array_content)
+                    print("✅ JSON parsed successfully by extracting array")
+                else:
+                    raise Exception("No valid JSON array found")
+            except Exception as e3:
+                print(f"⚠️ Third JSON parse attempt failed: {e3}")
+                
+                # Strategy 4: Create a fallback result
+                print("Creating fallback result from raw text...")
+                analysis_results = create_fallback_result(raw_output, features)
+    
+    if not analysis_results:
+        raise Exception("Could not parse analysis results into valid JSON")
+    
+    # Ensure analysis_results is a list
+    if not isinstance(analysis_results, list):
+        if isinstance(analysis_results, dict):
+            analysis_results = [analysis_results]
+        else:
+            raise Exception("Analysis results is not in expected format")
+
+    return analysis_results
+
+
 def create_fallback_result(raw_output, features):
     """Create a fallback result when JSON parsing fails"""
     fallback_results = []
@@ -571,12 +579,14 @@ feature_extraction_status = {
     'completed': False,
     'features': None,
     'error': None,
-    'reviews_ready': False
+    'reviews_ready': False,
+    'review_cache': None  # Freshness metadata when reviews came from the scrape cache
 }
 
-def run_feature_extraction_async(product_url, product_name):
+def run_feature_extraction_async(product_url, product_name, workspace=None):
     """Run feature extraction and review scraping in background"""
     global feature_extraction_status
+    workspace = workspace or JobWorkspace()
     
     try:
         feature_extraction_status['is_running'] = True
@@ -584,6 +594,15 @@ def run_feature_extraction_async(product_url, product_name):
         feature_extraction_status['features'] = None
         feature_extraction_status['error'] = None
         feature_extraction_status['reviews_ready'] = False
+        feature_extraction_status['review_cache'] = None
+
+        # Fresh cached reviews are usable right away, before features are ready
+        cached_crawl = get_fresh_crawl(product_url, 50)
+        if cached_crawl:
+            feature_extraction_status['reviews_ready'] = True
+            feature_extraction_status['review_cache'] = cached_crawl
+            analysis_status['reviews_cached'] = True
+            analysis_status['cached_product_url'] = product_url
         
         update_status(20, "Starting parallel feature extraction and review scraping...")
         
@@ -593,12 +612,14 @@ def run_feature_extraction_async(product_url, product_name):
         # Create threads for parallel execution
         feature_thread = threading.Thread(
             target=extract_features_parallel,
-            args=(product_url, result_queue, update_status)
+            args=(product_url, result_queue, update_status),
+            name=workspace.thread_name("features")
         )
         
         scrape_thread = threading.Thread(
             target=scrape_reviews_parallel,
-            args=(product_url, product_name, result_queue, update_status)
+            args=(product_url, product_name, result_queue, update_status, workspace),
+            name=workspace.thread_name("scrape")
         )
         
         # Start both threads simultaneously
@@ -636,6 +657,7 @@ def run_feature_extraction_async(product_url, product_name):
         if features is None:
             feature_extraction_status['error'] = "Feature extraction failed"
             feature_extraction_status['is_running'] = False
+            workspace.close(succeeded=False)
             return
         
         # Store results
@@ -643,9 +665,8 @@ def run_feature_extraction_async(product_url, product_name):
         feature_extraction_status['completed'] = True
         feature_extraction_status['is_running'] = False
         
-        # Store reviews_df globally for later use
+        # Reviews are already in the review store for later use
         if reviews_df is not None:
-            reviews_df.to_csv("scraped_reviews.csv", index=False)
             feature_extraction_status['reviews_ready'] = True
             
             # Mark reviews as cached for this session
@@ -653,11 +674,13 @@ def run_feature_extraction_async(product_url, product_name):
             analysis_status['cached_product_url'] = product_url
             
             print(f"✅ Pre-scraped {len(reviews_df)} reviews saved for later analysis")
+        workspace.close()
         
     except Exception as e:
         feature_extraction_status['error'] = str(e)
         feature_extraction_status['is_running'] = False
         feature_extraction_status['completed'] = False
+        workspace.close(succeeded=False)
 
 @app.route('/api/extract-features', methods=['POST'])
 def extract_features_only():
@@ -678,22 +701,32 @@ def extract_features_only():
             return jsonify({"error": "Feature extraction already in progress"}), 409
         
         # Clear cache if analyzing a different product
-        if analysis_status['cached_product_url'] != product_url:
+        if not same_product(analysis_status['cached_product_url'], product_url):
             analysis_status['reviews_cached'] = False
             analysis_status['cached_product_url'] = None
             print(f"🔄 Starting fresh analysis for new product")
         
+        # Each job writes its files into its own workspace
+        prune_workspaces()
+        workspace = JobWorkspace()
+        workspace.attach_log()
+        
         # Start extraction in background thread
         extraction_thread = threading.Thread(
             target=run_feature_extraction_async,
-            args=(product_url, product_name)
+            args=(product_url, product_name, workspace),
+            name=workspace.thread_name("extract-features")
         )
         extraction_thread.daemon = True
         extraction_thread.start()
         
+        cached_crawl = get_fresh_crawl(product_url, 50)
         return jsonify({
             "message": "Feature extraction started",
-            "status": "running"
+            "status": "running",
+            "job_id": workspace.job_id,
+            "reviews_cached": cached_crawl is not None,
+            "review_cache": cached_crawl
         })
         
     except Exception as e:
@@ -708,7 +741,8 @@ def get_feature_extraction_status():
         'is_running': feature_extraction_status['is_running'],
         'completed': feature_extraction_status['completed'],
         'error': feature_extraction_status['error'],
-        'reviews_ready': feature_extraction_status['reviews_ready']
+        'reviews_ready': feature_extraction_status['reviews_ready'],
+        'review_cache': feature_extraction_status['review_cache']
     }
     
     if feature_extraction_status['completed'] and feature_extraction_status['features']:
@@ -737,11 +771,15 @@ def analyze_product():
         
         # Reset status and start analysis in background thread
         reset_status()
+        prune_workspaces()
+        workspace = JobWorkspace()
+        workspace.attach_log()
         
         # Start analysis in a separate thread
         analysis_thread = threading.Thread(
             target=run_analysis_workflow_optimized, 
-            args=(product_url, product_name, selected_features)
+            args=(product_url, product_name, selected_features, workspace),
+            name=workspace.thread_name("analysis")
         )
         analysis_thread.daemon = True
         analysis_thread.start()
@@ -749,6 +787,7 @@ def analyze_product():
         return jsonify({
             "message": "Analysis started successfully",
             "status": "running",
+            "job_id": workspace.job_id,
             "features_count": len(selected_features) if selected_features else "all"
         })
         
@@ -768,6 +807,25 @@ def get_results():
     else:
         return jsonify({"error": "No results available"}), 404
 
+@app.route('/api/analyses', methods=['GET'])
+def list_analyses():
+    """Saved analyses, newest first (optionally ?product_url=...&limit=N)"""
+    product_url = request.args.get('product_url')
+    limit = request.args.get('limit', type=int)
+    results = get_results_catalog().list_results(product_key(product_url) if product_url else None, limit)
+    return jsonify({"analyses": results, "total_count": len(results)})
+
+@app.route('/api/analyses/latest', methods=['GET'])
+def latest_analysis():
+    """Most recent saved analysis of a product (?product_url=...)"""
+    product_url = request.args.get('product_url')
+    if not product_url:
+        return jsonify({"error": "product_url is required"}), 400
+    result = get_results_catalog().latest(product_key(product_url))
+    if result is None:
+        return jsonify({"error": "No analysis found for this product"}), 404
+    return jsonify(result)
+
 @app.route('/api/download/<filename>', methods=['GET'])
 def download_file(filename):
     """Download analysis file"""
@@ -780,5 +838,14 @@ def download_file(filename):
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+def prewarm_driver_pool():
+    """Launch the shared Chrome driver(s) before the first scrape request arrives"""
+    pool = get_driver_pool(AmazonScraperTool()._setup_driver)
+    if pool:
+        pool.warm()
+
 if __name__ == '__main__':
+    # Only warm in the serving process, not the debug reloader's parent
+    if os.getenv("REVIFY_DRIVER_PREWARM") and os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        threading.Thread(target=prewarm_driver_pool, daemon=True).start()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
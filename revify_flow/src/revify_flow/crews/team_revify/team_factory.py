@@ -0,0 +1,182 @@
+"""
+Process-wide, thread-safe source of TeamRevify agents and tasks.
+
+Building a TeamRevify parses agents.yaml and tasks.yaml, creates every agent
+and its LLM client, and constructs an AmazonScraperTool (which calls
+load_dotenv and opens the session store). Jobs used to do this several times
+over: once per job, again in each parallel phase, and again inside
+summarize_reviews_chunked.
+
+``TeamFactory`` builds a single prototype TeamRevify per process and hands
+out ``JobTeam`` handles with the same agent/task methods:
+
+- agents are copies of the prototype's, cached per thread (a crewAI Agent
+  keeps per-execution state, so one instance must not run on two threads at
+  once); the copies share the prototype's LLM client and litellm's
+  connection pool
+- tasks are fresh Task objects built from the prototype's definitions and
+  bound to the calling thread's agents
+- the review scraper agent gets a scraper tool writing into the job's
+  workspace, created once per job
+
+``overhead_summary()`` reports the setup time avoided compared with
+building a TeamRevify for every handle.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from crewai import Task
+
+from src.revify_flow.crews.team_revify.team_revify import TeamRevify
+from src.revify_flow.tools.amazon_scraper_tool import AmazonScraperTool
+from src.revify_flow.tools.job_workspace import JobWorkspace
+
+logger = logging.getLogger('amazon_scraper')
+
+_factory = None
+_factory_lock = threading.Lock()
+
+# Task fields set by an execution (or per instance) that a fresh copy must not inherit
+_TASK_STATE_FIELDS = {
+    "id", "agent", "context", "tools", "output", "used_tools", "tools_errors", "delegations",
+    "processed_by_agents", "retry_count", "start_time", "end_time",
+}
+
+
+class TeamFactory:
+    """Lazily built prototype TeamRevify plus per-thread agent copies"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._prototype = None
+        self._agent_names = {}  # id(prototype agent) -> agent method name
+        self._local = threading.local()
+        self.prototype_setup_s = 0.0
+        self.teams_served = 0
+        self.agents_built = 0
+        self.agents_reused = 0
+
+    @property
+    def prototype(self) -> TeamRevify:
+        with self._lock:
+            if self._prototype is None:
+                start = time.perf_counter()
+                prototype = TeamRevify()
+                self._agent_names = {
+                    id(getattr(prototype, name)()): name for name in prototype.agents_config
+                }
+                self.prototype_setup_s = time.perf_counter() - start
+                self._prototype = prototype
+                logger.info(f"🏗️ Built shared TeamRevify in {self.prototype_setup_s * 1000:.1f} ms")
+            return self._prototype
+
+    def agent(self, name: str):
+        """This thread's copy of the prototype agent ``name``"""
+        agents = getattr(self._local, "agents", None)
+        if agents is None:
+            agents = self._local.agents = {}
+        if name in agents:
+            with self._lock:
+                self.agents_reused += 1
+            return agents[name]
+        agents[name] = getattr(self.prototype, name)().copy()
+        with self._lock:
+            self.agents_built += 1
+        return agents[name]
+
+    def task(self, name: str, agent=None) -> Task:
+        """A new Task from the prototype's definition of ``name``, run by ``agent`` or this thread's copy"""
+        template = getattr(self.prototype, name)()
+        if agent is None:
+            agent = self.agent(self._agent_names[id(template.agent)])
+        # Every configured field (output_file, output_pydantic, callback, ...) but none of the run state
+        fields = template.model_dump(exclude=_TASK_STATE_FIELDS)
+        fields = {key: value for key, value in fields.items() if value is not None}
+        return type(template)(
+            **fields,
+            context=template.context or None,
+            tools=list(template.tools or []),
+            agent=agent,
+        )
+
+    def team(self, workspace: Optional[JobWorkspace] = None) -> "JobTeam":
+        self.prototype
+        with self._lock:
+            self.teams_served += 1
+        return JobTeam(self, workspace)
+
+    def overhead_summary(self) -> dict:
+        """Setup work done vs. what building a TeamRevify per handle would have cost"""
+        avoided = self.prototype_setup_s * max(0, self.teams_served - 1)
+        return {
+            "prototype_setup_ms": round(self.prototype_setup_s * 1000, 1),
+            "teams_served": self.teams_served,
+            "agents_built": self.agents_built,
+            "agents_reused": self.agents_reused,
+            "setup_avoided_ms": round(avoided * 1000, 1),
+        }
+
+
+class JobTeam:
+    """TeamRevify-compatible handle for one job, backed by the shared factory"""
+
+    def __init__(self, factory: TeamFactory, workspace: Optional[JobWorkspace] = None):
+        self._factory = factory
+        self.workspace = workspace
+        self._scraper_agent = None
+        self._scraper_lock = threading.Lock()
+
+    def manager_agent(self):
+        return self._factory.agent("manager_agent")
+
+    def feature_extractor(self):
+        return self._factory.agent("feature_extractor")
+
+    def review_analysis_agent(self):
+        return self._factory.agent("review_analysis_agent")
+
+    def chunk_summary_agent(self):
+        return self._factory.agent("chunk_summary_agent")
+
+    def review_scraper(self):
+        """Scraper agent whose tool writes into this job's workspace"""
+        with self._scraper_lock:
+            if self._scraper_agent is None:
+                agent = self._factory.prototype.review_scraper().copy()
+                agent.tools = [AmazonScraperTool(workspace=self.workspace)]
+                self._scraper_agent = agent
+            return self._scraper_agent
+
+    def amazon_scraper_tool(self) -> AmazonScraperTool:
+        return self.review_scraper().tools[0]
+
+    def extract_features_task(self) -> Task:
+        return self._factory.task("extract_features_task")
+
+    def comprehensive_review_analysis_task(self) -> Task:
+        return self._factory.task("comprehensive_review_analysis_task")
+
+    def analyze_feature_task(self, agent=None) -> Task:
+        return self._factory.task("analyze_feature_task", agent=agent)
+
+    def scrape_reviews_task(self) -> Task:
+        return self._factory.task("scrape_reviews_task", agent=self.review_scraper())
+
+    def compile_final_report_task(self) -> Task:
+        return self._factory.task("compile_final_report_task")
+
+
+def get_team_factory() -> TeamFactory:
+    global _factory
+    with _factory_lock:
+        if _factory is None:
+            _factory = TeamFactory()
+        return _factory
+
+
+def get_team(workspace: Optional[JobWorkspace] = None) -> JobTeam:
+    """Agents and tasks for one job, without rebuilding TeamRevify"""
+    return get_team_factory().team(workspace)
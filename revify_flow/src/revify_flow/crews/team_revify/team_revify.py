@@ -1,8 +1,9 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
+from typing import List, Optional
 from src.revify_flow.tools.amazon_scraper_tool import AmazonScraperTool
+from src.revify_flow.tools.job_workspace import JobWorkspace
 # from langchain.tools import tool
 from crewai.project import tool
 
@@ -14,9 +15,11 @@ from crewai.project import tool
 @CrewBase
 class TeamRevify():
     """TeamRevify crew for product review analysis"""
-    def __init__(self):
+    def __init__(self, workspace: Optional[JobWorkspace] = None):
         super().__init__()
-        self._scraper_tool = AmazonScraperTool()
+        # Where this job's scraper writes its files (None: working directory)
+        self.workspace = workspace
+        self._scraper_tool = AmazonScraperTool(workspace=workspace)
     
     agents: List[BaseAgent]
     tasks: List[Task]
@@ -69,6 +72,13 @@ class TeamRevify():
             config=self.tasks_config['comprehensive_review_analysis_task']
         )
     @task
+    def analyze_feature_task(self) -> Task:
+        """Task to analyze one feature on the review sentences retrieved for it"""
+        return Task(
+            config=self.tasks_config['analyze_feature_task']
+        )
+
+    @task
     def extract_features_task(self) -> Task:
         """Task to extract key product features"""
         return Task(
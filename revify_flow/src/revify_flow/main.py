@@ -13,8 +13,24 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 
 # Now use absolute import
 from src.revify_flow.crews.team_revify.team_revify import TeamRevify
+from src.revify_flow.crews.team_revify.team_factory import get_team
 
 from src.revify_flow.tools.amazon_scraper_tool import AmazonScraperTool
+from src.revify_flow.tools.review_store import get_review_store
+from src.revify_flow.tools.amazon_urls import product_key
+from src.revify_flow.tools.review_normalizer import normalize_reviews
+from src.revify_flow.tools.columnar_store import write_chunk_summaries, write_feature_analyses
+from src.revify_flow.tools.job_workspace import JobWorkspace, atomic_write_json
+from src.revify_flow.tools.results_catalog import get_results_catalog
+from src.revify_flow.tools.llm_throttle import llm_concurrency
+from src.revify_flow.tools.llm_cache import cached_kickoff, get_llm_cache
+from src.revify_flow.tools.chunk_planner import ChunkPacker, estimate_tokens, get_tokenizer, model_name, plan_chunks
+from src.revify_flow.tools.chunk_planner import token_budget as chunk_token_budget
+from src.revify_flow.tools.prompt_encoding import (
+    encode_reviews, get_prompt_savings, log_prompt_savings, prompt_savings, record_prompt_savings, review_line,
+)
+from src.revify_flow.tools.feature_retrieval import FeatureEvidenceIndex, format_evidence, log_evidence
+from src.revify_flow.tools.aspect_sentiment import AspectSentimentEngine, sentiment_counts_text, template_verdict
 
 # Load environment variables
 load_dotenv()
@@ -112,6 +128,14 @@ def extract_json_from_markdown(text: str) -> str:
     
     return text  # Return original if no patterns match
 
+def parses_as_json(raw: str) -> bool:
+    """True when the JSON extracted from an LLM response loads; only such responses are cached"""
+    try:
+        json.loads(extract_json_from_markdown(raw))
+    except (TypeError, ValueError):
+        return False
+    return True
+
 def review_analysis():
     print("\n🚀 Starting Dynamic Feature-Based Review Analysis\n")
     product_input = input("Enter the product name or URL: ")
@@ -137,7 +161,8 @@ def review_analysis():
         process=Process.sequential,
         verbose=True
     )
-    feature_result = feature_crew.kickoff(inputs={"product_input": product_input})
+    feature_result = cached_kickoff(feature_crew, label="feature extraction", inputs={"product_input": product_input},
+                                    validate=parses_as_json)
     feature_raw = feature_result.raw
     extracted_json = extract_json_from_markdown(feature_raw)
 
@@ -239,10 +264,10 @@ def review_analysis():
     )
 
     # Pass the dynamic content as inputs when kicking off the crew
-    result = analysis_crew.kickoff(inputs={
+    result = cached_kickoff(analysis_crew, label="feature analysis", inputs={
         "features": ", ".join(features),
-        "reviews": json.dumps(review_dicts, indent=2)
-    })
+        "reviews": encode_reviews(review_dicts)
+    }, validate=parses_as_json)
 
     # Extract and process the result
     try:
@@ -287,47 +312,339 @@ def review_analysis():
         print("Raw output saved to 'output/feature_analysis_raw.txt'")
         return None
 
-def estimate_tokens(text):
-    return len(text.split()) * 1.3  # crude estimate (avg word = 1.3 tokens)
-
 from crewai import Crew, Process, Task
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from functools import partial
 import math
+import threading
+
+def summarize_reviews_chunked(review_data, team, chunk_size=None, max_in_flight=None,
+                              token_budget=None, tokenizer=None):
+    """
+    Summarize reviews chunk by chunk, up to max_in_flight chunks at once.
 
-def summarize_reviews_chunked(review_data, team, chunk_size=500):
+    Chunks are packed up to the summary model's token budget (see
+    tools/chunk_planner.py); chunk_size optionally caps reviews per chunk.
+    max_in_flight defaults to REVIFY_LLM_CONCURRENCY. Every call goes through
+    the shared LLM rate limiter; summaries come back in chunk order.
+    """
     print(f"\n🔧 Chunking and summarizing {len(review_data)} reviews...")
     
-    review_chunks = [
-        review_data[i:i + chunk_size]
-        for i in range(0, len(review_data), chunk_size)
-    ]
-    summaries = []
-    team = TeamRevify()
     summarize_agent = team.chunk_summary_agent()  # you’ll define this in YAML
+    review_chunks, plan = plan_chunks(review_data, token_budget, tokenizer, model=model_name(summarize_agent),
+                                      max_reviews=chunk_size, render=review_line)
+    plan.log_summary()
     print(f"🧠 Loaded summary agent to handle {len(review_chunks)} chunks")
 
-    for i, chunk in enumerate(review_chunks):
-        print(f"\n📝 Summarizing chunk {i+1}/{len(review_chunks)}...")
-        task = Task(
-            description=(
-                "Summarize the following list of product reviews. Focus on overall tone, frequently mentioned features, "
-                "and any strong sentiments. This is just one chunk of many.\n\n"
-                f"Reviews:\n{chunk}"
-            ),
-            expected_output="A concise paragraph summarizing this chunk of reviews.",
-            agent=summarize_agent
-        )
+    with ChunkSummarizer(summarize_agent, max_in_flight) as summarizer:
+        for i, chunk in enumerate(review_chunks):
+            print(f"\n📝 Summarizing chunk {i+1}/{len(review_chunks)}...")
+            summarizer.submit(chunk)
+        summaries = summarizer.results()
 
-        crew = Crew(
-            agents=[summarize_agent],
-            tasks=[task],
-            process=Process.sequential,
-            verbose=True
-        )
+    print(f"\n✅ Done summarizing all chunks. Total summaries: {len(summaries)}")
+    return summaries
 
-        result = crew.kickoff()
-        summaries.append(result.raw)
+class ChunkSummarizer:
+    """
+    Bounded pool of chunk summarization calls.
 
-    print(f"\n✅ Done summarizing all chunks. Total summaries: {len(summaries)}")
+    Chunks are submitted as they become available and run on at most
+    max_in_flight threads. Each thread gets its own copy of the agent, since
+    a crewAI Agent keeps per-execution state. results() returns summaries in
+    submission order. summarize(agent, item, label) defaults to
+    summarize_chunk; reduce_summaries passes merge_summaries.
+    """
+
+    def __init__(self, summarize_agent, max_in_flight=None, summarize=None, label="chunk summary"):
+        self.summarize_agent = summarize_agent
+        self.summarize = summarize or summarize_chunk
+        self.label = label
+        self.max_in_flight = max_in_flight or llm_concurrency()
+        self._futures = []
+        self._local = threading.local()
+        self._pool = None
+        if self.max_in_flight > 1:
+            # Worker names extend the caller's, so job logs still capture them
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_in_flight,
+                thread_name_prefix=f"{threading.current_thread().name}/summarize",
+            )
+
+    def _agent(self):
+        if self._pool is None:
+            return self.summarize_agent
+        if not hasattr(self._local, "agent"):
+            self._local.agent = self.summarize_agent.copy()
+        return self._local.agent
+
+    def _summarize(self, index, chunk):
+        return self.summarize(self._agent(), chunk, label=f"{self.label} {index + 1}")
+
+    def submit(self, chunk):
+        index = len(self._futures)
+        if self._pool is None:
+            self._futures.append(self._summarize(index, chunk))
+        else:
+            # In the caller's context, so the call counts towards its job's prompt savings
+            self._futures.append(self._pool.submit(contextvars.copy_context().run, self._summarize, index, chunk))
+
+    def results(self):
+        if self._pool is None:
+            return list(self._futures)
+        return [future.result() for future in self._futures]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+def summarize_chunk(summarize_agent, chunk, label="chunk summary"):
+    """Summarize one chunk of review dicts with the chunk summary agent (cached by prompt content)"""
+    reviews_text = encode_reviews(chunk)
+    savings = prompt_savings(chunk, reviews_text)
+    log_prompt_savings(savings, "chunk prompt")
+    record_prompt_savings(savings)
+    task = Task(
+        description=(
+            "Summarize the following list of product reviews. Focus on overall tone, frequently mentioned features, "
+            "and any strong sentiments. This is just one chunk of many.\n\n"
+            "Reviews (one per line as id|rating|title|text, shared fields in the first line):\n"
+            f"{reviews_text}"
+        ),
+        expected_output="A concise paragraph summarizing this chunk of reviews.",
+        agent=summarize_agent
+    )
+
+    crew = Crew(
+        agents=[summarize_agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=True
+    )
+
+    result = cached_kickoff(crew, label=label, tokens=estimate_tokens(reviews_text))
+    return result.raw
+
+def merge_summaries(summarize_agent, summaries, label="summary merge"):
+    """Merge several chunk (or already merged) summaries into one"""
+    summaries_text = "\n\n".join(f"Summary {i}:\n{summary}" for i, summary in enumerate(summaries, start=1))
+    task = Task(
+        description=(
+            f"Merge the following {len(summaries)} summaries of product review chunks into one summary. "
+            "Keep every feature that is mentioned, say how often it comes up and whether opinions agree, "
+            "and keep strong sentiments and concrete complaints. Do not invent anything.\n\n"
+            f"{summaries_text}"
+        ),
+        expected_output="A concise summary covering everything in the input summaries.",
+        agent=summarize_agent
+    )
+
+    crew = Crew(
+        agents=[summarize_agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=True
+    )
+
+    result = cached_kickoff(crew, label=label, tokens=estimate_tokens(summaries_text))
+    return result.raw
+
+def _reduce_groups(summaries, tokens, fan_in, budget):
+    """Consecutive groups of up to fan_in summaries, each within budget (but always at least two)"""
+    groups, group, group_tokens = [], [], 0
+    for summary, count in zip(summaries, tokens):
+        if len(group) >= fan_in or (len(group) >= 2 and group_tokens + count > budget):
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(summary)
+        group_tokens += count
+    if group:
+        groups.append(group)
+    return groups
+
+def reduce_summaries(summaries, team, fan_in=None, token_budget=None, max_in_flight=None, tokenizer=None):
+    """
+    Tree-reduce chunk summaries until together they fit the analysis budget.
+
+    Each level merges groups of up to fan_in consecutive summaries (order is
+    kept), with the merges of a level running concurrently through
+    ChunkSummarizer. The number of levels, and so the latency, grows with the
+    log of the chunk count. Summaries that already fit are returned as they are.
+
+    fan_in defaults to REVIFY_REDUCE_FAN_IN (4); token_budget defaults to
+    REVIFY_REDUCE_TOKEN_BUDGET, else the summary model's chunk budget.
+    """
+    fan_in = fan_in or int(os.getenv("REVIFY_REDUCE_FAN_IN", 4))
+    if fan_in < 2:
+        raise ValueError(f"fan_in must be at least 2, got {fan_in}")
+    summarize_agent = team.chunk_summary_agent()
+    model = model_name(summarize_agent)
+    budget = token_budget or int(os.getenv("REVIFY_REDUCE_TOKEN_BUDGET", 0)) or chunk_token_budget(model)
+    tokenizer = tokenizer if callable(tokenizer) else get_tokenizer(tokenizer, model)
+
+    summaries = list(summaries)
+    tokens = [tokenizer(summary) for summary in summaries]
+    level = 0
+    while len(summaries) > 1 and sum(tokens) > budget:
+        level += 1
+        groups = _reduce_groups(summaries, tokens, fan_in, budget)
+        print(f"\n🌲 Reduce level {level}: merging {len(summaries)} summaries (~{sum(tokens)} tokens) "
+              f"into {len(groups)}...")
+        with ChunkSummarizer(summarize_agent, max_in_flight, summarize=merge_summaries,
+                             label=f"level {level} merge") as merger:
+            for group in groups:
+                if len(group) > 1:
+                    merger.submit(group)
+            merged = iter(merger.results())
+        summaries = [next(merged) if len(group) > 1 else group[0] for group in groups]
+        tokens = [tokenizer(summary) for summary in summaries]
+
+    print(f"🌲 Reduced to {len(summaries)} summaries (~{sum(tokens)} tokens, budget {budget}) "
+          f"in {level} levels with fan-in {fan_in}")
+    return summaries
+
+ANALYSIS_MODES = ("summaries", "evidence", "fast")
+
+def analysis_mode():
+    """
+    How the final analysis sees the reviews (REVIFY_ANALYSIS_MODE):
+
+    - summaries: chunk summaries, tree-reduced, in one call for all features (default)
+    - evidence: local sentiment counts, plus one verdict call per feature on
+      the review sentences retrieved for it
+    - fast: local sentiment counts and templated verdicts, no LLM calls
+    """
+    mode = os.getenv("REVIFY_ANALYSIS_MODE", "summaries").lower()
+    if mode not in ANALYSIS_MODES:
+        raise ValueError(f"Unknown REVIFY_ANALYSIS_MODE {mode!r}, expected one of {ANALYSIS_MODES}")
+    return mode
+
+def parse_verdict(raw):
+    """The "verdict" of a per-feature JSON answer (outermost braces, so nested objects survive), or None"""
+    start, end = raw.find("{"), raw.rfind("}")
+    try:
+        return json.loads(raw[start:end + 1]).get("verdict") if start != -1 else None
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+def analyze_feature(team, review_agent, feature_evidence, label="feature analysis"):
+    """Write the verdict for one feature from its evidence; sentiment and key points come from the local stats"""
+    feature, evidence, stats = feature_evidence
+    evidence_text = format_evidence(evidence)
+    crew = Crew(
+        agents=[review_agent],
+        tasks=[team.analyze_feature_task(agent=review_agent)],
+        process=Process.sequential,
+        verbose=True
+    )
+    result = cached_kickoff(crew, label=label, tokens=estimate_tokens(evidence_text), inputs={
+        "feature_name": feature,
+        "reviews": evidence_text,
+        "sentiment_counts": sentiment_counts_text(stats)
+    }, validate=parse_verdict)
+
+    raw = str(result.raw)
+    verdict = parse_verdict(raw)
+    if not verdict:
+        print(f"⚠️ Could not parse the verdict for '{feature}', keeping the raw text")
+        verdict = raw.strip()[:500] or template_verdict(stats)
+    return dict(stats, verdict=verdict)
+
+def analyze_features_by_evidence(review_dicts, features, team, max_in_flight=None, top_k=None, fast=False):
+    """
+    Analyze each feature on only the review sentences that mention it.
+
+    Sentiment distributions and key point counts are computed locally
+    (tools/aspect_sentiment.py). The LLM only writes each verdict, from the
+    sentences retrieved with BM25 (tools/feature_retrieval.py); the calls run
+    concurrently through ChunkSummarizer. With fast=True, or for features no
+    review mentions, the verdict is templated and no LLM is called.
+    Returns one analysis dict per feature, in feature order.
+    """
+    start = time.perf_counter()
+    engine = AspectSentimentEngine(review_dicts)
+    stats = {feature: engine.feature_stats(feature) for feature in features}
+    print(f"\n🧮 Scored {len(engine.sentences)} sentences from {len(review_dicts)} reviews for "
+          f"{len(features)} features locally in {time.perf_counter() - start:.2f}s")
+    if fast:
+        return [dict(stats[feature], verdict=template_verdict(stats[feature])) for feature in features]
+
+    index = FeatureEvidenceIndex(review_dicts, engine.synonyms)
+    print(f"🔎 Indexed {len(index)} sentences from {len(review_dicts)} reviews")
+
+    analyses = {}
+    submitted = []
+    evidence_tokens = 0
+    review_agent = team.review_analysis_agent()
+    with ChunkSummarizer(review_agent, max_in_flight, summarize=partial(analyze_feature, team),
+                         label="feature analysis") as analyzer:
+        for feature in features:
+            evidence = index.search(feature, top_k)
+            log_evidence(feature, evidence, len(review_dicts))
+            if not evidence:
+                analyses[feature] = dict(stats[feature], verdict=template_verdict(stats[feature]))
+                continue
+            evidence_tokens += estimate_tokens(format_evidence(evidence))
+            analyzer.submit((feature, evidence, stats[feature]))
+            submitted.append(feature)
+        analyses.update(zip(submitted, analyzer.results()))
+
+    full_tokens = estimate_tokens(encode_reviews(review_dicts)) if review_dicts else 0
+    print(f"🔎 {len(submitted)} verdict calls with ~{evidence_tokens} evidence tokens in total "
+          f"(all reviews would be ~{full_tokens} tokens per prompt)")
+    return [analyses[feature] for feature in features]
+
+def record_to_review_dict(record, product_name):
+    """ReviewRecord -> the review fields the analysis reads from scraped_reviews.csv"""
+    return {
+        'name': product_name,
+        'brand': 'Amazon',
+        'reviews.rating': record.rating,
+        'reviews.title': record.title,
+        'reviews.text': record.body,
+    }
+
+def summarize_reviews_streaming(review_batches, team, chunk_size=None, max_in_flight=None,
+                                token_budget=None, tokenizer=None):
+    """
+    Summarize reviews while they are still arriving.
+
+    review_batches is any iterable of review dict lists, e.g. pages from
+    AmazonScraperTool.iter_review_pages. A chunk is submitted as soon as it
+    reaches the token budget, so the LLM calls overlap with the scraping of
+    later pages and with each other (see summarize_reviews_chunked).
+    """
+    summarize_agent = team.chunk_summary_agent()
+    packer = ChunkPacker(token_budget, tokenizer, model=model_name(summarize_agent), max_reviews=chunk_size,
+                         render=review_line)
+    received = 0
+
+    with ChunkSummarizer(summarize_agent, max_in_flight) as summarizer:
+        for batch in review_batches:
+            received += len(batch)
+            for review in batch:
+                chunk = packer.add(review)
+                if chunk:
+                    print(f"\n📝 Summarizing chunk {len(packer.chunk_tokens)} ({len(chunk)} reviews, "
+                          f"~{packer.chunk_tokens[-1]} tokens; {received} received so far)...")
+                    summarizer.submit(chunk)
+
+        chunk = packer.flush()
+        if chunk:
+            print(f"\n📝 Summarizing final chunk {len(packer.chunk_tokens)} ({len(chunk)} reviews)...")
+            summarizer.submit(chunk)
+        summaries = summarizer.results()
+
+    packer.log_summary("📐 Streamed chunk plan")
+    print(f"\n✅ Done summarizing {received} streamed reviews. Total summaries: {len(summaries)}")
     return summaries
 
 
@@ -378,7 +695,8 @@ def review_analysis2():
                 verbose=True
             )
             
-            feature_result = feature_crew.kickoff(inputs={"product_input": product_input})
+            feature_result = cached_kickoff(feature_crew, label="feature extraction", inputs={"product_input": product_input},
+                                            validate=parses_as_json, bypass=attempt > 0)
             feature_raw = feature_result.raw
             break  # If successful, exit the retry loop
             
@@ -463,13 +781,13 @@ def review_analysis2():
             print(f"\n⚙️ Running comprehensive feature analysis (attempt {attempt+1}/{max_retries})...")
             
             chunk_summaries = summarize_reviews_chunked(review_dicts, team, chunk_size=200)
-            reviews_input = "\n\n".join(chunk_summaries)
+            reviews_input = "\n\n".join(reduce_summaries(chunk_summaries, team))
 
             # Pass the dynamic content as inputs when kicking off the crew
-            result = analysis_crew.kickoff(inputs={
+            result = cached_kickoff(analysis_crew, label="feature analysis", inputs={
                 "features": ", ".join(features),
                 "reviews": reviews_input  # Further limit reviews if needed
-            })
+            }, validate=parses_as_json, bypass=attempt > 0)
             
             analysis_result = result
             break  # Success, exit retry loop
@@ -630,7 +948,8 @@ def debug_run_workflow():
         )
         
         logger.info(f"Sending URL to feature extraction: {product_url}")
-        feature_result = feature_crew.kickoff(inputs={"product_input": product_url})
+        feature_result = cached_kickoff(feature_crew, label="feature extraction", inputs={"product_input": product_url},
+                                        validate=parses_as_json)
         feature_raw = feature_result.raw
         
         logger.info("Feature extraction completed")
@@ -755,8 +1074,18 @@ def run_workflow():
     product_url = input("Enter the product URL: ")
     product_name = input("Enter the product type (optional): ")
     
-    # Create TeamRevify instance
-    team = TeamRevify()
+    # Intermediate files go to a workspace of their own, kept only if the run fails
+    with JobWorkspace() as workspace:
+        analysis_results = _run_workflow(product_url, product_name, workspace)
+        if analysis_results is None:
+            workspace.close(succeeded=False)
+        get_llm_cache().log_summary()
+        get_prompt_savings().log_summary()
+        return analysis_results
+
+def _run_workflow(product_url, product_name, workspace):
+    # Agents and tasks from the shared TeamRevify
+    team = get_team(workspace)
     
     # 1. Extract product features
     print("\n📋 Phase 1: Extracting product features...")
@@ -776,7 +1105,8 @@ def run_workflow():
     for attempt in range(max_retries):
         try:
             print(f"\n⚙️ Running feature extraction (attempt {attempt+1}/{max_retries})...")
-            feature_result = feature_crew.kickoff(inputs={"product_input": product_url})
+            feature_result = cached_kickoff(feature_crew, label="feature extraction", inputs={"product_input": product_url},
+                                            validate=parses_as_json, bypass=attempt > 0)
             feature_raw = feature_result.raw
             break
         except RateLimitError as e:
@@ -865,9 +1195,9 @@ def run_workflow():
                 print("\n❌ Max retries reached for review scraping.")
                 return
     
-    # 3. Load and process reviews
+    # 3. Load this product's reviews from the review store
     try:
-        df = pd.read_csv("scraped_reviews.csv")
+        df = normalize_reviews(get_review_store().reviews_dataframe(product_key(product_url), limit=200))
         if df.empty:
             print("❌ No reviews found.")
             return
@@ -880,82 +1210,85 @@ def run_workflow():
         print(f"❌ Error loading reviews: {str(e)}")
         return
     
-    # 4. Summarize reviews in chunks
-    chunk_summaries = summarize_reviews_chunked(review_dicts, team, chunk_size=30)
-    reviews_input = "\n\n".join(chunk_summaries)
+    analysis_results = None
+    raw_output = None
+    mode = analysis_mode()
+    if mode != "summaries":
+        # 4. Count sentiment per feature locally, then write verdicts from each feature's matching reviews
+        print("\n📋 Phase 3: Analyzing each feature on its matching reviews...")
+        analysis_results = analyze_features_by_evidence(review_dicts, features, team, fast=mode == "fast")
+    else:
+        # 4. Summarize reviews in chunks
+        chunk_summaries = summarize_reviews_chunked(review_dicts, team)
+        write_chunk_summaries(product_key(product_url), chunk_summaries)
+        reviews_input = "\n\n".join(reduce_summaries(chunk_summaries, team))
     
-    # 5. Analyze reviews by feature
-    print("\n📋 Phase 3: Analyzing reviews by feature...")
-    review_agent = team.review_analysis_agent()
-    analysis_task = team.comprehensive_review_analysis_task()
+        # 5. Analyze reviews by feature
+        print("\n📋 Phase 3: Analyzing reviews by feature...")
+        review_agent = team.review_analysis_agent()
+        analysis_task = team.comprehensive_review_analysis_task()
     
-    analysis_crew = Crew(
-        agents=[review_agent],
-        tasks=[analysis_task],
-        process=Process.sequential,
-        verbose=True
-    )
+        analysis_crew = Crew(
+            agents=[review_agent],
+            tasks=[analysis_task],
+            process=Process.sequential,
+            verbose=True
+        )
     
-    max_retries = 3
-    analysis_result = None
+        max_retries = 3
+        analysis_result = None
     
-    for attempt in range(max_retries):
-        try:
-            if attempt > 0:
-                wait_time = min(60, (2 ** attempt) * 10)
-                print(f"\n⏳ Waiting {wait_time} seconds before attempt {attempt+1}...")
-                time.sleep(wait_time)
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    wait_time = min(60, (2 ** attempt) * 10)
+                    print(f"\n⏳ Waiting {wait_time} seconds before attempt {attempt+1}...")
+                    time.sleep(wait_time)
             
-            print(f"\n⚙️ Running comprehensive feature analysis (attempt {attempt+1}/{max_retries})...")
-            result = analysis_crew.kickoff(inputs={
-                "features": ", ".join(features),
-                "reviews": reviews_input
-            })
+                print(f"\n⚙️ Running comprehensive feature analysis (attempt {attempt+1}/{max_retries})...")
+                result = cached_kickoff(analysis_crew, label="feature analysis", inputs={
+                    "features": ", ".join(features),
+                    "reviews": reviews_input
+                }, validate=parses_as_json, bypass=attempt > 0)
             
-            analysis_result = result
-            break
-        except RateLimitError as e:
-            print(f"\n⚠️ Rate limit hit during review analysis (attempt {attempt+1}/{max_retries})")
-            if attempt < max_retries - 1:
-                print(f"Will retry soon...")
-            else:
-                print("\n❌ Max retries reached for review analysis.")
-                print(f"Error: {str(e)}")
-                return
-        except Exception as e:
-            print(f"\n❌ Unexpected error during review analysis: {str(e)}")
-            if attempt < max_retries - 1:
-                print("Will retry...")
-            else:
-                return
+                analysis_result = result
+                break
+            except RateLimitError as e:
+                print(f"\n⚠️ Rate limit hit during review analysis (attempt {attempt+1}/{max_retries})")
+                if attempt < max_retries - 1:
+                    print(f"Will retry soon...")
+                else:
+                    print("\n❌ Max retries reached for review analysis.")
+                    print(f"Error: {str(e)}")
+                    return
+            except Exception as e:
+                print(f"\n❌ Unexpected error during review analysis: {str(e)}")
+                if attempt < max_retries - 1:
+                    print("Will retry...")
+                else:
+                    return
     
-    if not analysis_result:
-        print("\n❌ Failed to complete review analysis.")
-        return
+        if not analysis_result:
+            print("\n❌ Failed to complete review analysis.")
+            return
         
     try:
-        # Get raw result
-        raw_output = analysis_result.raw
-        
-        # Extract JSON from markdown if needed
-        json_str = extract_json_from_markdown(raw_output)
-        
-        # Parse the JSON
-        analysis_results = json.loads(json_str)
+        if analysis_results is None:
+            # Get raw result
+            raw_output = analysis_result.raw
         
-        # Save the results
-        os.makedirs("output", exist_ok=True)
+            # Extract JSON from markdown if needed
+            json_str = extract_json_from_markdown(raw_output)
         
-        # Check if file already exists and increment the filename if necessary
-        base_filename = "output/feature_analysis.json"
-        filename = base_filename
-        counter = 1
-        while os.path.exists(filename):
-            filename = f"output/feature_analysis_{counter}.json"
-            counter += 1
+            # Parse the JSON
+            analysis_results = json.loads(json_str)
         
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(analysis_results, f, indent=2, ensure_ascii=False)
+        # Save the results; the job id makes the filename unique, the catalog indexes it
+        filename = f"output/feature_analysis_{workspace.job_id}.json"
+        atomic_write_json(filename, analysis_results)
+        write_feature_analyses(product_key(product_url), analysis_results, filename)
+        get_results_catalog().record(filename, analysis_results, product_key(product_url), product_name,
+                                     len(review_dicts), workspace.job_id)
         
         # Print summary
         print("\n✅ Analysis complete!")
@@ -970,7 +1303,7 @@ def run_workflow():
             print(f"\n{i+1}. {feature}: {sentiment}")
             print(f"   {verdict[:100]}..." if len(verdict) > 100 else f"   {verdict}")
         
-        print("\nDetailed results saved to 'output/feature_analysis.json'")
+        print(f"\nDetailed results saved to '{filename}'")
         return analysis_results
     
     except Exception as e:
@@ -978,10 +1311,9 @@ def run_workflow():
         print(f"Raw output: {raw_output}")
         
         # Still try to save the raw output for debugging
-        with open("output/feature_analysis_raw.txt", "w", encoding="utf-8") as f:
-            f.write(str(raw_output))
+        raw_path = workspace.write_text("feature_analysis_raw.txt", str(raw_output))
         
-        print("Raw output saved to 'output/feature_analysis_raw.txt'")
+        print(f"Raw output saved to '{raw_path}'")
         return None
 
 if __name__ == "__main__":
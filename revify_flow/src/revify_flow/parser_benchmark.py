@@ -0,0 +1,143 @@
+"""
+Benchmark the review page parser backends against a captured Amazon page.
+
+Replays a saved review page (``amazon_reviews_page.txt`` by default) through
+every installed parser backend and reports throughput (pages/sec) and peak
+memory. The legacy full-document BeautifulSoup + three find_all scans is
+included as a baseline.
+
+Usage:
+    python parser_benchmark.py [--page PATH] [--iterations N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from bs4 import BeautifulSoup
+from src.revify_flow.tools.review_parser import PARSER_BACKENDS, available_backends
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    # Not available on Windows; peak RSS is skipped there
+    RESOURCE_AVAILABLE = False
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PAGE = os.path.abspath(os.path.join(SCRIPT_DIR, "../../..", "amazon_reviews_page.txt"))
+
+LEGACY_BACKEND = "legacy (full soup)"
+
+
+def legacy_parse(html):
+    """The original per-page extraction from AmazonScraperTool"""
+    soup = BeautifulSoup(html, "html.parser")
+    titles = soup.find_all("a", {"data-hook": "review-title"})
+    bodies = soup.find_all("span", {"data-hook": "review-body"})
+    stars = soup.find_all("span", class_="a-icon-alt")
+    return [
+        (titles[i].text.strip(), bodies[i].text.strip(), stars[i].text.strip() if i < len(stars) else "")
+        for i in range(min(len(titles), len(bodies)))
+    ]
+
+
+def get_parse_fn(backend):
+    if backend == LEGACY_BACKEND:
+        return legacy_parse
+    parser_cls, _ = PARSER_BACKENDS[backend]
+    return parser_cls().parse
+
+
+def _max_rss_kb():
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return usage / 1024 if sys.platform == "darwin" else usage
+
+
+def benchmark_backend(backend, html, iterations):
+    """Time one backend and measure its memory footprint"""
+    parse = get_parse_fn(backend)
+    result = parse(html)  # Warm-up (imports, caches)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(html)
+    elapsed = time.perf_counter() - start
+
+    # Python-heap peak for a single parse
+    tracemalloc.start()
+    parse(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "backend": backend,
+        "reviews": len(result),
+        "pages_per_sec": iterations / elapsed,
+        "ms_per_page": elapsed / iterations * 1000,
+        "py_heap_peak_mb": peak / (1024 * 1024),
+    }
+
+
+def _rss_worker(backend, html, iterations, queue):
+    """Run a backend in a fresh process so its RSS growth is isolated"""
+    baseline = _max_rss_kb()
+    parse = get_parse_fn(backend)
+    for _ in range(iterations):
+        parse(html)
+    queue.put((_max_rss_kb() - baseline) / 1024)
+
+
+def measure_peak_rss(backend, html, iterations):
+    """Peak resident memory growth in MB (includes C-level allocations)"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_rss_worker, args=(backend, html, iterations, queue))
+    proc.start()
+    proc.join()
+    return queue.get() if not queue.empty() else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark review page parser backends")
+    parser.add_argument("--page", default=DEFAULT_PAGE, help="Captured review page to replay")
+    parser.add_argument("--iterations", type=int, default=20, help="Parses per backend")
+    args = parser.parse_args()
+
+    with open(args.page, "r", encoding="utf-8") as f:
+        html = f.read()
+
+    print(f"📄 Replaying {args.page} ({len(html) / 1024:.0f} KB), {args.iterations} iterations per backend")
+
+    backends = [LEGACY_BACKEND] + available_backends()
+    results = []
+    for backend in backends:
+        print(f"⏱️ Benchmarking {backend}...")
+        row = benchmark_backend(backend, html, args.iterations)
+        row["peak_rss_mb"] = measure_peak_rss(backend, html, min(args.iterations, 5))
+        results.append(row)
+
+    print("\n=== Parser Benchmark ===")
+    print(f"{'backend':<20} {'reviews':>7} {'pages/s':>9} {'ms/page':>9} {'py peak MB':>11} {'RSS MB':>8}")
+    for row in results:
+        rss = f"{row['peak_rss_mb']:.1f}" if row["peak_rss_mb"] is not None else "n/a"
+        print(
+            f"{row['backend']:<20} {row['reviews']:>7} {row['pages_per_sec']:>9.1f} "
+            f"{row['ms_per_page']:>9.2f} {row['py_heap_peak_mb']:>11.2f} {rss:>8}"
+        )
+
+    baseline = results[0]["ms_per_page"]
+    fastest = min(results[1:], key=lambda r: r["ms_per_page"])
+    print(f"\n🚀 Fastest: {fastest['backend']} ({baseline / fastest['ms_per_page']:.1f}x vs legacy)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measure the non-browser cost of the scraping pipeline with offline replay.
+
+Runs AmazonScraperTool in replay mode over captured review pages (a single
+file or a directory, e.g. the page archive) and times the extraction and
+``_save_to_csv`` persistence phases separately, plus the end-to-end ``_run``.
+Everything happens inside a temporary directory, so the real
+scraped_reviews.csv is never touched.
+
+Usage:
+    python replay_benchmark.py [--pages PATH] [--target-reviews N] [--runs N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.revify_flow.tools.amazon_scraper_tool import AmazonScraperTool
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PAGES = os.path.abspath(os.path.join(SCRIPT_DIR, "../../..", "amazon_reviews_page.txt"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper extraction and persistence offline")
+    parser.add_argument("--pages", default=DEFAULT_PAGES, help="Captured page file or directory")
+    parser.add_argument("--target-reviews", type=int, default=200, help="Reviews requested per run")
+    parser.add_argument("--runs", type=int, default=10, help="Number of timed runs")
+    args = parser.parse_args()
+
+    tool = AmazonScraperTool(replay_dir=os.path.abspath(args.pages))
+    print(f"📄 Replaying {args.pages} with parser backend: {tool._parser.name}")
+
+    extract_times, save_times, run_times = [], [], []
+    review_count = 0
+    original_dir = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                records = tool._perform_replay(args.target_reviews)
+                extract_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                tool._save_to_csv(records, "Replay Benchmark")
+                save_times.append(time.perf_counter() - start)
+                review_count = len(records)
+
+                start = time.perf_counter()
+                tool._run(url="replay", target_reviews=args.target_reviews, product_name="Replay Benchmark")
+                run_times.append(time.perf_counter() - start)
+        finally:
+            os.chdir(original_dir)
+
+    def avg_ms(times):
+        return sum(times) / len(times) * 1000
+
+    print("\n=== Replay Benchmark ===")
+    print(f"Reviews per run:     {review_count}")
+    print(f"Extraction:          {avg_ms(extract_times):8.2f} ms/run ({review_count / (sum(extract_times) / args.runs):,.0f} reviews/s)")
+    print(f"Persistence (CSV):   {avg_ms(save_times):8.2f} ms/run ({review_count / (sum(save_times) / args.runs):,.0f} reviews/s)")
+    print(f"End-to-end _run:     {avg_ms(run_times):8.2f} ms/run")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ import sys
 # Get the directory of the script
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+sys.path.insert(0, os.path.abspath(os.path.join(SCRIPT_DIR, "../..")))
+from src.revify_flow.tools.results_catalog import get_results_catalog, verdict_summary
+
 # Use relative paths from the script location
 INPUT_DIR = os.path.join(SCRIPT_DIR, "output")  # Changed from "/output" to "output"
 OUTPUT_FILE = os.path.join(SCRIPT_DIR, "product_summaries.json")
@@ -13,29 +16,21 @@ def generate_summary(feature_analysis):
     """
     Converts a list of feature-wise verdicts into a coherent single-paragraph summary.
     """
-    paragraph_parts = []
-    for i, item in enumerate(feature_analysis):
-        verdict = item.get("verdict", "").strip()
-        if verdict:
-            if i == 0:
-                paragraph_parts.append(verdict)
-            else:
-                paragraph_parts.append(verdict[0].upper() + verdict[1:])
-    return ' '.join(paragraph_parts)
+    return verdict_summary(feature_analysis)
 
 def main():
-    summaries = {}
-
-    for filename in os.listdir(INPUT_DIR):
-        if filename.endswith(".json"):
-            file_path = os.path.join(INPUT_DIR, filename)
-            with open(file_path, "r") as f:
-                try:
-                    feature_data = json.load(f)
-                    summary = generate_summary(feature_data)
-                    summaries[filename] = summary
-                except Exception as e:
-                    print(f"Error processing {filename}: {e}")
+    catalog = get_results_catalog()
+
+    # Analyses saved before the results catalog existed: the columnar copies
+    # first, then any JSON files that have none
+    if "--import-legacy" in sys.argv or not catalog.known_paths():
+        imported = catalog.import_columnar()
+        print(f"🗂️ Cataloged {imported} analyses from the columnar dataset")
+        imported = catalog.import_directory(INPUT_DIR)
+        print(f"🗂️ Cataloged {imported} analysis files from {INPUT_DIR}")
+
+    # Summaries are computed when each analysis is saved, so no file is opened here
+    summaries = catalog.summaries()
 
     # Save all summaries to a single output file
     with open(OUTPUT_FILE, "w") as out_file:
@@ -0,0 +1,70 @@
+"""
+Measure the per-job agent setup overhead removed by the shared team factory.
+
+A job used to build a TeamRevify for the job itself, for feature extraction,
+for the scraper and again inside summarize_reviews_chunked. This times that
+pattern against get_team() handles, which reuse one prototype TeamRevify
+and copy agents per thread. No LLM calls are made.
+
+Usage:
+    python team_setup_benchmark.py [--jobs N] [--teams-per-job N]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.revify_flow.crews.team_revify.team_revify import TeamRevify
+from src.revify_flow.crews.team_revify.team_factory import get_team, get_team_factory
+
+
+def run_job(make_team, teams_per_job):
+    """The setup a job does before its first LLM call"""
+    for _ in range(teams_per_job):
+        team = make_team()
+        team.feature_extractor()
+        team.chunk_summary_agent()
+        team.review_analysis_agent()
+        team.extract_features_task()
+        team.comprehensive_review_analysis_task()
+
+
+def time_jobs(make_team, jobs, teams_per_job):
+    times = []
+    # TeamRevify prints credential warnings on every build
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(jobs):
+            start = time.perf_counter()
+            run_job(make_team, teams_per_job)
+            times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-job TeamRevify setup")
+    parser.add_argument("--jobs", type=int, default=20, help="Number of simulated jobs")
+    parser.add_argument("--teams-per-job", type=int, default=4, help="TeamRevify builds per job before the factory")
+    args = parser.parse_args()
+
+    rebuilt = time_jobs(TeamRevify, args.jobs, args.teams_per_job)
+    shared = time_jobs(get_team, args.jobs, args.teams_per_job)
+
+    def avg_ms(times):
+        return sum(times) / len(times) * 1000
+
+    print("\n=== Team Setup Benchmark ===")
+    print(f"Jobs:                     {args.jobs} ({args.teams_per_job} teams per job)")
+    print(f"TeamRevify per call:      {avg_ms(rebuilt):8.2f} ms/job")
+    print(f"Shared factory:           {avg_ms(shared):8.2f} ms/job (first job {shared[0] * 1000:.2f} ms)")
+    print(f"Setup removed:            {avg_ms(rebuilt) - avg_ms(shared):8.2f} ms/job")
+    print(f"Factory stats:            {get_team_factory().overhead_summary()}")
+
+
+if __name__ == "__main__":
+    main()
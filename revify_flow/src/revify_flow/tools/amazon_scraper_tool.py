@@ -424,7 +424,7 @@
 
 # Version 4: Enhanced with undetected_chromedriver
 
-from typing import ClassVar, Optional, Dict, Any, Type
+from typing import ClassVar, Optional, Dict, Any, Type, Iterator, List
 from pydantic import BaseModel, Field, PrivateAttr
 from crewai.tools import BaseTool
 import undetected_chromedriver as uc
@@ -433,7 +433,6 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from bs4 import BeautifulSoup
 import time
 import os
 import random
@@ -443,6 +442,25 @@ import re
 from dotenv import load_dotenv
 import logging
 import sys
+import threading
+from queue import Queue
+from src.revify_flow.tools.review_parser import get_review_parser, has_next_page, parse_rating_histogram
+from src.revify_flow.tools.review_http_client import ReviewHttpSession, ReviewFetchError
+from src.revify_flow.tools.amazon_urls import (
+    extract_asin, base_url, build_review_url, plan_review_pages, product_key,
+    MAX_PAGES_PER_FILTER, REVIEWS_PER_PAGE,
+)
+from src.revify_flow.tools.driver_pool import get_driver_pool, quit_driver
+from src.revify_flow.tools.session_store import get_session_store, is_signed_in
+from src.revify_flow.tools.page_archive import get_page_archive, read_archived_page
+from src.revify_flow.tools.page_readiness import PageWaitMetrics, wait_for_reviews, click_next_and_wait
+from src.revify_flow.tools.tab_fetcher import fetch_pages_in_tabs, page_concurrency
+from src.revify_flow.tools.review_store import get_review_store, reviews_before_known, stable_review_id
+from src.revify_flow.tools.scrape_cache import get_fresh_crawl
+from src.revify_flow.tools.review_normalizer import normalize_reviews
+from src.revify_flow.tools.review_record import ReviewRecord
+from src.revify_flow.tools.columnar_store import write_reviews
+from src.revify_flow.tools.job_workspace import JobWorkspace, atomic_write_csv
 
 # Suppress the ChromeDriver cleanup warnings
 warnings.filterwarnings("ignore", category=ResourceWarning)
@@ -469,6 +487,10 @@ class AmazonScraperSchema(BaseModel):
         default=None,
         description="Optional name to use for the product (default: extracted from page)"
     )
+    incremental: Optional[bool] = Field(
+        default=None,
+        description="Only fetch reviews newer than the last crawl of this product (default: REVIFY_INCREMENTAL)"
+    )
 
 class AmazonScraperTool(BaseTool):
     """Tool that scrapes customer reviews from Amazon product pages"""
@@ -480,16 +502,58 @@ class AmazonScraperTool(BaseTool):
     # Use class variables to store credentials
     _username: str = PrivateAttr()
     _password: str = PrivateAttr()
-
-    def __init__(self):
+    _parser: Any = PrivateAttr()
+    _page_archive: Any = PrivateAttr()
+    _replay_dir: Optional[str] = PrivateAttr(default=None)
+    _fetch_mode: str = PrivateAttr(default="browser")
+    _session_store: Any = PrivateAttr(default=None)
+    _workspace: Optional[JobWorkspace] = PrivateAttr(default=None)
+
+    # Captured page formats accepted by replay mode
+    REPLAY_EXTENSIONS: ClassVar[tuple] = (".html", ".htm", ".txt", ".html.gz")
+
+    # ReviewRecord field -> scraped_reviews.csv column
+    CSV_COLUMNS: ClassVar[dict] = {
+        "review_id": "reviews.id",
+        "title": "reviews.title",
+        "body": "reviews.text",
+        "rating": "reviews.rating",
+        "date": "reviews.date",
+        "verified": "reviews.didPurchase",
+        "helpful_votes": "reviews.numHelpful",
+    }
+
+    def __init__(self, replay_dir: Optional[str] = None, workspace: Optional[JobWorkspace] = None):
         # First initialize the parent class
         super().__init__()
 
+        # Job-scoped directory for the CSV export; None keeps the working directory
+        self._workspace = workspace
+
+        # Offline replay of captured pages instead of a live browser
+        self._replay_dir = replay_dir or os.getenv("REVIFY_REPLAY_DIR")
+        if self._replay_dir:
+            logger.info(f"Replay mode: reading review pages from {self._replay_dir}")
+
+        # "http" fetches review pages over a cookie-seeded session after login
+        self._fetch_mode = os.getenv("REVIFY_FETCH_MODE", "browser").lower()
+
+        # Pick the fastest available HTML parser backend
+        self._parser = get_review_parser()
+        logger.info(f"Using review parser backend: {self._parser.name}")
+
+        # Raw page captures are opt-in (REVIFY_PAGE_ARCHIVE_DIR)
+        self._page_archive = get_page_archive()
+
         # Load environment variables
         load_dotenv()
         self._username = os.getenv('NUMBER')
         self._password = os.getenv('PASSWORD')
 
+        # Saved logins are keyed by account, so they need the username
+        if self._username:
+            self._session_store = get_session_store(self._username)
+
         # Check if credentials are available
         if not self._username or not self._password:
             logger.error("Missing credentials in .env file")
@@ -505,7 +569,39 @@ class AmazonScraperTool(BaseTool):
         """Short randomized delay to mimic human-like timing."""
         time.sleep(random.uniform(a, b))
     
-    def _run(self, url: str, target_reviews: int, product_name: Optional[str] = None) -> str:
+    def _cached_reviews(self, url: str, target_reviews: int):
+        """(records, crawl metadata) from a fresh previous crawl of this product, else None"""
+        if self._replay_dir:
+            return None
+        crawl = get_fresh_crawl(url, target_reviews)
+        if crawl is None:
+            return None
+        records = get_review_store().get_reviews(crawl["product_key"], limit=target_reviews)
+        print(f"⚡ Using {len(records)} cached reviews crawled {crawl['age_seconds'] / 60:.0f} minutes ago")
+        return records, crawl
+
+    def _incremental_ids(self, url: str, incremental: Optional[bool]):
+        """
+        Review ids already stored for this product when an incremental crawl applies.
+
+        Returns None for a full scrape: incremental mode off, replaying, or a
+        product that has never been crawled.
+        """
+        if incremental is None:
+            incremental = os.getenv("REVIFY_INCREMENTAL", "0").lower() in ("1", "true", "yes", "on")
+        if not incremental or self._replay_dir:
+            return None
+
+        known_ids = get_review_store().review_ids(product_key(url))
+        if not known_ids:
+            logger.info("No previous crawl stored for this product, doing a full scrape")
+            return None
+        logger.info(f"Incremental crawl: {len(known_ids)} reviews already stored")
+        print(f"🔁 Incremental crawl: {len(known_ids)} reviews already stored, fetching newer ones only")
+        return known_ids
+
+    def _run(self, url: str, target_reviews: int, product_name: Optional[str] = None,
+             incremental: Optional[bool] = None) -> str:
         """Run the tool with the given inputs."""
         print(f"DEBUG: Received URL to scrape: {url}")
     
@@ -513,10 +609,6 @@ class AmazonScraperTool(BaseTool):
         if "amazon.in" in url:
             print("Using Indian Amazon domain (amazon.in)")
         
-        # Check for credentials
-        if not self._username or not self._password:
-            return "Error: Missing Amazon credentials in .env file"
-        
         # Preserve the original URL - ensure we're not modifying it
         original_url = url
         logger.info(f"Starting to scrape {target_reviews} reviews from: {original_url}")
@@ -528,169 +620,240 @@ class AmazonScraperTool(BaseTool):
         
         # Set up the driver and scrape reviews
         try:
-            reviews_titles, reviews_texts, ratings = self._perform_scraping(url, target_reviews)
+            # Recently crawled products are served straight from the review store
+            cached = self._cached_reviews(url, target_reviews)
+            if cached is not None:
+                records, crawl = cached
+                csv_path = self._save_to_csv(records, product_name or crawl["product_name"] or "Amazon Product")
+                return (f"Using {len(records)} cached reviews crawled {crawl['age_seconds'] / 60:.0f} minutes ago. "
+                        f"Data saved to {csv_path} and the review store")
+
+            # Check for credentials (not needed when replaying captured pages)
+            if not self._replay_dir and (not self._username or not self._password):
+                return "Error: Missing Amazon credentials in .env file"
+
+            known_ids = self._incremental_ids(url, incremental)
+            if self._replay_dir:
+                records = self._perform_replay(target_reviews)
+            else:
+                records = self._perform_scraping(url, target_reviews, known_ids=known_ids)
             
             # Save to CSV
             if not product_name:
                 product_name = "Amazon Product"  # Default name if not provided
                 
-            csv_path = self._save_to_csv(reviews_titles, reviews_texts, ratings, product_name)
+            csv_path = self._persist(records, url, product_name, target_reviews, incremental=bool(known_ids))
             
-            return f"Successfully scraped {len(reviews_texts)} reviews. Data saved to {csv_path}"
+            if known_ids:
+                return f"Fetched {len(records)} new reviews since the last crawl. Data saved to {csv_path} and the review store"
+            return f"Successfully scraped {len(records)} reviews. Data saved to {csv_path} and the review store"
         
         except Exception as e:
             error_msg = f"Error during scraping: {str(e)}"
             logger.error(error_msg, exc_info=True)
             return error_msg
 
-    def _perform_scraping(self, url: str, target_reviews):
-        """Internal method to handle the actual scraping logic with undetected_chromedriver"""
-        driver = self._setup_driver()
-        review_titles = []
+    def iter_review_pages(self, url: str, target_reviews: int, product_name: Optional[str] = None,
+                          incremental: Optional[bool] = None) -> Iterator[List[Any]]:
+        """
+        Yield the reviews of each page as soon as it is parsed.
+
+        Scraping runs in a worker thread, so the caller can start processing the
+        first pages, e.g. summarizing full chunks, while later pages are still
+        loading. scraped_reviews.csv is written once scraping finishes, as with
+        ``_run``. Errors from the worker are re-raised here.
+
+        In incremental mode the new reviews are yielded first, followed by the
+        stored ones, up to ``target_reviews``.
+        """
+        cached = self._cached_reviews(url, target_reviews)
+        if cached is not None:
+            records, crawl = cached
+            self._save_to_csv(records, product_name or crawl["product_name"] or "Amazon Product")
+            yield records
+            return
+
+        if not self._replay_dir and (not self._username or not self._password):
+            raise RuntimeError("Missing Amazon credentials in .env file")
+        known_ids = self._incremental_ids(url, incremental)
+
+        pages = Queue()
+        done = object()
+        outcome = {}
+
+        def worker():
+            try:
+                if self._replay_dir:
+                    outcome['records'] = self._perform_replay(target_reviews, on_page=pages.put)
+                else:
+                    outcome['records'] = self._perform_scraping(url, target_reviews, on_page=pages.put,
+                                                                known_ids=known_ids)
+            except Exception as e:
+                outcome['error'] = e
+            finally:
+                pages.put(done)
+
+        # Named after the calling thread so its logs stay with the caller's job
+        threading.Thread(target=worker, name=f"{threading.current_thread().name}/review-scraper",
+                         daemon=True).start()
+
+        # Count records for the cap; ids (keyed like the store) only dedup the backfill
+        yielded, yielded_ids = 0, set()
+        while True:
+            page = pages.get()
+            if page is done:
+                break
+            page = page[:target_reviews - yielded]
+            if page:
+                yielded += len(page)
+                yielded_ids.update(stable_review_id(r) for r in page)
+                yield page
+
+        if 'error' in outcome:
+            raise outcome['error']
+        self._persist(outcome['records'], url, product_name or "Amazon Product",
+                      target_reviews, incremental=bool(known_ids))
+
+        if known_ids and yielded < target_reviews:
+            backfill = [r for r in get_review_store().get_reviews(product_key(url), limit=target_reviews)
+                        if stable_review_id(r) not in yielded_ids]
+            if backfill:
+                yield backfill[:target_reviews - yielded]
+
+    def _perform_scraping(self, url: str, target_reviews, on_page=None, known_ids=None):
+        """
+        Internal method to handle the actual scraping logic with undetected_chromedriver.
+
+        With ``known_ids`` only reviews newer than the last crawl are collected.
+        """
+        pool = get_driver_pool(self._setup_driver)
         reviews = []
-        ratings = []
-
+        healthy = True
+        driver = pool.acquire() if pool else self._setup_driver()
         try:
             logger.info(f"Opening URL: {url}")
             print(f"Opening URL: {url}")
             driver.get(url)
 
+            # Reuse a saved login instead of repeating the sign-in flow
+            session_restored = False
+            if self._session_store and not is_signed_in(driver):
+                session_restored = self._session_store.restore(driver)
+                if session_restored:
+                    driver.refresh()
+
             # ---------------- OPEN REVIEWS PAGE ---------------- #
             WebDriverWait(driver, 20).until(
                 EC.element_to_be_clickable((By.XPATH, '//*[@id="reviews-medley-footer"]/div[2]/a'))
             ).click()
 
-            # ---------------- LOGIN SECTION ---------------- #
-            try:
-                try:
-                    email_input = WebDriverWait(driver, 20).until(
-                        EC.presence_of_element_located((By.ID, "ap_email"))
-                    )
-                except:
-                    email_input = WebDriverWait(driver, 20).until(
-                        EC.presence_of_element_located((By.ID, "ap_email_login"))
-                    )
-
-                logger.info(f"Logging in as: {self._username}")
-                print(f"Logging in as: {self._username}")
-                email_input.send_keys(self._username)
-                self._random_sleep()
-
-                continue_button = WebDriverWait(driver, 20).until(
-                    EC.element_to_be_clickable((By.ID, "continue"))
-                )
-                continue_button.click()
-
-                password_input = WebDriverWait(driver, 20).until(
-                    EC.presence_of_element_located((By.ID, "ap_password"))
-                )
-                password_input.send_keys(self._password)
-                self._random_sleep()
-
-                sign_in_button = WebDriverWait(driver, 20).until(
-                    EC.element_to_be_clickable((By.ID, "signInSubmit"))
-                )
-                sign_in_button.click()
+            # A warm pooled driver may still be signed in; only log in when Amazon asks
+            if self._needs_login(driver):
+                if session_restored:
+                    logger.info("Saved session was rejected, performing full login")
+                    print("⚠️ Saved session expired, performing full login")
+                    self._session_store.invalidate(driver.current_url)
 
-                # Wait for login to complete or timeout safely
-                login_ok = False
+                # ---------------- LOGIN SECTION ---------------- #
                 try:
-                    WebDriverWait(driver, 10).until(
-                        EC.any_of(
-                            EC.url_contains("/youraccount"),
-                            EC.presence_of_element_located((By.ID, "nav-link-accountList"))
+                    try:
+                        email_input = WebDriverWait(driver, 20).until(
+                            EC.presence_of_element_located((By.ID, "ap_email"))
+                        )
+                    except:
+                        email_input = WebDriverWait(driver, 20).until(
+                            EC.presence_of_element_located((By.ID, "ap_email_login"))
                         )
-                    )
-                    login_ok = True
-                except TimeoutException:
-                    login_ok = False
 
-                # Detect possible CAPTCHA / 2FA page
-                page_text = driver.page_source.lower()
-                if any(keyword in page_text for keyword in ["captcha", "type the characters", "auth-mfa"]):
-                    logger.info("⚠️ Detected CAPTCHA or 2FA challenge.")
-                    print("⚠️ Detected CAPTCHA or 2FA challenge.")
-                    input("Please complete it manually in the browser, then press Enter to continue...")
+                    logger.info(f"Logging in as: {self._username}")
+                    print(f"Logging in as: {self._username}")
+                    email_input.send_keys(self._username)
+                    self._random_sleep()
 
-                elif not login_ok:
-                    logger.warning("⚠️ Login not confirmed, continuing anyway...")
-                    print("⚠️ Login not confirmed, continuing anyway...")
+                    continue_button = WebDriverWait(driver, 20).until(
+                        EC.element_to_be_clickable((By.ID, "continue"))
+                    )
+                    continue_button.click()
 
-            except Exception as e:
-                logger.warning(f"⚠️ Login flow skipped or failed: {e}")
-                print(f"⚠️ Login flow skipped or failed: {e}")
+                    password_input = WebDriverWait(driver, 20).until(
+                        EC.presence_of_element_located((By.ID, "ap_password"))
+                    )
+                    password_input.send_keys(self._password)
+                    self._random_sleep()
 
-            # ---------------- POST-LOGIN NAVIGATION ---------------- #
-            logger.info("Navigating to target URL...")
-            print("Navigating to target URL...")
-            try:
+                    sign_in_button = WebDriverWait(driver, 20).until(
+                        EC.element_to_be_clickable((By.ID, "signInSubmit"))
+                    )
+                    sign_in_button.click()
+
+                    # Wait for login to complete or timeout safely
+                    login_ok = False
+                    try:
+                        WebDriverWait(driver, 10).until(
+                            EC.any_of(
+                                EC.url_contains("/youraccount"),
+                                EC.presence_of_element_located((By.ID, "nav-link-accountList"))
+                            )
+                        )
+                        login_ok = True
+                    except TimeoutException:
+                        login_ok = False
+
+                    # Detect possible CAPTCHA / 2FA page
+                    page_text = driver.page_source.lower()
+                    if any(keyword in page_text for keyword in ["captcha", "type the characters", "auth-mfa"]):
+                        logger.info("⚠️ Detected CAPTCHA or 2FA challenge.")
+                        print("⚠️ Detected CAPTCHA or 2FA challenge.")
+                        input("Please complete it manually in the browser, then press Enter to continue...")
+
+                    elif not login_ok:
+                        logger.warning("⚠️ Login not confirmed, continuing anyway...")
+                        print("⚠️ Login not confirmed, continuing anyway...")
+
+                    # Remember the session so the next run can skip this flow
+                    if self._session_store and (login_ok or is_signed_in(driver)):
+                        self._session_store.save(driver)
+
+                except Exception as e:
+                    logger.warning(f"⚠️ Login flow skipped or failed: {e}")
+                    print(f"⚠️ Login flow skipped or failed: {e}")
+
+                # ---------------- POST-LOGIN NAVIGATION ---------------- #
+                logger.info("Navigating to target URL...")
+                print("Navigating to target URL...")
                 try:
-                    driver.get(url)
-                except TimeoutException:
-                    logger.warning("Timeout on driver.get(); using JS fallback navigation.")
-                    print("Timeout on driver.get(); using JS fallback navigation.")
+                    try:
+                        driver.get(url)
+                    except TimeoutException:
+                        logger.warning("Timeout on driver.get(); using JS fallback navigation.")
+                        print("Timeout on driver.get(); using JS fallback navigation.")
+                        driver.execute_script("window.location.href = arguments[0];", url)
+                        time.sleep(2)
+                except Exception as e:
+                    logger.error(f"Navigation error: {e}")
+                    print(f"Navigation error: {e}")
                     driver.execute_script("window.location.href = arguments[0];", url)
                     time.sleep(2)
-            except Exception as e:
-                logger.error(f"Navigation error: {e}")
-                print(f"Navigation error: {e}")
-                driver.execute_script("window.location.href = arguments[0];", url)
-                time.sleep(2)
 
-            # Click reviews again after login
-            try:
-                WebDriverWait(driver, 20).until(
-                    EC.element_to_be_clickable((By.XPATH, '//*[@id="reviews-medley-footer"]/div[2]/a'))
-                ).click()
-            except Exception as e:
-                logger.warning(f"⚠️ Couldn't click reviews link after login: {e}")
-                print(f"⚠️ Couldn't click reviews link after login: {e}")
+                # Click reviews again after login
+                try:
+                    WebDriverWait(driver, 20).until(
+                        EC.element_to_be_clickable((By.XPATH, '//*[@id="reviews-medley-footer"]/div[2]/a'))
+                    ).click()
+                except Exception as e:
+                    logger.warning(f"⚠️ Couldn't click reviews link after login: {e}")
+                    print(f"⚠️ Couldn't click reviews link after login: {e}")
 
             # ---------------- SCRAPING SECTION ---------------- #
-            pages_to_scrape = target_reviews // 10 + 1  # Approximate pages needed (10 reviews per page)
-            for page_num in range(pages_to_scrape):
-                self._random_sleep(1, 2)
-
-                soup = BeautifulSoup(driver.page_source, "html.parser")
-                with open("amazon_reviews_page.txt", "w", encoding="utf-8") as f:
-                    f.write(driver.page_source)
-
-                titles = soup.find_all("a", {"data-hook": "review-title"})
-                bodies = soup.find_all("span", {"data-hook": "review-body"})
-                stars = soup.find_all("span", class_="a-icon-alt")
-
-                logger.info(f"Scraping page {page_num + 1}... Found {len(bodies)} reviews")
-                print(f"Scraping page {page_num + 1}... Found {len(bodies)} reviews")
-
-                for i in range(min(len(titles), len(bodies))):
-                    review_titles.append(titles[i].text.strip())
-                    reviews.append(bodies[i].text.strip())
-                    ratings.append(stars[i].text.strip() if i < len(stars) else "")
-                    
-                    # Stop if we've reached target
-                    if len(reviews) >= target_reviews:
-                        logger.info(f"✅ Reached target of {target_reviews} reviews.")
-                        print(f"✅ Reached target of {target_reviews} reviews.")
-                        break
-                
-                # Check if we have enough reviews
-                if len(reviews) >= target_reviews:
-                    break
-
-                # Go to next page if exists
-                try:
-                    next_btn = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((
-                            By.XPATH,
-                            '//li[@class="a-last"]/a'
-                        ))
-                    )
-                    self._random_sleep(0.5, 1.0)
-                    next_btn.click()
-                except Exception:
-                    logger.info("No more pages found or next button not clickable.")
-                    print("No more pages found or next button not clickable.")
-                    break
+            reviews = None
+            if known_ids:
+                reviews = self._scrape_pages_incremental(driver, url, target_reviews, known_ids, on_page)
+            if reviews is None and self._fetch_mode == "http":
+                reviews = self._scrape_pages_http(driver, url, target_reviews, on_page)
+            if reviews is None and page_concurrency() > 1:
+                reviews = self._scrape_pages_tabs(driver, url, target_reviews, on_page)
+            if reviews is None:
+                reviews = self._scrape_pages_browser(driver, target_reviews, on_page)
 
             logger.info(f"✅ Scraping completed successfully! Retrieved {len(reviews)} reviews.")
             print(f"✅ Scraping completed successfully! Retrieved {len(reviews)} reviews.")
@@ -698,27 +861,303 @@ class AmazonScraperTool(BaseTool):
         except Exception as e:
             logger.error(f"❌ Error during scraping: {e}", exc_info=True)
             print(f"❌ Error during scraping: {e}")
+            healthy = False
             raise
         finally:
-            # Properly close the driver to avoid handle errors
-            try:
-                if driver:
-                    # Close browser windows first
-                    driver.close()
-                    # Stop the ChromeDriver service
-                    if hasattr(driver, 'service') and driver.service:
-                        driver.service.stop()
-                    # Finally quit
-                    driver.quit()
-            except (OSError, Exception) as e:
-                # Suppress the WinError 6 handle error - it's harmless
-                if "WinError 6" not in str(e) and "handle is invalid" not in str(e):
-                    logger.error(f"⚠️ Error closing driver: {e}")
-                    print(f"⚠️ Error closing driver: {e}")
-                pass
+            # Keep warm drivers for the next scrape; broken ones are recycled
+            if pool:
+                pool.release(driver, healthy=healthy)
+            else:
+                quit_driver(driver)
         
         # Limit to target_reviews in case we got more
-        return review_titles[:target_reviews], reviews[:target_reviews], ratings[:target_reviews]
+        return reviews[:target_reviews]
+
+    def _needs_login(self, driver, timeout: float = 10) -> bool:
+        """
+        After clicking "See all reviews", tell a sign-in redirect from a review list.
+
+        Returns True when the sign-in form appears (or neither shows up in time),
+        False when the reviews are already visible, e.g. on a signed-in pooled driver.
+        """
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.any_of(
+                    EC.url_contains("/ap/signin"),
+                    EC.presence_of_element_located((By.ID, "ap_email")),
+                    EC.presence_of_element_located((By.ID, "ap_email_login")),
+                    EC.presence_of_element_located((By.ID, "cm_cr-review_list")),
+                )
+            )
+        except TimeoutException:
+            return True
+
+        if driver.find_elements(By.ID, "cm_cr-review_list") and "/ap/signin" not in driver.current_url:
+            logger.info("Already signed in, skipping login flow")
+            print("✓ Already signed in, skipping login flow")
+            return False
+        return True
+
+    def _scrape_pages_browser(self, driver, target_reviews, on_page=None):
+        """Collect reviews by rendering each page in the browser and clicking Next"""
+        reviews = []
+        metrics = PageWaitMetrics()
+        pages_to_scrape = target_reviews // 10 + 1  # Approximate pages needed (10 reviews per page)
+        for page_num in range(pages_to_scrape):
+            # The first page was just opened; later ones were awaited by click_next_and_wait
+            if page_num == 0:
+                wait_for_reviews(driver, metrics=metrics, page=1)
+
+            html = driver.page_source
+            page_reviews = self._parser.parse(html)
+            if self._page_archive is not None:
+                self._page_archive.submit(html)
+
+            logger.info(f"Scraping page {page_num + 1}... Found {len(page_reviews)} reviews")
+            print(f"Scraping page {page_num + 1}... Found {len(page_reviews)} reviews")
+
+            if on_page is not None:
+                on_page(page_reviews)
+
+            for record in page_reviews:
+                reviews.append(record)
+                
+                # Stop if we've reached target
+                if len(reviews) >= target_reviews:
+                    logger.info(f"✅ Reached target of {target_reviews} reviews.")
+                    print(f"✅ Reached target of {target_reviews} reviews.")
+                    break
+            
+            # Check if we have enough reviews
+            if len(reviews) >= target_reviews:
+                break
+
+            # Go to next page if exists
+            try:
+                next_btn = WebDriverWait(driver, 10).until(
+                    EC.element_to_be_clickable((
+                        By.XPATH,
+                        '//li[@class="a-last"]/a'
+                    ))
+                )
+            except Exception:
+                logger.info("No more pages found or next button not clickable.")
+                print("No more pages found or next button not clickable.")
+                break
+
+            if not click_next_and_wait(driver, next_btn, metrics=metrics, page=page_num + 2):
+                logger.warning("⚠️ Next page did not load in time, stopping pagination.")
+                print("⚠️ Next page did not load in time, stopping pagination.")
+                break
+
+        metrics.log_summary()
+        return reviews
+
+    def _scrape_pages_tabs(self, driver, url: str, target_reviews, on_page=None):
+        """
+        Load review pages by URL in batches of concurrent tabs.
+
+        The unfiltered list is read first; larger targets top up from the star
+        filters weighted by the product's rating histogram (see
+        plan_review_pages). Pages are merged in plan order and deduplicated by
+        review id. A star filter is dropped once one of its pages comes back
+        empty or without a Next link. Returns None when no page could be read
+        so the caller falls back to clicking through.
+        """
+        asin = extract_asin(driver.current_url) or extract_asin(url)
+        if not asin:
+            logger.warning("⚠️ No ASIN found in URL, falling back to click-through pagination")
+            return None
+
+        base = base_url(driver.current_url or url)
+        concurrency = page_concurrency()
+        histogram = None
+        if target_reviews > MAX_PAGES_PER_FILTER * REVIEWS_PER_PAGE:
+            histogram = parse_rating_histogram(driver.page_source)
+            if not histogram:
+                logger.warning("⚠️ No rating histogram on the page, reading the unfiltered list only")
+                print("⚠️ No rating histogram on the page, reading the unfiltered list only")
+        pending = plan_review_pages(target_reviews, rating_histogram=histogram)
+        metrics = PageWaitMetrics()
+        reviews = []
+        seen_ids = set()
+        exhausted = set()
+        pages_read = 0
+
+        while pending and len(reviews) < target_reviews:
+            batch = []
+            while pending and len(batch) < concurrency:
+                star, page = pending.pop(0)
+                if star not in exhausted:
+                    batch.append((star, page))
+            if not batch:
+                break
+
+            urls = [build_review_url(base, asin, page, star_filter=star) for star, page in batch]
+            pages = fetch_pages_in_tabs(driver, urls, metrics=metrics, first_page=pages_read + 1)
+            pages_read += len(batch)
+
+            for (star, page), html in zip(batch, pages):
+                if html is None:
+                    exhausted.add(star)
+                    continue
+
+                page_reviews = self._parser.parse(html)
+                if self._page_archive is not None:
+                    self._page_archive.submit(html)
+                if not page_reviews or not has_next_page(html):
+                    exhausted.add(star)
+
+                new_reviews = [r for r in page_reviews if not r.review_id or r.review_id not in seen_ids]
+                seen_ids.update(r.review_id for r in new_reviews if r.review_id)
+                reviews.extend(new_reviews)
+                if on_page is not None and new_reviews:
+                    on_page(new_reviews)
+
+                logger.info(f"Loaded {star} page {page} in tab... Found {len(page_reviews)} reviews ({len(new_reviews)} new)")
+                print(f"Loaded {star} page {page} in tab... Found {len(page_reviews)} reviews ({len(new_reviews)} new)")
+
+            if not reviews:
+                logger.warning("⚠️ No reviews from URL-addressed pages, falling back to click-through pagination")
+                print("⚠️ No reviews from URL-addressed pages, falling back to click-through pagination")
+                return None
+
+        metrics.log_summary()
+        return reviews
+
+    def _scrape_pages_incremental(self, driver, url: str, target_reviews, known_ids, on_page=None):
+        """
+        Walk the "most recent" review pages and stop at the first review already stored.
+
+        Uses the HTTP session in http fetch mode, otherwise loads each URL in the
+        browser. Returns only the new reviews, or None when the pages cannot be
+        addressed by URL (no ASIN) so the caller falls back to a full scrape.
+        """
+        asin = extract_asin(driver.current_url) or extract_asin(url)
+        if not asin:
+            logger.warning("⚠️ No ASIN found in URL, cannot crawl incrementally")
+            return None
+
+        base = base_url(driver.current_url or url)
+        http = ReviewHttpSession.from_driver(driver, base) if self._fetch_mode == "http" else None
+        metrics = PageWaitMetrics()
+        new_reviews = []
+        try:
+            for page_num in range(1, target_reviews // 10 + 2):
+                if http is not None:
+                    try:
+                        html = http.fetch_review_page(asin, page_num, sort_by="recent")
+                    except ReviewFetchError as e:
+                        logger.warning(f"⚠️ HTTP fetch failed ({e}), loading in browser")
+                        http.close()
+                        http = None
+                if http is None:
+                    driver.get(build_review_url(base, asin, page_num, sort_by="recent"))
+                    wait_for_reviews(driver, metrics=metrics, page=page_num)
+                    html = driver.page_source
+
+                page_reviews = self._parser.parse(html)
+                fresh = reviews_before_known(page_reviews, known_ids)
+                caught_up = len(fresh) < len(page_reviews)
+
+                new_reviews.extend(fresh)
+                if on_page is not None and fresh:
+                    on_page(fresh)
+
+                logger.info(f"Recent page {page_num}: {len(fresh)} new of {len(page_reviews)} reviews")
+                print(f"Recent page {page_num}: {len(fresh)} new of {len(page_reviews)} reviews")
+
+                if caught_up or len(new_reviews) >= target_reviews or not page_reviews or not has_next_page(html):
+                    break
+        finally:
+            if http is not None:
+                http.close()
+
+        logger.info(f"✅ Incremental crawl found {len(new_reviews)} new reviews")
+        print(f"✅ Incremental crawl found {len(new_reviews)} new reviews")
+        metrics.log_summary()
+        return new_reviews
+
+    def _scrape_pages_http(self, driver, url: str, target_reviews, on_page=None):
+        """
+        Fetch review pages directly over HTTP using the browser's login cookies.
+
+        Returns None when the fast path is unusable (no ASIN, blocked on the first
+        page) so the caller falls back to the Selenium loop.
+        """
+        asin = extract_asin(driver.current_url) or extract_asin(url)
+        if not asin:
+            logger.warning("⚠️ No ASIN found in URL, falling back to browser pagination")
+            return None
+
+        http = ReviewHttpSession.from_driver(driver, base_url(driver.current_url or url))
+        reviews = []
+        try:
+            pages_to_scrape = target_reviews // 10 + 1
+            for page_num in range(1, pages_to_scrape + 1):
+                try:
+                    html = http.fetch_review_page(asin, page_num)
+                except ReviewFetchError as e:
+                    if not reviews:
+                        logger.warning(f"⚠️ HTTP fast path unavailable ({e}), falling back to browser")
+                        print(f"⚠️ HTTP fast path unavailable ({e}), falling back to browser")
+                        return None
+                    logger.warning(f"⚠️ Stopping HTTP pagination: {e}")
+                    break
+
+                page_reviews = self._parser.parse(html)
+                if self._page_archive is not None:
+                    self._page_archive.submit(html)
+
+                logger.info(f"Fetched page {page_num} over HTTP... Found {len(page_reviews)} reviews")
+                print(f"Fetched page {page_num} over HTTP... Found {len(page_reviews)} reviews")
+
+                reviews.extend(page_reviews)
+                if on_page is not None:
+                    on_page(page_reviews)
+                if len(reviews) >= target_reviews or not page_reviews or not has_next_page(html):
+                    break
+        finally:
+            http.close()
+
+        return reviews
+
+    def _replay_pages(self):
+        """
+        Captured page files to replay, in capture order.
+
+        Accepts a single file or a directory of pages (plain HTML, the legacy
+        amazon_reviews_page.txt dumps, or gzipped pages from the page archive).
+        """
+        if os.path.isfile(self._replay_dir):
+            return [self._replay_dir]
+
+        paths = [
+            os.path.join(self._replay_dir, name)
+            for name in os.listdir(self._replay_dir)
+            if name.endswith(self.REPLAY_EXTENSIONS)
+        ]
+        return sorted(paths, key=lambda p: (os.path.getmtime(p), p))
+
+    def _perform_replay(self, target_reviews, on_page=None):
+        """Run the extraction path over captured pages at full speed, no browser involved"""
+        pages = self._replay_pages()
+        if not pages:
+            raise FileNotFoundError(f"No captured review pages found in {self._replay_dir}")
+
+        reviews = []
+        for page_num, path in enumerate(pages):
+            page_reviews = self._parser.parse(read_archived_page(path))
+            logger.info(f"Replaying page {page_num + 1} ({os.path.basename(path)})... Found {len(page_reviews)} reviews")
+            reviews.extend(page_reviews)
+            if on_page is not None:
+                on_page(page_reviews)
+            if len(reviews) >= target_reviews:
+                break
+
+        logger.info(f"✅ Replay completed: {len(reviews)} reviews from {page_num + 1} pages.")
+        print(f"✅ Replay completed: {len(reviews)} reviews from {page_num + 1} pages.")
+        return reviews[:target_reviews]
 
     def _setup_driver(self):
         """Set up undetected ChromeDriver with minimal automation fingerprints."""
@@ -741,24 +1180,57 @@ class AmazonScraperTool(BaseTool):
         driver.set_page_load_timeout(20)
         return driver
 
-    def _save_to_csv(self, titles, reviews, ratings, product_name="Amazon Product"):
-        """Save reviews to CSV in format compatible with preprocessing.ipynb"""
-        # Create a DataFrame
-        df = pd.DataFrame({
-            "id": range(1, len(titles) + 1),
-            "name": product_name,
-            "brand": "Amazon",
-            "categories": "Product",
-            "primaryCategories": "Product",
-            "reviews.doRecommend": [True if r.startswith("5") or r.startswith("4") else False for r in ratings],
-            "reviews.rating": [float(r.split()[0]) if r and r[0].isdigit() else 0 for r in ratings],
-            "reviews.text": reviews,
-            "reviews.title": titles
-        })
+    def _persist(self, records, url: str, product_name: str, target_reviews: int = None, incremental: bool = False):
+        """
+        Upsert into the review store, then write the scraped_reviews.csv export.
+
+        After an incremental crawl the export holds the product's latest
+        ``target_reviews`` stored reviews, not just the delta. Replayed pages
+        (captures or fixtures) only go to the CSV, never to the store.
+        """
+        if self._replay_dir:
+            return self._save_to_csv(records, product_name)
+
+        store = get_review_store()
+        store.upsert_reviews(product_key(url), records, product_name)
+        store.record_crawl(product_key(url), url, target_reviews or len(records), product_name)
+        # Columnar copy of this crawl for batch reporting
+        write_reviews(product_key(url), self._reviews_frame(records, product_name))
+        if incremental:
+            records = store.get_reviews(product_key(url), limit=target_reviews)
+        return self._save_to_csv(records, product_name)
+
+    def _reviews_frame(self, records, product_name="Amazon Product"):
+        """Normalized DataFrame of ReviewRecords in the scraped_reviews.csv layout"""
+        # One pass to build the frame; everything else is column-wise
+        raw = pd.DataFrame.from_records(
+            [r.to_dict() for r in records], columns=ReviewRecord.__slots__
+        ).rename(columns=self.CSV_COLUMNS)
+        raw["reviews.doRecommend"] = False  # derived from the normalized rating
+
+        df = normalize_reviews(raw)
+        df["id"] = range(1, len(df) + 1)
+        df["name"] = product_name
+        df["brand"] = "Amazon"
+        df["categories"] = "Product"
+        df["primaryCategories"] = "Product"
+        df = df[[
+            "id", "name", "brand", "categories", "primaryCategories",
+            "reviews.doRecommend", "reviews.rating", "reviews.text", "reviews.title",
+            "reviews.date", "reviews.didPurchase", "reviews.numHelpful", "reviews.id",
+            "reviews.length", "reviews.tokens",
+        ]]
+        return df
+
+    def _save_to_csv(self, records, product_name="Amazon Product"):
+        """Save ReviewRecords to CSV in format compatible with preprocessing.ipynb"""
+        df = self._reviews_frame(records, product_name)
         
-        # Save as scraped_reviews.csv
+        # Save as scraped_reviews.csv, in the job workspace when there is one
         compatibility_filename = "scraped_reviews.csv"
-        df.to_csv(compatibility_filename, index=False)
+        if self._workspace is not None:
+            compatibility_filename = self._workspace.path(compatibility_filename)
+        atomic_write_csv(compatibility_filename, df)
         logger.info(f"✅ Saved {len(df)} reviews to {compatibility_filename} for analysis")
         print(f"✅ Saved {len(df)} reviews to {compatibility_filename} for analysis")
         
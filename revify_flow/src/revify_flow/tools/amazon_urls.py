@@ -0,0 +1,127 @@
+"""
+Helpers for working with Amazon product and review URLs.
+"""
+
+import re
+from typing import Dict, Optional
+from urllib.parse import urlencode, urlsplit
+
+# /dp/ASIN, /gp/product/ASIN, /product-reviews/ASIN, /gp/aw/d/ASIN ...
+_ASIN_PATTERN = re.compile(
+    r"/(?:dp|gp/product|gp/aw/d|product-reviews|gp/product-reviews)/([A-Z0-9]{10})(?:[/?#]|$)",
+    re.IGNORECASE,
+)
+
+
+def extract_asin(url: str) -> Optional[str]:
+    """Return the 10-character ASIN from a product or review URL, if present"""
+    if not url:
+        return None
+    match = _ASIN_PATTERN.search(url)
+    return match.group(1).upper() if match else None
+
+
+# Subdomains that serve the same marketplace catalogue
+_HOST_PREFIXES = ("www.", "m.", "smile.")
+
+
+def marketplace(url: str) -> Optional[str]:
+    """'https://www.amazon.in/...' -> 'amazon.in' (None for non-URLs)"""
+    if not url:
+        return None
+    if not re.match(r'^https?://', url):
+        url = f"https://{url}"
+    host = (urlsplit(url).hostname or "").lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    return host or None
+
+
+def canonical_product_key(url: str) -> Optional[str]:
+    """
+    Marketplace + ASIN, e.g. 'amazon.in:B01N54ZM9W'.
+
+    Tracking parameters, /dp/ vs /gp/product/ and www./m./smile. hosts all map
+    to the same key. Different marketplaces stay separate because they carry
+    different reviews. None when the URL has no ASIN.
+    """
+    asin = extract_asin(url)
+    host = marketplace(url)
+    if not asin or not host:
+        return None
+    return f"{host}:{asin}"
+
+
+def product_key(url: str) -> str:
+    """Key reviews are stored under: the canonical product key, or the raw URL when it has no ASIN"""
+    return canonical_product_key(url) or url.strip()
+
+
+def same_product(url_a: Optional[str], url_b: Optional[str]) -> bool:
+    """True when two URLs point at the same product on the same marketplace"""
+    if not url_a or not url_b:
+        return False
+    return product_key(url_a) == product_key(url_b)
+
+
+def base_url(url: str) -> str:
+    """'https://www.amazon.in/foo/dp/X?ref=1' -> 'https://www.amazon.in'"""
+    if not re.match(r'^https?://', url):
+        url = f"https://{url}"
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+# Amazon stops listing after about 10 pages per filter, so larger targets
+# top up from the per-rating lists
+STAR_FILTERS = ("five_star", "four_star", "three_star", "two_star", "one_star")
+MAX_PAGES_PER_FILTER = 10
+REVIEWS_PER_PAGE = 10
+
+
+def build_review_url(base: str, asin: str, page_number: int = 1,
+                     star_filter: Optional[str] = None, sort_by: Optional[str] = None) -> str:
+    """URL of a review list page addressed directly by page number (and optional star filter / sort)"""
+    params = {
+        "ie": "UTF8",
+        "reviewerType": "all_reviews",
+        "pageNumber": page_number,
+        "pageSize": REVIEWS_PER_PAGE,
+    }
+    if star_filter:
+        params["filterByStar"] = star_filter
+    if sort_by:
+        params["sortBy"] = sort_by
+    return f"{base.rstrip('/')}/product-reviews/{asin}/?{urlencode(params)}"
+
+
+def plan_review_pages(target_reviews: int, max_pages_per_filter: int = MAX_PAGES_PER_FILTER,
+                      rating_histogram: Optional[Dict[str, float]] = None):
+    """
+    (star_filter, page_number) pairs to fetch for ``target_reviews``, in merge order.
+
+    The unfiltered list comes first, up to the per-filter page cap. Targets
+    beyond the cap top up from the star filters, each given pages in
+    proportion to its share of ``rating_histogram`` (star filter -> percent)
+    so the sample keeps the product's rating mix. Without a histogram there
+    is no top-up: equal pages per rating would skew the sentiment.
+    """
+    pages_needed = max(1, -(-target_reviews // REVIEWS_PER_PAGE))
+    plan = [("all_stars", page) for page in range(1, min(pages_needed, max_pages_per_filter) + 1)]
+    if pages_needed <= max_pages_per_filter or not rating_histogram:
+        return plan
+
+    total = sum(rating_histogram.get(star, 0) for star in STAR_FILTERS)
+    if total <= 0:
+        return plan
+    # Filtered pages overlap the unfiltered ones; duplicates are dropped on merge
+    star_pages = {
+        star: min(max_pages_per_filter, round(pages_needed * rating_histogram.get(star, 0) / total))
+        for star in STAR_FILTERS
+    }
+    # Ordered by how far each filter is through its quota, so any prefix keeps the mix
+    top_up = [(star, page) for star in STAR_FILTERS for page in range(1, star_pages[star] + 1)]
+    top_up.sort(key=lambda item: (item[1] / star_pages[item[0]], STAR_FILTERS.index(item[0])))
+    return plan + top_up
@@ -0,0 +1,207 @@
+"""
+Local, CPU-only aspect sentiment for the feature analysis.
+
+Sentiment labels and the ``key_points`` frequency counts used to come
+entirely from the LLM, which is slow and miscounts. ``AspectSentimentEngine``
+tokenizes every review sentence once into a pandas frame, split into
+clauses at contrast words ("battery is fine but sound is muffled" is two
+clauses). It then scores each clause against a polarity lexicon, with
+negation handling: "not good" counts as negative. Per feature it keeps the
+clauses that contain one of the feature's terms or synonyms (see
+feature_retrieval) and counts:
+
+- reviews per polarity: each review's matching clauses are summed, and
+  the star rating decides when the words are neutral
+- key phrases: opinion words, negated where needed ("not durable"),
+  counted as distinct reviews that use them about the feature
+
+Everything is column operations on the token frame, so the whole review set
+is scored in one pass. Both modes are opt-in: in ``evidence`` analysis
+(REVIFY_ANALYSIS_MODE=evidence) the LLM only writes the verdict from these
+numbers, and in ``fast`` analysis (REVIFY_ANALYSIS_MODE=fast) no LLM is
+called and the verdict is templated.
+
+- ``REVIFY_KEY_POINTS``: key phrases kept per feature (default 5)
+"""
+
+import os
+import re
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.revify_flow.tools.feature_retrieval import (
+    STOPWORDS, feature_terms, load_synonyms, split_sentences, stem,
+)
+
+DEFAULT_KEY_POINTS = 5
+NEGATION_WINDOW = 3  # a negator flips the next three non-stopword tokens
+DOMINANT_SHARE = 0.65  # share of polar reviews needed for Positive/Negative instead of Mixed
+
+_TOKEN = re.compile(r"[a-z0-9]+|;")
+
+# Opinion words only count for the features named in their own clause
+CLAUSE_BREAKS = frozenset(["but", "however", "although", "though", "whereas", "except", ";"])
+
+NEGATORS = frozenset(["not", "no", "never", "t", "nt", "cannot", "without", "hardly", "nothing", "neither", "nor"])
+
+POSITIVE_WORDS = """
+good great excellent amazing awesome fantastic perfect love loved loving liked nice best better
+superb brilliant outstanding wonderful impressive impressed happy satisfied recommend recommended
+comfortable comfy sturdy solid durable reliable smooth fast quick easy clear crisp bright loud
+beautiful stylish sleek premium worth value affordable cheap lightweight lasting lasts works
+working worked fine decent pleased fabulous incredible responsive accurate soft quiet powerful
+convenient helpful useful enjoy enjoyed favorite glad flawless elegant rich punchy vibrant
+""".split()
+
+NEGATIVE_WORDS = """
+bad poor terrible awful horrible worst worse hate hated disappointed disappointing disappointment
+useless broke broken break breaks defective faulty damaged cheaply flimsy fragile weak slow lag lags
+laggy hang hangs freeze freezes crash crashes problem problems issue issues complaint fail failed
+fails failure died dead drain drains draining overheat overheating hot noisy loud uncomfortable
+tight loose painful hurts hurt expensive overpriced waste refund return returned returning dull
+blurry muffled distorted annoying difficult hard complicated stopped unreliable inaccurate
+mediocre average fake scratch scratches scratched leak leaks leaking smell smells stiff heavy
+""".split()
+
+# Words that are opinions in one context and facts in another stay out of both lists
+# ("charges fast" is praise, "drains fast" a complaint)
+_AMBIGUOUS = frozenset(["loud", "cheap", "hard", "hot", "fast", "quick", "slow", "light", "small", "heavy"])
+
+
+def _lexicon() -> Dict[str, float]:
+    lexicon = {}
+    for word in POSITIVE_WORDS:
+        if word not in _AMBIGUOUS:
+            lexicon[stem(word)] = 1.0
+    for word in NEGATIVE_WORDS:
+        if word not in _AMBIGUOUS:
+            lexicon[stem(word)] = -1.0
+    return lexicon
+
+
+LEXICON = _lexicon()
+
+
+def _sentiment_label(positive: int, negative: int) -> str:
+    polar = positive + negative
+    if not polar:
+        return "Neutral"
+    if positive / polar >= DOMINANT_SHARE:
+        return "Positive"
+    if negative / polar >= DOMINANT_SHARE:
+        return "Negative"
+    return "Mixed"
+
+
+class AspectSentimentEngine:
+    """Token frame over a review set, scored once and sliced per feature"""
+
+    def __init__(self, reviews: Iterable[dict], synonyms: Optional[Dict[str, List[str]]] = None):
+        self.reviews = list(reviews)
+        self.synonyms = synonyms if synonyms is not None else load_synonyms()
+
+        rows = []
+        for review_id, review in enumerate(self.reviews, start=1):
+            rating = pd.to_numeric(review.get("reviews.rating"), errors="coerce")
+            for part in ("reviews.title", "reviews.text"):
+                rows.extend((review_id, rating, s) for s in split_sentences(review.get(part)))
+        self.sentences = pd.DataFrame(rows, columns=["review_id", "rating", "sentence"])
+
+        # One row per non-stopword token (negators are kept), numbered by clause within its sentence
+        tokens = self.sentences["sentence"].str.lower().str.findall(_TOKEN.pattern).explode().dropna()
+        frame = tokens.rename("word").to_frame()
+        frame.index.name = "sent"
+        frame = frame.reset_index()
+        breaks = frame["word"].isin(CLAUSE_BREAKS)
+        frame["clause"] = breaks.groupby(frame["sent"]).cumsum()
+        frame = frame[~breaks & ~frame["word"].isin(STOPWORDS - NEGATORS)].reset_index(drop=True)
+        stems = {word: stem(word) for word in frame["word"].unique()}
+        frame["stem"] = frame["word"].map(stems)
+
+        negator = frame["word"].isin(NEGATORS)
+        by_clause = negator.groupby([frame["sent"], frame["clause"]])
+        negated = np.zeros(len(frame), dtype=bool)
+        for offset in range(1, NEGATION_WINDOW + 1):
+            negated |= by_clause.shift(offset, fill_value=False).to_numpy(dtype=bool)
+        polarity = frame["stem"].map(LEXICON).fillna(0.0).to_numpy()
+        frame["polarity"] = np.where(negated, -polarity, polarity)
+        frame["phrase"] = np.where(negated, "not " + frame["word"], frame["word"])
+        frame["review_id"] = self.sentences["review_id"].to_numpy()[frame["sent"].to_numpy()]
+        self.tokens = frame
+
+        self.clauses = frame.groupby(["sent", "clause"]).agg(
+            review_id=("review_id", "first"), score=("polarity", "sum")
+        )
+        self.clauses["rating"] = self.sentences["rating"].to_numpy()[
+            self.clauses.index.get_level_values("sent")
+        ]
+
+    def feature_stats(self, feature: str, key_points: Optional[int] = None) -> dict:
+        """Sentiment distribution and counted key phrases over the reviews that mention ``feature``"""
+        key_points = key_points or int(os.getenv("REVIFY_KEY_POINTS", DEFAULT_KEY_POINTS))
+        terms = feature_terms(feature, self.synonyms)
+        matched = pd.MultiIndex.from_frame(
+            self.tokens.loc[self.tokens["stem"].isin(terms), ["sent", "clause"]].drop_duplicates()
+        )
+        clauses = self.clauses.loc[matched]
+
+        per_review = clauses.groupby("review_id").agg(score=("score", "sum"), rating=("rating", "first"))
+        # Neutral wording: fall back to the star rating
+        lean = np.where(per_review["rating"] >= 4, 1, np.where(per_review["rating"] <= 2, -1, 0))
+        polarity = np.where(per_review["score"] != 0, np.sign(per_review["score"]), lean)
+        positive = int((polarity > 0).sum())
+        negative = int((polarity < 0).sum())
+
+        in_matched = pd.MultiIndex.from_frame(self.tokens[["sent", "clause"]]).isin(matched)
+        opinions = self.tokens[in_matched & (self.tokens["polarity"] != 0)]
+        counted = (opinions.groupby("phrase")
+                   .agg(frequency=("review_id", "nunique"), polarity=("polarity", "first"))
+                   .sort_values("frequency", ascending=False, kind="stable")
+                   .head(key_points))
+        points = [
+            {"point": phrase, "frequency": int(row.frequency),
+             "sentiment": "positive" if row.polarity > 0 else "negative"}
+            for phrase, row in counted.iterrows()
+        ]
+
+        mentions = len(per_review)
+        return {
+            "feature": feature,
+            "sentiment": _sentiment_label(positive, negative),
+            "sentiment_distribution": {
+                "positive": positive,
+                "negative": negative,
+                "neutral": mentions - positive - negative,
+            },
+            "mentions": mentions,
+            "key_points": points,
+        }
+
+
+def template_verdict(stats: dict) -> str:
+    """One-sentence verdict from the counted stats, for analyses made without an LLM"""
+    feature, mentions = stats["feature"], stats["mentions"]
+    if not mentions:
+        return "No reviews mention this feature."
+    dist = stats["sentiment_distribution"]
+    noun = "review mentions" if mentions == 1 else "reviews mention"
+    verdict = (f"{mentions} {noun} {feature}: {dist['positive']} positive, "
+               f"{dist['negative']} negative and {dist['neutral']} neutral.")
+    praised = [p["point"] for p in stats["key_points"] if p["sentiment"] == "positive"][:2]
+    criticized = [p["point"] for p in stats["key_points"] if p["sentiment"] == "negative"][:2]
+    if praised:
+        verdict += f" Most often called {' and '.join(praised)}."
+    if criticized:
+        verdict += f" Complaints mention {' and '.join(criticized)}."
+    return verdict
+
+
+def sentiment_counts_text(stats: dict) -> str:
+    """The local counts as a prompt line for the verdict-writing LLM call"""
+    dist = stats["sentiment_distribution"]
+    phrases = ", ".join(f"{p['point']} ({p['frequency']})" for p in stats["key_points"]) or "none"
+    return (f"{stats['mentions']} reviews mention this feature: {dist['positive']} positive, "
+            f"{dist['negative']} negative, {dist['neutral']} neutral (overall {stats['sentiment']}). "
+            f"Most frequent opinion words: {phrases}.")
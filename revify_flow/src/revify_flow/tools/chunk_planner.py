@@ -0,0 +1,190 @@
+"""
+Pack reviews into summarization chunks by token budget instead of count.
+
+A fixed 30 reviews per chunk wastes calls on short reviews and can overflow
+the context on long ones. The planner walks the reviews in order and starts
+a new chunk when the next review would push the current one past the
+model's token budget. A review that alone exceeds the budget gets a chunk of
+its own, with its text truncated to fit.
+
+Reviews are measured as they will appear in the prompt (``render``, e.g.
+prompt_encoding.review_line), defaulting to their repr.
+
+Token counts come from a pluggable tokenizer: any ``callable(text) -> int``,
+or one of the named ones below. The default is a cheap word-count estimate.
+
+- ``estimate``: words x 1.3, no dependencies (default)
+- ``tiktoken``: cl100k_base encoding, needs ``pip install tiktoken``
+- ``litellm``: litellm.token_counter for the agent's model
+
+- ``REVIFY_TOKENIZER``: tokenizer name (default ``estimate``)
+- ``REVIFY_CHUNK_TOKEN_BUDGET``: review tokens per chunk, overrides the per-model budget
+"""
+
+import logging
+import math
+import os
+from typing import Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger('amazon_scraper')
+
+# Same crude ratio as review_normalizer (average word = 1.3 tokens)
+TOKENS_PER_WORD = 1.3
+
+# Review tokens per summarization call. Far below the context windows: the
+# budget is sized for summary quality, the window only bounds it.
+MODEL_TOKEN_BUDGETS = {
+    "gemini-2.0-flash": 8000,
+    "gemini-1.5-flash": 8000,
+    "gemini-1.5-pro": 8000,
+    "gpt-4o-mini": 6000,
+    "gpt-4o": 6000,
+}
+DEFAULT_TOKEN_BUDGET = 4000
+
+Tokenizer = Callable[[str], int]
+
+
+def estimate_tokens(text) -> int:
+    return math.ceil(len(str(text).split()) * TOKENS_PER_WORD)  # crude estimate (avg word = 1.3 tokens)
+
+
+estimate_tokens.name = "estimate"
+
+
+def _tiktoken_tokenizer(model: Optional[str]) -> Tokenizer:
+    import tiktoken
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return lambda text: len(encoding.encode(str(text), disallowed_special=()))
+
+
+def _litellm_tokenizer(model: Optional[str]) -> Tokenizer:
+    import litellm
+    return lambda text: litellm.token_counter(model=model or "gpt-4o-mini", text=str(text))
+
+
+TOKENIZERS: Dict[str, Callable[[Optional[str]], Tokenizer]] = {
+    "estimate": lambda model: estimate_tokens,
+    "tiktoken": _tiktoken_tokenizer,
+    "litellm": _litellm_tokenizer,
+}
+
+
+def get_tokenizer(name: Optional[str] = None, model: Optional[str] = None) -> Tokenizer:
+    """Named tokenizer, falling back to the estimate when it cannot be loaded"""
+    name = (name or os.getenv("REVIFY_TOKENIZER", "estimate")).lower()
+    if name not in TOKENIZERS:
+        raise ValueError(f"Unknown tokenizer {name!r}, expected one of {sorted(TOKENIZERS)}")
+    try:
+        tokenizer = TOKENIZERS[name](model)
+        tokenizer("warm up")  # surfaces missing packages and encodings that cannot be downloaded
+    except Exception as e:
+        logger.warning(f"Tokenizer {name!r} is unavailable ({e}), using the word-count estimate")
+        return estimate_tokens
+    tokenizer.name = name
+    return tokenizer
+
+
+def token_budget(model: Optional[str] = None) -> int:
+    """Review tokens per chunk for ``model`` (e.g. "gemini/gemini-2.0-flash")"""
+    override = os.getenv("REVIFY_CHUNK_TOKEN_BUDGET")
+    if override:
+        return int(override)
+    model_name = (model or "").split("/")[-1]
+    for prefix, budget in MODEL_TOKEN_BUDGETS.items():
+        if model_name.startswith(prefix):
+            return budget
+    return DEFAULT_TOKEN_BUDGET
+
+
+def model_name(agent) -> Optional[str]:
+    """The model an agent calls, when it can be read off its LLM"""
+    llm = getattr(agent, "llm", None)
+    return llm if isinstance(llm, str) else getattr(llm, "model", None)
+
+
+class ChunkPacker:
+    """
+    Incremental packer: ``add`` reviews in order and get back each chunk as it fills.
+
+    Used directly for streamed reviews; ``plan_chunks`` wraps it for lists.
+    """
+
+    def __init__(self, budget: int = None, tokenizer: Union[str, Tokenizer, None] = None,
+                 model: Optional[str] = None, max_reviews: Optional[int] = None,
+                 render: Callable[[dict], str] = str):
+        self.budget = budget or token_budget(model)
+        self.tokenizer = tokenizer if callable(tokenizer) else get_tokenizer(tokenizer, model)
+        self.max_reviews = max_reviews
+        self.render = render
+        self.chunk_tokens: List[int] = []
+        self.truncated = 0
+        self._pending = []
+        self._pending_tokens = 0
+
+    def _fit(self, review: dict, tokens: int):
+        """Truncate the text of a review bigger than the whole budget"""
+        text = str(review.get("reviews.text", ""))
+        keep = max(0, int(len(text) * self.budget / tokens * 0.9))
+        review = dict(review, **{"reviews.text": text[:keep]})
+        self.truncated += 1
+        return review, self.tokenizer(self.render(review))
+
+    def add(self, review: dict) -> Optional[list]:
+        """Add one review; returns the previous chunk if this review started a new one"""
+        tokens = self.tokenizer(self.render(review))
+        if tokens > self.budget:
+            review, tokens = self._fit(review, tokens)
+
+        full = None
+        if self._pending and (
+            self._pending_tokens + tokens > self.budget
+            or (self.max_reviews and len(self._pending) >= self.max_reviews)
+        ):
+            full = self.flush()
+        self._pending.append(review)
+        self._pending_tokens += tokens
+        return full
+
+    def flush(self) -> Optional[list]:
+        """The partly filled chunk, if any"""
+        if not self._pending:
+            return None
+        chunk = self._pending
+        self.chunk_tokens.append(self._pending_tokens)
+        self._pending, self._pending_tokens = [], 0
+        return chunk
+
+    def summary(self) -> dict:
+        calls = len(self.chunk_tokens)
+        total = sum(self.chunk_tokens)
+        return {
+            "calls": calls,
+            "tokens": total,
+            "budget": self.budget,
+            "tokenizer": getattr(self.tokenizer, "name", getattr(self.tokenizer, "__name__", "custom")),
+            "avg_fill": round(total / (calls * self.budget), 2) if calls else 0.0,
+            "max_tokens": max(self.chunk_tokens, default=0),
+            "truncated": self.truncated,
+        }
+
+    def log_summary(self, prefix: str = "📐 Chunk plan"):
+        s = self.summary()
+        message = (f"{prefix}: {s['calls']} calls, {s['tokens']} review tokens "
+                   f"({s['tokenizer']}, budget {s['budget']}/call, {s['avg_fill']:.0%} average fill)")
+        if s["truncated"]:
+            message += f", {s['truncated']} oversized reviews truncated"
+        logger.info(message)
+        print(message)
+
+
+def plan_chunks(reviews: List[dict], budget: int = None, tokenizer: Union[str, Tokenizer, None] = None,
+                model: Optional[str] = None, max_reviews: Optional[int] = None,
+                render: Callable[[dict], str] = str):
+    """Split ``reviews`` into token-budgeted chunks; returns (chunks, packer) for its summary"""
+    packer = ChunkPacker(budget, tokenizer, model, max_reviews, render)
+    chunks = [chunk for chunk in map(packer.add, reviews) if chunk]
+    last = packer.flush()
+    if last:
+        chunks.append(last)
+    return chunks, packer
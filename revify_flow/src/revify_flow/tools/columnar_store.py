@@ -0,0 +1,146 @@
+"""
+Columnar Parquet storage for reviews, chunk summaries and feature analyses.
+
+Each dataset is a directory of Parquet files partitioned Hive-style by
+product and date::
+
+    columnar/feature_analyses/product=amazon.in_B01N54ZM9W/date=2026-10-18/part-<id>.parquet
+
+Readers open a dataset memory-mapped, select only the columns they need and
+push product/date filters down to the partition directories. Batch reporting
+over hundreds of products therefore never parses JSON or CSV.
+
+pyarrow is optional. Without it, writes are skipped with a warning and
+reads return empty DataFrames, so callers fall back to the JSON/CSV files.
+
+- ``REVIFY_COLUMNAR_DIR``: dataset root (default ``columnar``)
+"""
+
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    from pyarrow import fs as pafs
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_COLUMNAR_DIR = "columnar"
+
+REVIEWS = "reviews"
+CHUNK_SUMMARIES = "chunk_summaries"
+FEATURE_ANALYSES = "feature_analyses"
+
+_warned = False
+
+
+def columnar_root() -> str:
+    return os.path.abspath(os.getenv("REVIFY_COLUMNAR_DIR", DEFAULT_COLUMNAR_DIR))
+
+
+def _partition_value(product_key: str) -> str:
+    # Product keys contain ':' which Windows does not allow in directory names
+    return "".join(c if c.isalnum() or c in ".-" else "_" for c in product_key)
+
+
+def _available() -> bool:
+    global _warned
+    if not PYARROW_AVAILABLE and not _warned:
+        logger.warning("pyarrow is not installed, columnar storage is disabled (pip install pyarrow)")
+        _warned = True
+    return PYARROW_AVAILABLE
+
+
+def write_partition(dataset: str, product_key: str, df: pd.DataFrame) -> Optional[str]:
+    """Append ``df`` as one Parquet file in the product/today partition of ``dataset``"""
+    if df.empty or not _available():
+        return None
+
+    directory = os.path.join(
+        columnar_root(), dataset,
+        f"product={_partition_value(product_key)}",
+        f"date={datetime.now().strftime('%Y-%m-%d')}",
+    )
+    os.makedirs(directory, exist_ok=True)
+    name = f"part-{uuid.uuid4().hex}.parquet"
+    path = os.path.join(directory, name)
+
+    df = df.copy()
+    df.insert(0, "product_key", product_key)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    # Readers only ever see complete files (dot-prefixed files are ignored by pyarrow)
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    pq.write_table(table, tmp_path, compression="zstd")
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_reviews(product_key: str, reviews_df: pd.DataFrame) -> Optional[str]:
+    return write_partition(REVIEWS, product_key, reviews_df)
+
+
+def write_chunk_summaries(product_key: str, summaries: List[str]) -> Optional[str]:
+    df = pd.DataFrame({
+        "created_at": time.time(),
+        "chunk_index": range(len(summaries)),
+        "summary": summaries,
+    })
+    return write_partition(CHUNK_SUMMARIES, product_key, df)
+
+
+def write_feature_analyses(product_key: str, analyses: List[dict], source: str = None) -> Optional[str]:
+    """One row per analysed feature; key_points are kept as a JSON string"""
+    df = pd.DataFrame({
+        "created_at": time.time(),
+        "source": source or "",
+        "position": range(len(analyses)),
+        "feature": [str(a.get("feature", "")) for a in analyses],
+        "sentiment": [str(a.get("sentiment", "")) for a in analyses],
+        "verdict": [str(a.get("verdict", "")) for a in analyses],
+        "key_points": [json.dumps(a.get("key_points", []), ensure_ascii=False) for a in analyses],
+    })
+    return write_partition(FEATURE_ANALYSES, product_key, df)
+
+
+def read_dataset(dataset: str, columns: List[str] = None, product_key: str = None,
+                 since_date: str = None) -> pd.DataFrame:
+    """
+    Load a dataset with column projection and partition pruning.
+
+    ``since_date`` is an ISO date (YYYY-MM-DD); partitions before it are skipped.
+    """
+    path = os.path.join(columnar_root(), dataset)
+    if not os.path.isdir(path) or not _available():
+        return pd.DataFrame(columns=columns or [])
+
+    dataset_obj = ds.dataset(
+        path,
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([("product", pa.string()), ("date", pa.string())]), flavor="hive"
+        ),
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+
+    expression = None
+    if product_key:
+        expression = ds.field("product") == _partition_value(product_key)
+    if since_date:
+        date_filter = ds.field("date") >= since_date
+        expression = date_filter if expression is None else expression & date_filter
+
+    table = dataset_obj.to_table(columns=columns, filter=expression)
+    return table.to_pandas()
@@ -0,0 +1,218 @@
+"""
+Pool of warm Chrome drivers shared across scraper invocations.
+
+Starting undetected Chrome (and logging in) costs many seconds, so drivers
+are kept alive between scrapes instead of being torn down after every
+``_run``. The pool is process-wide, so every AmazonScraperTool instance and
+every API worker thread draws from the same set of browsers.
+
+- ``REVIFY_DRIVER_POOL_SIZE``: maximum live drivers (default 1, 0 disables pooling)
+- ``REVIFY_DRIVER_MAX_USES``: recycle a driver after this many scrapes (default 10)
+- ``REVIFY_DRIVER_POOL_TIMEOUT``: seconds to wait for a free driver before failing (default 300)
+
+Drivers are health-checked when they are acquired and replaced if they died.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_POOL_SIZE = 1
+DEFAULT_MAX_USES = 10
+DEFAULT_ACQUIRE_TIMEOUT = 300  # a scrape holds its driver for minutes, not hours
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class DriverPoolTimeout(TimeoutError):
+    """No driver was released in time; every pooled browser is busy"""
+
+
+def quit_driver(driver):
+    """Close a driver completely, ignoring the harmless Windows handle errors"""
+    try:
+        if driver:
+            # Close browser windows first
+            driver.close()
+            # Stop the ChromeDriver service
+            if hasattr(driver, 'service') and driver.service:
+                driver.service.stop()
+            # Finally quit
+            driver.quit()
+    except (OSError, Exception) as e:
+        # Suppress the WinError 6 handle error - it's harmless
+        if "WinError 6" not in str(e) and "handle is invalid" not in str(e):
+            logger.error(f"⚠️ Error closing driver: {e}")
+            print(f"⚠️ Error closing driver: {e}")
+
+
+def is_driver_alive(driver) -> bool:
+    """Cheap liveness probe: a round trip to the browser without navigating"""
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """Thread-safe pool of reusable WebDriver instances"""
+
+    def __init__(self, factory, size: int = DEFAULT_POOL_SIZE, max_uses: int = DEFAULT_MAX_USES,
+                 timeout: float = DEFAULT_ACQUIRE_TIMEOUT):
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.timeout = timeout
+
+        self._idle = deque()
+        self._uses = {}  # id(driver) -> completed scrapes
+        self._live = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: float = None):
+        """
+        Return a healthy driver, waiting while all drivers are busy.
+
+        Waits at most ``timeout`` seconds (default: the pool's timeout), then
+        raises DriverPoolTimeout. Pair every acquire with ``release`` in a
+        ``finally`` block, or use ``driver()``.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            driver = self._reserve(timeout, deadline)
+            if driver is None:
+                break
+            # Probe outside the lock: it is a browser round trip
+            if is_driver_alive(driver):
+                logger.info(f"♻️ Reusing warm driver ({self._uses[id(driver)]} previous uses)")
+                return driver
+            logger.warning("Discarding dead driver from pool")
+            self._discard(driver)
+
+        # Launch outside the lock so other threads can release meanwhile
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _reserve(self, timeout: float, deadline: float):
+        """
+        Take an idle driver, or a free slot to launch one in (returns None).
+
+        Either way the slot stays counted in ``_live`` for the caller.
+        """
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.popleft()
+                if self._live < self.size:
+                    self._live += 1
+                    return None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    raise DriverPoolTimeout(
+                        f"No browser driver became free within {timeout:.0f}s (all {self.size} busy); "
+                        "raise REVIFY_DRIVER_POOL_SIZE or REVIFY_DRIVER_POOL_TIMEOUT"
+                    )
+
+    def release(self, driver, healthy: bool = True):
+        """Return a driver to the pool, recycling it if it is worn out or broken"""
+        with self._cond:
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+
+            if healthy and uses < self.max_uses:
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+
+        logger.info(f"Recycling driver after {uses} uses (healthy={healthy})")
+        self._discard(driver)
+
+    def warm(self):
+        """Launch drivers up to the pool size so the first scrapes skip cold starts"""
+        with self._cond:
+            missing = self.size - self._live
+            self._live += missing
+
+        for _ in range(missing):
+            try:
+                driver = self.factory()
+            except Exception as e:
+                logger.error(f"Failed to pre-warm driver: {e}")
+                with self._cond:
+                    self._live -= 1
+                continue
+            with self._cond:
+                self._uses[id(driver)] = 0
+                self._idle.append(driver)
+                self._cond.notify()
+        logger.info(f"Driver pool warmed ({len(self._idle)} idle drivers)")
+
+    @contextmanager
+    def driver(self):
+        """``with pool.driver() as driver:`` - discards the driver if the block raises"""
+        driver = self.acquire()
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.release(driver, healthy=healthy)
+
+    def close_all(self):
+        """Quit every idle driver (busy ones are quit when released)"""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self.max_uses = 0
+        for driver in idle:
+            self._discard(driver)
+
+    def _discard(self, driver):
+        """Free the driver's slot, then quit it; caller must not hold the lock (quitting takes seconds)"""
+        with self._cond:
+            self._uses.pop(id(driver), None)
+            self._live -= 1
+            self._cond.notify()
+        quit_driver(driver)
+
+
+def get_driver_pool(factory):
+    """
+    Process-wide driver pool, created on first use from the environment.
+
+    Returns None when pooling is disabled (``REVIFY_DRIVER_POOL_SIZE=0``).
+    """
+    global _pool
+    size = int(os.getenv("REVIFY_DRIVER_POOL_SIZE", DEFAULT_POOL_SIZE))
+    if size <= 0:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            max_uses = int(os.getenv("REVIFY_DRIVER_MAX_USES", DEFAULT_MAX_USES))
+            timeout = float(os.getenv("REVIFY_DRIVER_POOL_TIMEOUT", DEFAULT_ACQUIRE_TIMEOUT))
+            _pool = DriverPool(factory, size=size, max_uses=max_uses, timeout=timeout)
+            atexit.register(_pool.close_all)
+            logger.info(f"Driver pool created (size={size}, max_uses={max_uses})")
+    return _pool
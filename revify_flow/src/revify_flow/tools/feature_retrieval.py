@@ -0,0 +1,216 @@
+"""
+Local BM25 retrieval of review sentences per product feature.
+
+The comprehensive analysis call used to get every review (or every chunk
+summary) for every feature. ``FeatureEvidenceIndex`` splits the reviews into
+sentences, indexes them in memory and, for each feature, returns only the
+sentences that mention the feature or one of its synonyms, ranked by BM25.
+Each feature is then analyzed on its own evidence (see
+main.analyze_features_by_evidence), so the prompts are a fraction of the
+full payload and the per-feature calls can run in parallel.
+
+No network or extra packages are needed: tokens are lowercased words with a
+light suffix stemmer, and synonyms come from ``FEATURE_SYNONYMS`` plus an
+optional JSON file.
+
+- ``REVIFY_EVIDENCE_TOP_K``: sentences kept per feature (default 40)
+- ``REVIFY_FEATURE_SYNONYMS``: path to a JSON object of extra {term: [synonyms]}
+"""
+
+import json
+import logging
+import math
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from src.revify_flow.tools.chunk_planner import estimate_tokens
+from src.revify_flow.tools.prompt_encoding import cell
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_TOP_K = 40
+SYNONYM_WEIGHT = 0.5  # a synonym match counts half as much as the feature's own words
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_WORD = re.compile(r"[a-z0-9]+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\s*\n+\s*")
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it its of on or so that the this to "
+    "was were will with my me very".split()
+)
+# Words in feature names that say little on their own ("Build Quality" is about the build)
+GENERIC_FEATURE_WORDS = frozenset(["quality", "overall", "performance", "experience"])
+
+# Related words for features the extractor commonly returns, keyed by stem
+FEATURE_SYNONYMS: Dict[str, List[str]] = {
+    "battery": ["charge", "charging", "charger", "backup", "mah", "drain", "power"],
+    "sound": ["audio", "bass", "treble", "volume", "loud", "music", "speaker", "clarity"],
+    "audio": ["sound", "bass", "treble", "volume", "music"],
+    "noise": ["anc", "cancellation", "cancelling", "isolation", "quiet"],
+    "mic": ["microphone", "call", "calls", "voice"],
+    "microphone": ["mic", "call", "calls", "voice"],
+    "comfort": ["comfortable", "cushion", "soft", "padding", "pain", "hurt"],
+    "fit": ["size", "sizing", "tight", "loose", "snug", "fits"],
+    "size": ["fit", "sizing", "small", "large", "big", "compact"],
+    "durability": ["durable", "sturdy", "broke", "broken", "last", "lasting", "tear", "wear"],
+    "build": ["material", "plastic", "metal", "sturdy", "solid", "flimsy", "cheap"],
+    "material": ["fabric", "plastic", "leather", "metal", "build"],
+    "price": ["value", "money", "cost", "cheap", "expensive", "worth", "affordable"],
+    "value": ["price", "money", "worth", "cost", "affordable"],
+    "display": ["screen", "brightness", "resolution", "bright", "panel"],
+    "screen": ["display", "brightness", "resolution", "touch"],
+    "camera": ["photo", "picture", "video", "lens", "selfie", "image"],
+    "performance": ["speed", "fast", "slow", "lag", "smooth", "hang", "responsive"],
+    "speed": ["fast", "slow", "quick", "lag", "performance"],
+    "connectivity": ["bluetooth", "pair", "pairing", "connection", "connect", "wifi", "range"],
+    "bluetooth": ["pair", "pairing", "connection", "connect", "range"],
+    "design": ["look", "style", "stylish", "color", "colour", "appearance", "beautiful"],
+    "style": ["look", "design", "color", "colour", "stylish"],
+    "weight": ["light", "heavy", "lightweight", "weigh"],
+    "storage": ["memory", "gb", "space"],
+    "software": ["app", "update", "ui", "bug", "buggy"],
+    "grip": ["slip", "slippery", "traction", "sole"],
+    "sole": ["grip", "cushion", "heel", "traction"],
+    "delivery": ["shipping", "packaging", "arrived", "delivered", "package"],
+    "service": ["support", "warranty", "replacement", "refund", "seller"],
+    "warranty": ["service", "replacement", "repair", "support"],
+    "easy": ["simple", "convenient", "intuitive"],
+}
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping, enough to match batteries/battery and charging/charged/charges"""
+    if len(word) > 4 and word.endswith("ies"):
+        word = word[:-3] + "y"
+    elif len(word) > 5 and word.endswith("ing"):
+        word = word[:-3]
+    elif len(word) > 5 and word.endswith("ed") and not word.endswith("eed"):
+        word = word[:-2]
+    elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    if len(word) > 3 and word.endswith("e"):
+        word = word[:-1]
+    return word
+
+
+def tokenize(text) -> List[str]:
+    return [stem(w) for w in _WORD.findall(str(text).lower()) if w not in STOPWORDS]
+
+
+def load_synonyms(path: Optional[str] = None) -> Dict[str, List[str]]:
+    """FEATURE_SYNONYMS plus the entries of REVIFY_FEATURE_SYNONYMS, keyed by stem"""
+    synonyms = defaultdict(list)
+    for term, related in FEATURE_SYNONYMS.items():
+        synonyms[stem(term)].extend(related)
+    path = path or os.getenv("REVIFY_FEATURE_SYNONYMS")
+    if path:
+        with open(path, encoding="utf-8") as f:
+            for term, related in json.load(f).items():
+                synonyms[stem(term.lower())].extend(related)
+    return dict(synonyms)
+
+
+def feature_terms(feature: str, synonyms: Dict[str, List[str]]) -> Dict[str, float]:
+    """The feature's own stems at weight 1, their synonyms at SYNONYM_WEIGHT"""
+    weights = {}
+    terms = tokenize(feature)
+    terms = [t for t in terms if t not in GENERIC_FEATURE_WORDS] or terms
+    for term in terms:
+        weights[term] = 1.0
+        for related in synonyms.get(term, ()):
+            for synonym in tokenize(related):
+                weights.setdefault(synonym, SYNONYM_WEIGHT)
+    return weights
+
+
+def split_sentences(text) -> List[str]:
+    text = text if isinstance(text, str) else cell(text)
+    return [s for s in (cell(part) for part in _SENTENCE_END.split(text)) if len(s) > 2]
+
+
+class Evidence:
+    """One review sentence retrieved for a feature"""
+
+    __slots__ = ("review_id", "rating", "sentence", "score")
+
+    def __init__(self, review_id: int, rating, sentence: str, score: float):
+        self.review_id = review_id
+        self.rating = rating
+        self.sentence = sentence
+        self.score = score
+
+    def __repr__(self):
+        return f"Evidence({self.review_id}, {self.score:.2f}, {self.sentence[:40]!r})"
+
+
+class FeatureEvidenceIndex:
+    """In-memory BM25 index over the sentences (and titles) of a set of review dicts"""
+
+    def __init__(self, reviews: Iterable[dict], synonyms: Optional[Dict[str, List[str]]] = None):
+        self.reviews = list(reviews)
+        self.synonyms = synonyms if synonyms is not None else load_synonyms()
+        self._sentences = []  # (review_id, sentence)
+        self._lengths = []
+        self._postings = defaultdict(list)  # term -> [(sentence index, term frequency)]
+
+        for review_id, review in enumerate(self.reviews, start=1):
+            parts = split_sentences(review.get("reviews.title")) + split_sentences(review.get("reviews.text"))
+            for sentence in parts:
+                terms = Counter(tokenize(sentence))
+                if not terms:
+                    continue
+                index = len(self._sentences)
+                self._sentences.append((review_id, sentence))
+                self._lengths.append(sum(terms.values()))
+                for term, count in terms.items():
+                    self._postings[term].append((index, count))
+
+        self._avg_length = sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+
+    def __len__(self):
+        return len(self._sentences)
+
+    def query_terms(self, feature: str) -> Dict[str, float]:
+        return feature_terms(feature, self.synonyms)
+
+    def _idf(self, term: str) -> float:
+        df = len(self._postings.get(term, ()))
+        n = len(self._sentences)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, feature: str, top_k: Optional[int] = None) -> List[Evidence]:
+        """Best matching sentences for ``feature``, returned in review order"""
+        top_k = top_k or int(os.getenv("REVIFY_EVIDENCE_TOP_K", DEFAULT_TOP_K))
+        scores = defaultdict(float)
+        for term, weight in self.query_terms(feature).items():
+            idf = self._idf(term)
+            for index, tf in self._postings.get(term, ()):
+                norm = 1 - BM25_B + BM25_B * self._lengths[index] / self._avg_length
+                scores[index] += weight * idf * tf * (BM25_K1 + 1) / (tf + BM25_K1 * norm)
+
+        best = sorted(scores, key=scores.get, reverse=True)[:top_k]
+        evidence = []
+        for index in sorted(best):
+            review_id, sentence = self._sentences[index]
+            rating = self.reviews[review_id - 1].get("reviews.rating")
+            evidence.append(Evidence(review_id, rating, sentence, scores[index]))
+        return evidence
+
+
+def format_evidence(evidence: List[Evidence]) -> str:
+    """Compact prompt payload: one ``review id|rating|sentence`` line per retrieved sentence"""
+    lines = ["review|rating|sentence"]
+    lines.extend(f"{e.review_id}|{cell(e.rating)}|{e.sentence}" for e in evidence)
+    return "\n".join(lines)
+
+
+def log_evidence(feature: str, evidence: List[Evidence], total_reviews: int):
+    message = (f"🔎 Evidence for '{feature}': {len(evidence)} sentences from "
+               f"{len({e.review_id for e in evidence})}/{total_reviews} reviews "
+               f"(~{estimate_tokens(format_evidence(evidence))} tokens)")
+    logger.info(message)
+    print(message)
@@ -0,0 +1,261 @@
+"""
+Per-job artifact workspaces, so concurrent analyses never share files.
+
+Every phase used to write fixed relative paths (scraped_reviews.csv,
+output/feature_analysis_raw.txt, amazon_scraper.log), so two jobs running at
+once overwrote each other's files. A ``JobWorkspace`` gives each job its own
+directory::
+
+    workspaces/<job_id>/scraped_reviews.csv
+    workspaces/<job_id>/feature_analysis_raw.txt
+    workspaces/<job_id>/job.log
+    workspaces/<job_id>/workspace.json   (created/finished times, for pruning)
+
+While a job log is attached, that job's records go only to ``job.log``:
+file handlers on the root logger (the shared amazon_scraper.log) skip them.
+
+The workspace is created by the caller (main.py, api.py) and passed
+explicitly to TeamRevify and AmazonScraperTool. All writes go to a temp file
+in the same directory followed by ``os.replace``, so readers never see a
+half-written file.
+
+Cleanup policies, applied when the job finishes:
+
+- ``on_success`` (default): delete the workspace unless the job failed, so
+  failed runs keep their artifacts for debugging
+- ``always``: delete it either way
+- ``never``: keep everything
+
+- ``REVIFY_WORKSPACE_DIR``: workspace root (default ``workspaces``)
+- ``REVIFY_WORKSPACE_CLEANUP``: cleanup policy (default ``on_success``)
+- ``REVIFY_WORKSPACE_MAX_AGE_HOURS``: kept workspaces older than this are pruned (default 72)
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Optional
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_WORKSPACE_DIR = "workspaces"
+DEFAULT_MAX_AGE_HOURS = 72
+
+CLEANUP_POLICIES = ("on_success", "always", "never")
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+METADATA_FILE = "workspace.json"
+
+
+def workspace_root() -> str:
+    return os.path.abspath(os.getenv("REVIFY_WORKSPACE_DIR", DEFAULT_WORKSPACE_DIR))
+
+
+def atomic_write(path: str, write: Callable, mode: str = "w"):
+    """
+    Write ``path`` via ``write(file)`` on a temp file, then rename it into place.
+
+    The temp file lives in the target directory so the rename stays on one
+    filesystem and is atomic.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        if "b" in mode:
+            with open(tmp_path, mode) as f:
+                write(f)
+        else:
+            with open(tmp_path, mode, encoding="utf-8", newline="") as f:
+                write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def atomic_write_text(path: str, text: str) -> str:
+    return atomic_write(path, lambda f: f.write(text))
+
+
+def atomic_write_json(path: str, data) -> str:
+    return atomic_write(path, lambda f: json.dump(data, f, indent=2, ensure_ascii=False))
+
+
+def atomic_write_csv(path: str, df) -> str:
+    return atomic_write(path, lambda f: df.to_csv(f, index=False))
+
+
+class _ThreadPrefixFilter(logging.Filter):
+    """Pass only records logged from threads whose name starts with the job's prefix"""
+
+    def __init__(self, prefix: str):
+        super().__init__()
+        self.prefix = prefix
+
+    def filter(self, record):
+        return record.threadName.startswith(self.prefix)
+
+
+class _ExcludeJobThreadsFilter(logging.Filter):
+    """Drop records from threads of jobs that log to their own job.log"""
+
+    def __init__(self):
+        super().__init__()
+        self.prefixes = set()
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        with self._lock:
+            return not any(record.threadName.startswith(prefix) for prefix in self.prefixes)
+
+    def add(self, prefix: str):
+        with self._lock:
+            self.prefixes.add(prefix)
+
+    def discard(self, prefix: str):
+        with self._lock:
+            self.prefixes.discard(prefix)
+
+
+_job_threads_filter = _ExcludeJobThreadsFilter()
+
+
+def _exclude_job_threads_from_shared_logs():
+    """Install the job-thread filter on the root logger's file handlers (idempotent)"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler) and _job_threads_filter not in handler.filters:
+            handler.addFilter(_job_threads_filter)
+
+
+class JobWorkspace:
+    """Private directory for one analysis job's intermediate artifacts"""
+
+    def __init__(self, job_id: Optional[str] = None, root: Optional[str] = None,
+                 cleanup: Optional[str] = None):
+        self.job_id = job_id or f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        self.directory = os.path.join(os.path.abspath(root or workspace_root()), self.job_id)
+        self.cleanup = (cleanup or os.getenv("REVIFY_WORKSPACE_CLEANUP", "on_success")).lower()
+        if self.cleanup not in CLEANUP_POLICIES:
+            raise ValueError(f"Unknown workspace cleanup policy {self.cleanup!r}, expected one of {CLEANUP_POLICIES}")
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.created_at = time.time()
+        self._write_metadata()
+        self._log_handler = None
+        self._closed = False
+        logger.info(f"📁 Job workspace {self.directory}")
+
+    def _write_metadata(self, **fields):
+        self.write_json(METADATA_FILE, dict({"job_id": self.job_id, "created_at": self.created_at}, **fields))
+
+    @property
+    def thread_prefix(self) -> str:
+        return f"job-{self.job_id}"
+
+    def thread_name(self, role: str) -> str:
+        """Name for a thread working on this job; its log records go to the job log"""
+        return f"{self.thread_prefix}/{role}"
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def write_text(self, name: str, text: str) -> str:
+        return atomic_write_text(self.path(name), text)
+
+    def write_json(self, name: str, data) -> str:
+        return atomic_write_json(self.path(name), data)
+
+    def write_csv(self, name: str, df) -> str:
+        return atomic_write_csv(self.path(name), df)
+
+    def attach_log(self, logger_name: str = 'amazon_scraper') -> str:
+        """
+        Route ``logger_name`` records from this job's threads into ``job.log``.
+
+        Threads are matched by name, so worker threads must be started with
+        ``thread_name()`` or a name derived from their parent's. Until the log
+        is detached, the root logger's file handlers skip these records.
+        """
+        if self._log_handler is None:
+            handler = logging.FileHandler(self.path("job.log"), encoding="utf-8")
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            handler.addFilter(_ThreadPrefixFilter(self.thread_prefix))
+            logging.getLogger(logger_name).addHandler(handler)
+            self._log_handler = (logger_name, handler)
+            _exclude_job_threads_from_shared_logs()
+            _job_threads_filter.add(self.thread_prefix)
+        return self.path("job.log")
+
+    def _detach_log(self):
+        if self._log_handler is not None:
+            logger_name, handler = self._log_handler
+            logging.getLogger(logger_name).removeHandler(handler)
+            handler.close()
+            _job_threads_filter.discard(self.thread_prefix)
+            self._log_handler = None
+
+    def close(self, succeeded: bool = True):
+        """Apply the cleanup policy; safe to call more than once"""
+        if self._closed:
+            return
+        self._closed = True
+        self._detach_log()
+
+        if self.cleanup == "always" or (self.cleanup == "on_success" and succeeded):
+            shutil.rmtree(self.directory, ignore_errors=True)
+        else:
+            self._write_metadata(finished_at=time.time(), succeeded=succeeded)
+            logger.info(f"📁 Keeping job workspace {self.directory}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(succeeded=exc_type is None)
+        return False
+
+
+_prune_lock = threading.Lock()
+
+
+def workspace_time(directory: str) -> float:
+    """When a workspace's job finished (else started), from its metadata; mtime for older workspaces"""
+    try:
+        with open(os.path.join(directory, METADATA_FILE), encoding="utf-8") as f:
+            metadata = json.load(f)
+        return float(metadata.get("finished_at") or metadata["created_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return os.stat(directory).st_mtime
+
+
+def prune_workspaces(root: Optional[str] = None, max_age_hours: Optional[float] = None) -> int:
+    """
+    Delete kept workspaces (failed or ``never`` jobs) older than the max age; returns how many.
+
+    Age is measured from the recorded finish (or creation) time, not the
+    directory mtime, which changes whenever a file inside is added or removed.
+    """
+    root = os.path.abspath(root or workspace_root())
+    if max_age_hours is None:
+        max_age_hours = float(os.getenv("REVIFY_WORKSPACE_MAX_AGE_HOURS", DEFAULT_MAX_AGE_HOURS))
+    if max_age_hours <= 0 or not os.path.isdir(root):
+        return 0
+
+    cutoff = time.time() - max_age_hours * 3600
+    removed = 0
+    with _prune_lock:
+        for entry in os.scandir(root):
+            if entry.is_dir() and workspace_time(entry.path) < cutoff:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+    if removed:
+        logger.info(f"🧹 Pruned {removed} job workspaces older than {max_age_hours:g}h")
+    return removed
@@ -0,0 +1,269 @@
+"""
+Persistent, content-addressed cache of LLM crew responses.
+
+Re-running an analysis used to repeat every Crew.kickoff at full cost. Each
+LLM-only kickoff (feature extraction, chunk summaries, the comprehensive
+analysis) now goes through ``cached_kickoff``. The cache key is a SHA-256
+over everything that determines the answer:
+
+- each agent's model, role, goal and backstory
+- each task's description and expected output
+- the kickoff inputs
+
+An identical rerun is answered from SQLite in milliseconds. A partly
+changed run, say with new reviews in the last chunk, only pays for the
+calls whose prompt actually changed. Misses go through the shared rate
+limiter. The scraper crew is never cached, because it has side effects.
+Callers that parse the response pass ``validate``: a response that fails
+it is neither stored nor replayed, and retries pass ``bypass``.
+
+Eviction: entries older than the TTL are ignored and purged, and the least
+recently used entries are dropped once the cache exceeds its size cap.
+
+- ``REVIFY_LLM_CACHE``: ``0``/``off`` bypasses the cache entirely (default on)
+- ``REVIFY_LLM_CACHE_DB``: database path (default ``revify_llm_cache.db``)
+- ``REVIFY_LLM_CACHE_TTL_HOURS``: entry lifetime (default 168, 0 never expires)
+- ``REVIFY_LLM_CACHE_MAX_MB``: size cap (default 100)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+from src.revify_flow.tools.chunk_planner import model_name
+from src.revify_flow.tools.llm_throttle import throttled_call
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_DB_PATH = "revify_llm_cache.db"
+DEFAULT_TTL_HOURS = 168
+DEFAULT_MAX_MB = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key        TEXT PRIMARY KEY,
+    label      TEXT,
+    raw        TEXT NOT NULL,
+    size       INTEGER NOT NULL,
+    elapsed    REAL,
+    created_at REAL NOT NULL,
+    last_hit   REAL NOT NULL,
+    hits       INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_hit ON responses (last_hit);
+CREATE INDEX IF NOT EXISTS idx_responses_created ON responses (created_at);
+"""
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.getenv("REVIFY_LLM_CACHE", "1").lower() not in ("0", "false", "no", "off")
+
+
+class CachedCrewOutput:
+    """Stand-in for CrewOutput on a cache hit; callers only read ``.raw``"""
+
+    cached = True
+
+    def __init__(self, raw: str):
+        self.raw = raw
+
+    def __str__(self):
+        return self.raw
+
+
+def crew_cache_key(crew, inputs: Optional[dict] = None) -> str:
+    """Hash of the agents, tasks and inputs that determine a crew's output"""
+    payload = {
+        "agents": [
+            [model_name(a), a.role, a.goal, a.backstory] for a in crew.agents
+        ],
+        "tasks": [
+            [t.description, t.expected_output, getattr(t.agent, "role", None)] for t in crew.tasks
+        ],
+        "inputs": inputs or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with TTL and LRU size eviction, safe to share between threads"""
+
+    def __init__(self, path: str = None, ttl_hours: float = None, max_mb: float = None):
+        self.path = os.path.abspath(path or os.getenv("REVIFY_LLM_CACHE_DB", DEFAULT_DB_PATH))
+        if ttl_hours is None:
+            ttl_hours = float(os.getenv("REVIFY_LLM_CACHE_TTL_HOURS", DEFAULT_TTL_HOURS))
+        if max_mb is None:
+            max_mb = float(os.getenv("REVIFY_LLM_CACHE_MAX_MB", DEFAULT_MAX_MB))
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "bypassed": 0, "stores": 0, "rejected": 0, "evictions": 0,
+                      "saved_s": 0.0}
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not cross threads, so keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, stat: str, amount=1):
+        with self._stats_lock:
+            self.stats[stat] += amount
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute("SELECT raw, created_at, elapsed FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        raw, created_at, elapsed = row
+        if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._count("evictions")
+            return None
+        with conn:
+            conn.execute("UPDATE responses SET last_hit = ?, hits = hits + 1 WHERE key = ?", (now, key))
+        self._count("saved_s", elapsed or 0.0)
+        return raw
+
+    def put(self, key: str, raw: str, label: str = None, elapsed: float = None):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, label, raw, size, elapsed, created_at, last_hit, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, label, raw, len(raw.encode("utf-8")), elapsed, now, now),
+            )
+        self._count("stores")
+        self.evict()
+
+    def discard(self, key: str):
+        """Drop one entry, e.g. a response its caller could not parse"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under the size cap"""
+        removed = 0
+        with self._connect() as conn:
+            if self.ttl_seconds > 0:
+                removed += conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                victims, freed = [], 0
+                for key, size in conn.execute("SELECT key, size FROM responses ORDER BY last_hit"):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+                removed += len(victims)
+        if removed:
+            self._count("evictions", removed)
+            logger.info(f"🧹 Evicted {removed} cached LLM responses")
+        return removed
+
+    def metrics(self) -> dict:
+        row = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        with self._stats_lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats.update({
+            "hit_rate": round(stats["hits"] / lookups, 2) if lookups else 0.0,
+            "saved_s": round(stats["saved_s"], 1),
+            "entries": row[0],
+            "size_mb": round(row[1] / 1024 / 1024, 2),
+        })
+        return stats
+
+    def log_summary(self):
+        m = self.metrics()
+        message = (f"💾 LLM cache: {m['hits']} hits, {m['misses']} misses ({m['hit_rate']:.0%} hit rate), "
+                   f"{m['rejected']} rejected, ~{m['saved_s']}s of LLM time saved, "
+                   f"{m['entries']} entries / {m['size_mb']} MB")
+        logger.info(message)
+        print(message)
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Process-wide cache configured from the environment"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = LLMResponseCache()
+        return _cache
+
+
+def _is_valid(raw: str, validate: Optional[Callable[[str], object]]) -> bool:
+    if validate is None:
+        return True
+    try:
+        return bool(validate(raw))
+    except Exception:
+        return False
+
+
+def cached_kickoff(crew, inputs: Optional[dict] = None, label: str = "crew", tokens: float = 0,
+                   bypass: bool = False, validate: Optional[Callable[[str], object]] = None):
+    """
+    ``crew.kickoff(inputs=...)`` answered from the cache when possible.
+
+    Misses run through the shared rate limiter (``tokens`` is the prompt
+    estimate) and are stored if ``validate(raw)`` is truthy (any non-empty
+    response when no validator is given). A cached response that fails
+    ``validate`` is dropped and fetched again. ``bypass=True`` (or
+    REVIFY_LLM_CACHE=0) skips the lookup; the fresh response still replaces
+    the cached one.
+    """
+    def kickoff():
+        return crew.kickoff(inputs=inputs) if inputs else crew.kickoff()
+
+    if not cache_enabled():
+        return throttled_call(kickoff, tokens=tokens, label=label)
+
+    cache = get_llm_cache()
+    key = crew_cache_key(crew, inputs)
+    if bypass:
+        cache._count("bypassed")
+    else:
+        raw = cache.get(key)
+        if raw is not None and not _is_valid(raw, validate):
+            cache.discard(key)
+            cache._count("rejected")
+            logger.warning(f"⚠️ Dropped cached {label} response that failed validation ({key[:12]})")
+            raw = None
+        if raw is not None:
+            cache._count("hits")
+            logger.info(f"💾 Cache hit for {label} ({key[:12]})")
+            return CachedCrewOutput(raw)
+        cache._count("misses")
+
+    start = time.perf_counter()
+    result = throttled_call(kickoff, tokens=tokens, label=label)
+    raw = getattr(result, "raw", None)
+    if raw and _is_valid(raw, validate):
+        cache.put(key, raw, label, time.perf_counter() - start)
+    elif raw:
+        cache._count("rejected")
+        logger.warning(f"⚠️ Not caching {label} response that failed validation ({key[:12]})")
+    return result
@@ -0,0 +1,131 @@
+"""
+Rate limiting and retries for concurrent LLM calls.
+
+Chunk summaries are independent, so they can be requested in parallel, but
+the Gemini quota is per API key, not per job. Every call therefore goes
+through one process-wide limiter:
+
+- a request bucket and a token bucket, refilled continuously at the
+  per-minute quota, so bursts never exceed it
+- ``RateLimitError`` retries with exponential backoff and full jitter, so
+  workers that were throttled together do not retry together
+
+- ``REVIFY_LLM_CONCURRENCY``: LLM calls in flight at once (default 4; 1 is serial)
+- ``REVIFY_LLM_RPM``: requests per minute (default 15, the gemini-2.0-flash free tier)
+- ``REVIFY_LLM_TPM``: input tokens per minute (default 1000000; 0 disables the token bucket)
+- ``REVIFY_LLM_MAX_RETRIES``: retries on RateLimitError (default 5)
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+try:
+    from litellm.exceptions import RateLimitError
+except ImportError:
+    RateLimitError = None
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RPM = 15
+DEFAULT_TPM = 1_000_000
+DEFAULT_MAX_RETRIES = 5
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def llm_concurrency() -> int:
+    return max(1, int(os.getenv("REVIFY_LLM_CONCURRENCY", DEFAULT_CONCURRENCY)))
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    if RateLimitError is not None and isinstance(error, RateLimitError):
+        return True
+    # crewAI sometimes re-raises provider errors as plain exceptions
+    text = str(error).lower()
+    return "ratelimit" in type(error).__name__.lower() or "rate limit" in text or "resource_exhausted" in text
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``capacity`` tokens, refilled at ``rate`` tokens per second"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until ``tokens`` are available and take them; returns the seconds waited"""
+        # A request bigger than the bucket would wait forever; let it drain the bucket instead
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class LLMLimiter:
+    """Request and token budgets shared by every LLM call in the process"""
+
+    def __init__(self, requests_per_minute: float = None, tokens_per_minute: float = None,
+                 max_retries: int = None, base_delay: float = 2.0, max_delay: float = 60.0):
+        rpm = requests_per_minute or float(os.getenv("REVIFY_LLM_RPM", DEFAULT_RPM))
+        tpm = tokens_per_minute if tokens_per_minute is not None else float(os.getenv("REVIFY_LLM_TPM", DEFAULT_TPM))
+        # Capacity of one minute's quota would allow a full-minute burst; a few seconds' worth is enough
+        self.requests = TokenBucket(rpm / 60.0, max(1.0, rpm / 60.0 * 5))
+        self.tokens = TokenBucket(tpm / 60.0, tpm / 60.0 * 5) if tpm > 0 else None
+        self.max_retries = max_retries if max_retries is not None else int(
+            os.getenv("REVIFY_LLM_MAX_RETRIES", DEFAULT_MAX_RETRIES))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def call(self, fn: Callable, tokens: float = 0, label: str = "LLM call"):
+        """Run ``fn()`` within the quota, retrying rate-limit errors with jittered backoff"""
+        for attempt in range(self.max_retries + 1):
+            waited = self.requests.acquire()
+            if self.tokens is not None and tokens:
+                waited += self.tokens.acquire(tokens)
+            if waited > 0.5:
+                logger.info(f"⏳ {label} waited {waited:.1f}s for the rate limiter")
+            try:
+                return fn()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                # Full jitter: anywhere between 0 and the exponential cap
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                logger.warning(f"⚠️ {label} rate limited (attempt {attempt + 1}/{self.max_retries + 1}), "
+                               f"retrying in {delay:.1f}s")
+                print(f"⚠️ Rate limit hit for {label}, retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+
+def get_llm_limiter() -> LLMLimiter:
+    """Process-wide limiter configured from the environment"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = LLMLimiter()
+        return _limiter
+
+
+def throttled_call(fn: Callable, tokens: float = 0, label: str = "LLM call", limiter: Optional[LLMLimiter] = None):
+    return (limiter or get_llm_limiter()).call(fn, tokens=tokens, label=label)
@@ -0,0 +1,152 @@
+"""
+Optional archive of raw review pages for debugging and offline replay.
+
+Pages are handed to a background thread, which hashes, gzips and writes
+them as ``<sha256>.html.gz``. Identical pages are stored once, and the
+oldest captures are pruned beyond a retention cap. ``submit`` only enqueues
+a reference to the page string, so the scraping loop never waits on hashing,
+compression or disk I/O.
+
+The archive is enabled by setting ``REVIFY_PAGE_ARCHIVE_DIR``.
+``REVIFY_PAGE_ARCHIVE_MAX_PAGES`` caps how many pages are kept (default 200).
+When the directory is not set, ``get_page_archive()`` returns None and
+callers skip archiving entirely.
+"""
+
+import atexit
+import gzip
+import hashlib
+import logging
+import os
+import queue
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger('amazon_scraper')
+
+PAGE_SUFFIX = ".html.gz"
+DEFAULT_MAX_PAGES = 200
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+class PageArchive:
+    """Compressed, content-addressed page store written by a background thread"""
+
+    def __init__(self, directory: str, max_pages: int = DEFAULT_MAX_PAGES,
+                 compression_level: int = 6, queue_size: int = 64):
+        self.directory = directory
+        self.max_pages = max_pages
+        self.compression_level = compression_level
+        os.makedirs(directory, exist_ok=True)
+
+        # digest -> path, oldest first
+        self._index = OrderedDict()
+        self._lock = threading.Lock()
+        for path in sorted(self._existing_pages(), key=os.path.getmtime):
+            self._index[os.path.basename(path)[:-len(PAGE_SUFFIX)]] = path
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._worker = threading.Thread(target=self._drain, name="page-archive", daemon=True)
+        self._worker.start()
+
+    def submit(self, html: str) -> bool:
+        """
+        Queue a page for archiving without blocking.
+
+        Returns False when the queue is full and the capture is dropped -
+        debug captures must never slow down scraping.
+        """
+        try:
+            self._queue.put_nowait(html)
+            return True
+        except queue.Full:
+            logger.warning("Page archive queue full, dropping capture")
+            return False
+
+    def flush(self):
+        """Block until every queued page has been written"""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending pages and stop the worker thread"""
+        self.flush()
+        self._queue.put(None)
+        self._worker.join(timeout=5)
+
+    def pages(self):
+        """Paths of archived pages, oldest first"""
+        with self._lock:
+            return list(self._index.values())
+
+    def _existing_pages(self):
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(PAGE_SUFFIX)
+        ]
+
+    def _drain(self):
+        while True:
+            html = self._queue.get()
+            try:
+                if html is None:
+                    return
+                self._write(html)
+            except Exception as e:
+                logger.error(f"Failed to archive page: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, html: str):
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            if digest in self._index:
+                # Duplicate page: refresh its position instead of rewriting it
+                self._index.move_to_end(digest)
+                os.utime(self._index[digest])
+                return
+
+        path = os.path.join(self.directory, digest + PAGE_SUFFIX)
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wb", compresslevel=self.compression_level) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._index[digest] = path
+            while len(self._index) > self.max_pages:
+                _, oldest = self._index.popitem(last=False)
+                try:
+                    os.remove(oldest)
+                except OSError:
+                    pass
+
+
+def read_archived_page(path: str) -> str:
+    """Load an archived page (gzipped or plain) back into a string"""
+    if path.endswith(".gz"):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def get_page_archive() -> Optional[PageArchive]:
+    """Process-wide archive configured from the environment, or None when disabled"""
+    global _archive
+    directory = os.getenv("REVIFY_PAGE_ARCHIVE_DIR")
+    if not directory:
+        return None
+
+    with _archive_lock:
+        if _archive is None:
+            max_pages = int(os.getenv("REVIFY_PAGE_ARCHIVE_MAX_PAGES", DEFAULT_MAX_PAGES))
+            _archive = PageArchive(directory, max_pages=max_pages)
+            atexit.register(_archive.close)
+            logger.info(f"Archiving review pages to {directory} (max {max_pages})")
+    return _archive
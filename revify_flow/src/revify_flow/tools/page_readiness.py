@@ -0,0 +1,140 @@
+"""
+Event-driven readiness checks for Amazon review pages.
+
+The scraping loops used to sleep a fixed 1-2 s before reading each page and
+another 0.5-1 s before clicking Next. These helpers wait on concrete DOM
+signals instead: the review list being present, and after a click the old
+list going stale (or its first review changing) and then being repopulated.
+Every wait has its own timeout, and the time spent is recorded per page in a
+PageWaitMetrics so the logs show how long each page actually took to be ready.
+
+- ``REVIFY_PAGE_READY_TIMEOUT``: seconds to wait for one readiness step (default 10)
+"""
+
+import logging
+import os
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_READY_TIMEOUT = 10
+
+REVIEW_LOCATOR = (By.CSS_SELECTOR, '[data-hook="review"]')
+EMPTY_LIST_LOCATOR = (By.CSS_SELECTOR, '#cm_cr-review_list .no-reviews-section')
+CURRENT_PAGE_LOCATOR = (By.CSS_SELECTOR, '#cm_cr-pagination_bar li.a-selected')
+
+
+def ready_timeout() -> float:
+    return float(os.getenv("REVIFY_PAGE_READY_TIMEOUT", DEFAULT_READY_TIMEOUT))
+
+
+class PageWaitMetrics:
+    """Per-page record of how long each readiness step waited"""
+
+    def __init__(self):
+        self.waits = []  # (page, step, seconds, ok)
+
+    def record(self, page: int, step: str, seconds: float, ok: bool):
+        self.waits.append((page, step, seconds, ok))
+        logger.info(f"⏱️ Page {page} {step} wait: {seconds * 1000:.0f} ms{'' if ok else ' (timed out)'}")
+
+    def summary(self) -> dict:
+        if not self.waits:
+            return {"pages": 0, "total_s": 0.0, "avg_ms": 0.0, "max_ms": 0.0, "timeouts": 0}
+        per_page = {}
+        for page, _, seconds, _ in self.waits:
+            per_page[page] = per_page.get(page, 0.0) + seconds
+        total = sum(per_page.values())
+        return {
+            "pages": len(per_page),
+            "total_s": round(total, 3),
+            "avg_ms": round(total / len(per_page) * 1000, 1),
+            "max_ms": round(max(per_page.values()) * 1000, 1),
+            "timeouts": sum(1 for *_, ok in self.waits if not ok),
+        }
+
+    def log_summary(self):
+        s = self.summary()
+        logger.info(
+            f"📊 Page readiness: {s['pages']} pages, {s['total_s']:.2f} s waiting "
+            f"(avg {s['avg_ms']:.0f} ms, max {s['max_ms']:.0f} ms, {s['timeouts']} timeouts)"
+        )
+
+
+def _current_page_marker(driver):
+    """First review id plus the selected page number, used to detect a page change"""
+    try:
+        reviews = driver.find_elements(*REVIEW_LOCATOR)
+        first_id = reviews[0].get_attribute("id") if reviews else None
+        selected = driver.find_elements(*CURRENT_PAGE_LOCATOR)
+        page_text = selected[0].text.strip() if selected else None
+        return first_id, page_text
+    except StaleElementReferenceException:
+        return None, None
+
+
+class _page_changed:
+    """Condition: the old review list went stale or now shows a different page"""
+
+    def __init__(self, old_element, old_marker):
+        self.old_element = old_element
+        self.old_marker = old_marker
+
+    def __call__(self, driver):
+        if self.old_element is not None and EC.staleness_of(self.old_element)(driver):
+            return True
+        marker = _current_page_marker(driver)
+        return marker[0] is not None and marker != self.old_marker
+
+
+def wait_for_reviews(driver, timeout: float = None, metrics: PageWaitMetrics = None, page: int = 1) -> bool:
+    """Wait until the review list is populated (or explicitly empty)"""
+    timeout = ready_timeout() if timeout is None else timeout
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            EC.any_of(
+                EC.presence_of_element_located(REVIEW_LOCATOR),
+                EC.presence_of_element_located(EMPTY_LIST_LOCATOR),
+            )
+        )
+        ok = True
+    except TimeoutException:
+        ok = False
+
+    if metrics is not None:
+        metrics.record(page, "ready", time.perf_counter() - start, ok)
+    return ok
+
+
+def click_next_and_wait(driver, next_button, timeout: float = None,
+                        metrics: PageWaitMetrics = None, page: int = 2) -> bool:
+    """
+    Click Next and wait for the following page to be rendered.
+
+    Waits for the current list to go stale or change page, then for the new
+    reviews to appear. Returns False if either step timed out.
+    """
+    timeout = ready_timeout() if timeout is None else timeout
+    current = driver.find_elements(*REVIEW_LOCATOR)
+    old_element = current[0] if current else None
+    old_marker = _current_page_marker(driver)
+
+    start = time.perf_counter()
+    next_button.click()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(_page_changed(old_element, old_marker))
+        ok = True
+    except TimeoutException:
+        ok = False
+
+    if metrics is not None:
+        metrics.record(page, "navigation", time.perf_counter() - start, ok)
+    if not ok:
+        return False
+    return wait_for_reviews(driver, timeout, metrics, page)
@@ -0,0 +1,165 @@
+"""
+Compact prompt encoding for review payloads.
+
+Prompts used to carry reviews as ``json.dumps(..., indent=2)`` or as the
+repr of a list of dicts, repeating every key and the constant product name
+and brand on each row. ``encode_reviews`` hoists fields that are the same
+for every review into a header and writes one pipe-separated line per
+review::
+
+    Product: Boat Rockerz 450 | Brand: Amazon
+    id|rating|title|text
+    1|5|Great bass|Sound is punchy and the battery lasts all week
+    2|2|Broke in a month|Left ear cup stopped working
+
+``prompt_savings`` compares the encoding with the legacy repr, so callers
+can report the tokens saved per call. ``record_prompt_savings`` adds them
+to the process-wide meter (``get_prompt_savings()``, logged per run) and to
+the meter of the job that made the call (``track_prompt_savings()``), which
+API results carry.
+"""
+
+import logging
+import re
+import threading
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+from src.revify_flow.tools.chunk_planner import get_tokenizer
+
+logger = logging.getLogger('amazon_scraper')
+
+# Column -> header label for fields hoisted when constant across the payload
+HEADER_FIELDS = {"name": "Product", "brand": "Brand"}
+
+_SEPARATORS = re.compile(r"[|\r\n]+")
+
+_meter = None
+_meter_lock = threading.Lock()
+_job_meter: ContextVar = ContextVar("revify_job_prompt_savings", default=None)
+
+
+def cell(value) -> str:
+    """One field on one line: no newlines, no column separators"""
+    if value is None or value != value:  # None or NaN
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return _SEPARATORS.sub(" ", str(value)).strip()
+
+
+def review_line(review: dict, review_id: int = 0) -> str:
+    """The compact line for one review"""
+    return "|".join((
+        str(review_id),
+        cell(review.get("reviews.rating")),
+        cell(review.get("reviews.title")),
+        cell(review.get("reviews.text")),
+    ))
+
+
+def encode_reviews(reviews: List[dict]) -> str:
+    """Header of constant fields, a column line, then one line per review"""
+    header = []
+    for field, label in HEADER_FIELDS.items():
+        values = {cell(r.get(field)) for r in reviews}
+        if len(values) == 1 and "" not in values:
+            header.append(f"{label}: {values.pop()}")
+        else:
+            # Not constant: keep the field per review, in front of the title
+            reviews = [
+                dict(r, **{"reviews.title": f"[{cell(r.get(field))}] {cell(r.get('reviews.title'))}"})
+                for r in reviews
+            ]
+
+    lines = []
+    if header:
+        lines.append(" | ".join(header))
+    lines.append("id|rating|title|text")
+    lines.extend(review_line(review, i) for i, review in enumerate(reviews, start=1))
+    return "\n".join(lines)
+
+
+def prompt_savings(reviews: List[dict], encoded: Optional[str] = None,
+                   tokenizer: Optional[Callable[[str], int]] = None) -> dict:
+    """Tokens of the legacy list-of-dicts payload vs. the compact encoding"""
+    tokenizer = tokenizer or get_tokenizer()
+    before = tokenizer(str(reviews))
+    after = tokenizer(encoded if encoded is not None else encode_reviews(reviews))
+    return {
+        "reviews": len(reviews),
+        "legacy_tokens": before,
+        "compact_tokens": after,
+        "saved_tokens": before - after,
+        "saved_pct": round((before - after) / before * 100, 1) if before else 0.0,
+    }
+
+
+def log_prompt_savings(savings: dict, label: str = "prompt"):
+    logger.info(
+        f"🗜️ Compact {label}: {savings['compact_tokens']} tokens instead of {savings['legacy_tokens']} "
+        f"({savings['saved_tokens']} saved, {savings['saved_pct']}%) for {savings['reviews']} reviews"
+    )
+
+
+def _with_pct(totals: dict) -> dict:
+    before = totals["legacy_tokens"]
+    totals["saved_pct"] = round(totals["saved_tokens"] / before * 100, 1) if before else 0.0
+    return totals
+
+
+class PromptSavingsMeter:
+    """Running totals of ``prompt_savings`` results, safe to share between threads"""
+
+    FIELDS = ("prompts", "reviews", "legacy_tokens", "compact_tokens", "saved_tokens")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, savings: dict):
+        with self._lock:
+            self._totals["prompts"] += 1
+            for field in self.FIELDS[1:]:
+                self._totals[field] += savings[field]
+
+    def totals(self) -> dict:
+        with self._lock:
+            return _with_pct(dict(self._totals))
+
+    def log_summary(self):
+        totals = self.totals()
+        message = (f"🗜️ Compact prompts: {totals['saved_tokens']} tokens saved ({totals['saved_pct']}%) "
+                   f"over {totals['prompts']} prompts / {totals['reviews']} reviews")
+        logger.info(message)
+        print(message)
+
+
+def get_prompt_savings() -> PromptSavingsMeter:
+    """Process-wide savings meter"""
+    global _meter
+    with _meter_lock:
+        if _meter is None:
+            _meter = PromptSavingsMeter()
+        return _meter
+
+
+def track_prompt_savings() -> PromptSavingsMeter:
+    """
+    Start a job meter in the current context and return it.
+
+    Each API job runs in its own thread, so concurrent jobs count only their
+    own prompts. Worker pools must run calls in the caller's context
+    (``contextvars.copy_context().run``) for them to be counted.
+    """
+    meter = PromptSavingsMeter()
+    _job_meter.set(meter)
+    return meter
+
+
+def record_prompt_savings(savings: dict):
+    """Add one prompt's savings to the process-wide meter and the current job's"""
+    get_prompt_savings().add(savings)
+    job_meter = _job_meter.get()
+    if job_meter is not None:
+        job_meter.add(savings)
@@ -0,0 +1,203 @@
+"""
+Indexed catalog of saved feature analyses.
+
+Finding a free output/feature_analysis_N.json meant probing the filesystem,
+and every report re-listed output/ and re-parsed each file. Each analysis is
+now recorded here when it is written: product key, time, features, review
+count, file location and the one-paragraph verdict summary. Listing results,
+looking up the latest analysis of a product and producing
+product_summaries.json are indexed queries that never open the JSON files.
+
+- ``REVIFY_RESULTS_DB``: database path (default ``revify_results.db``)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from src.revify_flow.tools.columnar_store import FEATURE_ANALYSES, read_dataset
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_DB_PATH = "revify_results.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_key  TEXT,
+    product_name TEXT,
+    created_at   REAL NOT NULL,
+    features     TEXT NOT NULL,
+    review_count INTEGER,
+    path         TEXT NOT NULL UNIQUE,
+    job_id       TEXT,
+    summary      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_product_created ON results (product_key, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_created ON results (created_at);
+"""
+
+_COLUMNS = "id, product_key, product_name, created_at, features, review_count, path, job_id, summary"
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def verdict_summary(analyses: List[dict]) -> str:
+    """
+    Converts a list of feature-wise verdicts into a coherent single-paragraph summary.
+    """
+    paragraph_parts = []
+    for i, item in enumerate(analyses):
+        verdict = str(item.get("verdict", "")).strip()
+        if verdict:
+            if i == 0:
+                paragraph_parts.append(verdict)
+            else:
+                paragraph_parts.append(verdict[0].upper() + verdict[1:])
+    return ' '.join(paragraph_parts)
+
+
+def _row_to_dict(row) -> dict:
+    result_id, product_key, product_name, created_at, features, review_count, path, job_id, summary = row
+    return {
+        "id": result_id,
+        "product_key": product_key,
+        "product_name": product_name,
+        "created_at": created_at,
+        "features": json.loads(features),
+        "review_count": review_count,
+        "path": path,
+        "filename": os.path.basename(path),
+        "job_id": job_id,
+        "summary": summary,
+    }
+
+
+class ResultsCatalog:
+    """SQLite index of analysis result files, safe to share between threads"""
+
+    def __init__(self, path: str = None):
+        self.path = os.path.abspath(path or os.getenv("REVIFY_RESULTS_DB", DEFAULT_DB_PATH))
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not cross threads, so keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def record(self, path: str, analyses: List[dict], product_key: str = None, product_name: str = None,
+               review_count: int = None, job_id: str = None, created_at: float = None) -> int:
+        """Catalog a saved analysis file; re-recording the same path replaces its entry"""
+        features = [str(a.get("feature", "")) for a in analyses]
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT OR REPLACE INTO results (product_key, product_name, created_at, features, "
+                "review_count, path, job_id, summary) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (product_key, product_name, created_at or time.time(), json.dumps(features, ensure_ascii=False),
+                 review_count, os.path.abspath(path), job_id, verdict_summary(analyses)),
+            )
+        logger.info(f"🗂️ Cataloged {len(features)} feature analyses for {product_key} at {path}")
+        return cursor.lastrowid
+
+    def list_results(self, product_key: str = None, limit: int = None) -> List[dict]:
+        """Cataloged analyses, newest first, optionally for one product"""
+        query = f"SELECT {_COLUMNS} FROM results"
+        params = []
+        if product_key:
+            query += " WHERE product_key = ?"
+            params.append(product_key)
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [_row_to_dict(row) for row in self._connect().execute(query, params)]
+
+    def latest(self, product_key: str) -> Optional[dict]:
+        results = self.list_results(product_key, limit=1)
+        return results[0] if results else None
+
+    def known_paths(self) -> set:
+        return {row[0] for row in self._connect().execute("SELECT path FROM results")}
+
+    def summaries(self) -> dict:
+        """Result path -> verdict summary, oldest first (workspaces reuse file names, so not the basename)"""
+        rows = self._connect().execute("SELECT path, summary FROM results ORDER BY created_at, id")
+        return dict(rows.fetchall())
+
+    def import_columnar(self) -> int:
+        """
+        Catalog analyses found in the columnar feature_analyses dataset.
+
+        Every row carries the JSON file it was saved with, so analyses written
+        alongside a Parquet copy are cataloged (with their product) from one
+        projected read instead of opening each file. Paths already cataloged
+        are skipped. Returns 0 when pyarrow or the dataset is missing.
+        """
+        columns = ["product_key", "source", "created_at", "position", "feature", "sentiment",
+                   "verdict", "key_points"]
+        df = read_dataset(FEATURE_ANALYSES, columns=columns)
+        if df.empty:
+            return 0
+        known = self.known_paths()
+        imported = 0
+        for source, rows in df[df["source"] != ""].groupby("source", sort=False):
+            path = os.path.abspath(source)
+            if path in known:
+                continue
+            rows = rows.sort_values("position")
+            analyses = [
+                {"feature": row.feature, "sentiment": row.sentiment, "verdict": row.verdict,
+                 "key_points": json.loads(row.key_points or "[]")}
+                for row in rows.itertuples()
+            ]
+            self.record(path, analyses, product_key=rows["product_key"].iloc[0],
+                        created_at=float(rows["created_at"].iloc[0]))
+            imported += 1
+        return imported
+
+    def import_directory(self, directory: str) -> int:
+        """
+        Catalog analysis JSON files written before the catalog existed.
+
+        Files already cataloged are skipped. Their product is unknown, so
+        product_key stays NULL.
+        """
+        if not os.path.isdir(directory):
+            return 0
+        known = self.known_paths()
+        imported = 0
+        for filename in sorted(os.listdir(directory)):
+            path = os.path.abspath(os.path.join(directory, filename))
+            if not filename.endswith(".json") or path in known:
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    analyses = json.load(f)
+                if not isinstance(analyses, list):
+                    raise ValueError("not a list of feature analyses")
+                self.record(path, analyses, created_at=os.path.getmtime(path))
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Skipping {filename}: {e}")
+        return imported
+
+
+def get_results_catalog(path: Optional[str] = None) -> ResultsCatalog:
+    """Process-wide catalog for ``path`` (default from REVIFY_RESULTS_DB)"""
+    path = os.path.abspath(path or os.getenv("REVIFY_RESULTS_DB", DEFAULT_DB_PATH))
+    with _catalogs_lock:
+        if path not in _catalogs:
+            _catalogs[path] = ResultsCatalog(path)
+        return _catalogs[path]
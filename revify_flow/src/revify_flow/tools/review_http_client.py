@@ -0,0 +1,92 @@
+"""
+HTTP fast path for review pagination.
+
+Once the browser has logged in, its cookies and user agent are copied into a
+pooled ``requests.Session``. Review pages are then fetched directly by page
+number, with no rendering, fixed sleeps or waiting for the next button.
+Responses that look like a sign-in wall or CAPTCHA raise ReviewFetchError so
+the caller can fall back to Selenium.
+
+``REVIFY_REVIEW_BASE_URL`` overrides the host the pages are fetched from, e.g.
+a local stand-in server serving captured pages.
+"""
+
+import logging
+import os
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.revify_flow.tools.amazon_urls import build_review_url
+
+logger = logging.getLogger('amazon_scraper')
+
+# Markers of pages that are not a review list
+BLOCKED_MARKERS = ("captcha", "type the characters", "auth-mfa", 'id="ap_email"')
+
+
+class ReviewFetchError(Exception):
+    """Raised when a review page cannot be fetched over plain HTTP"""
+
+
+class ReviewHttpSession:
+    """Pooled HTTP session that fetches review pages by page number"""
+
+    def __init__(self, base: str, user_agent: Optional[str] = None,
+                 pool_size: int = 8, timeout: float = 15.0):
+        self.base = os.getenv("REVIFY_REVIEW_BASE_URL") or base
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.session.headers.update({
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+    @classmethod
+    def from_driver(cls, driver, base: str, pool_size: int = 8):
+        """Build a session carrying the logged-in browser's cookies and user agent"""
+        try:
+            user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception:
+            user_agent = None
+
+        http = cls(base, user_agent=user_agent, pool_size=pool_size)
+        for cookie in driver.get_cookies():
+            http.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+        logger.info(f"HTTP session created with {len(http.session.cookies)} browser cookies")
+        return http
+
+    def fetch_review_page(self, asin: str, page_number: int, sort_by: Optional[str] = None) -> str:
+        """Return the HTML of one review list page or raise ReviewFetchError"""
+        url = build_review_url(self.base, asin, page_number, sort_by=sort_by)
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ReviewFetchError(f"Request for page {page_number} failed: {e}") from e
+
+        if response.status_code != 200:
+            raise ReviewFetchError(f"Page {page_number} returned HTTP {response.status_code}")
+
+        html = response.text
+        lowered = html[:200_000].lower()
+        if 'data-hook="review"' not in html and any(marker in lowered for marker in BLOCKED_MARKERS):
+            raise ReviewFetchError(f"Page {page_number} was blocked (sign-in or CAPTCHA)")
+        return html
+
+    def close(self):
+        self.session.close()
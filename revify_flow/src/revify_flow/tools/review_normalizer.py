@@ -0,0 +1,105 @@
+"""
+Vectorized clean-up of scraped reviews before they reach the LLM.
+
+Works on DataFrames with the scraped_reviews.csv columns and uses only
+pandas/NumPy column operations, so a batch of thousands of reviews is
+normalized in milliseconds:
+
+- parse the star rating out of the "5.0 out of 5 stars" title prefix when the
+  rating column is missing, then strip that prefix from the title
+- strip Amazon boilerplate ("Read more", "The media could not be loaded.") and
+  collapse whitespace
+- drop reviews with neither title nor text
+- drop exact and near-exact duplicates (same title and text after lowercasing
+  and removing punctuation)
+- add ``reviews.length`` (characters) and ``reviews.tokens`` (estimated tokens)
+"""
+
+import logging
+from typing import List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('amazon_scraper')
+
+TITLE_COL = "reviews.title"
+TEXT_COL = "reviews.text"
+RATING_COL = "reviews.rating"
+
+# Same crude ratio as main.estimate_tokens (average word = 1.3 tokens)
+TOKENS_PER_WORD = 1.3
+
+_STARS_PREFIX = r"^\s*(\d(?:[.,]\d)?)\s+out of 5 stars\s*"
+_BOILERPLATE = r"The media could not be loaded\.|\s*Read more\s*$"
+_NON_ALNUM = r"[\W_]+"
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    return (
+        series.fillna("")
+        .astype(str)
+        .str.replace(_BOILERPLATE, " ", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def normalize_reviews(df: pd.DataFrame, seen_keys: Optional[Set[str]] = None) -> pd.DataFrame:
+    """
+    Return a cleaned, deduplicated copy of ``df``.
+
+    ``seen_keys`` carries the dedup keys across calls when reviews arrive in
+    batches (streamed pages). It is updated in place.
+    """
+    rows_in = len(df)
+    df = df.copy()
+
+    titles = df[TITLE_COL].fillna("").astype(str) if TITLE_COL in df else pd.Series("", index=df.index)
+
+    # Rating from the title prefix where the column is missing or zero
+    title_ratings = pd.to_numeric(
+        titles.str.extract(_STARS_PREFIX, expand=False).str.replace(",", ".", regex=False),
+        errors="coerce",
+    )
+    ratings = pd.to_numeric(df[RATING_COL], errors="coerce") if RATING_COL in df else title_ratings
+    df[RATING_COL] = ratings.where(ratings > 0, title_ratings).fillna(0.0)
+    if "reviews.doRecommend" in df:
+        df["reviews.doRecommend"] = df[RATING_COL] >= 4
+
+    df[TITLE_COL] = _clean_text(titles.str.replace(_STARS_PREFIX, "", regex=True))
+    df[TEXT_COL] = _clean_text(df[TEXT_COL]) if TEXT_COL in df else ""
+
+    # Nothing to analyse
+    df = df[(df[TITLE_COL] != "") | (df[TEXT_COL] != "")]
+
+    # Exact and near-exact duplicates share a key once case and punctuation are gone
+    dedup_key = (
+        (df[TITLE_COL] + " " + df[TEXT_COL])
+        .str.lower()
+        .str.replace(_NON_ALNUM, " ", regex=True)
+        .str.strip()
+    )
+    keep = ~dedup_key.duplicated()
+    if seen_keys is not None:
+        keep &= ~dedup_key.isin(seen_keys)
+        seen_keys.update(dedup_key[keep])
+    df = df[keep]
+
+    df["reviews.length"] = df[TEXT_COL].str.len()
+    words = df[TITLE_COL].str.count(r"\S+") + df[TEXT_COL].str.count(r"\S+")
+    df["reviews.tokens"] = np.ceil(words * TOKENS_PER_WORD).astype(int)
+
+    dropped = rows_in - len(df)
+    if dropped:
+        logger.info(f"🧹 Normalized {rows_in} reviews: dropped {dropped} empty or duplicate")
+    return df.reset_index(drop=True)
+
+
+def normalize_review_dicts(review_dicts: List[dict], seen_keys: Optional[Set[str]] = None) -> List[dict]:
+    """normalize_reviews for the list-of-dicts form the summarizers consume"""
+    if not review_dicts:
+        return []
+    columns = list(review_dicts[0].keys())
+    df = normalize_reviews(pd.DataFrame(review_dicts), seen_keys=seen_keys)
+    return df[columns].to_dict(orient='records')
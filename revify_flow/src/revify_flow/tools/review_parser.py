@@ -0,0 +1,217 @@
+"""
+Review page parsers for the Amazon scraper.
+
+Amazon review pages are ~870 KB of HTML, but the reviews themselves live in a
+single ``cm_cr-review_list`` section that is roughly a tenth of that. Every
+backend here slices that section out of the raw page source first and then
+walks each ``data-hook="review"`` container once, emitting one aligned
+ReviewRecord per review (title, body, rating, date, verified flag, helpful
+votes and review id).
+
+Backends (fastest first):
+- ``selectolax``: Lexbor-based CSS engine (optional dependency)
+- ``lxml``: libxml2 HTML parser with XPath (optional dependency)
+- ``html.parser``: BeautifulSoup with the stdlib parser (always available)
+
+The backend can be forced with the ``REVIFY_PARSER_BACKEND`` environment variable.
+"""
+
+import os
+import re
+import logging
+from typing import Dict, List
+
+from bs4 import BeautifulSoup
+from src.revify_flow.tools.review_record import (
+    ReviewRecord, parse_helpful_votes, parse_rating, parse_review_date
+)
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger('amazon_scraper')
+
+# Markers delimiting the review list inside the full page source
+REVIEW_SECTION_START = 'id="cm_cr-review_list"'
+REVIEW_SECTION_END = 'id="cm_cr-pagination_bar"'
+
+REVIEW_HOOK = "review"
+TITLE_HOOK = "review-title"
+BODY_HOOK = "review-body"
+DATE_HOOK = "review-date"
+VERIFIED_HOOK = "avp-badge"
+HELPFUL_HOOK = "helpful-vote-statement"
+# Regional reviews use the cmps- variant of the star widget
+STAR_HOOKS = ("review-star-rating", "cmps-review-star-rating")
+
+# Every field a review container can carry, keyed by its data-hook
+FIELD_HOOKS = frozenset((TITLE_HOOK, BODY_HOOK, DATE_HOOK, VERIFIED_HOOK, HELPFUL_HOOK) + STAR_HOOKS)
+
+
+def clean_text(text: str) -> str:
+    """Strip each line and drop blank ones so every backend yields identical text"""
+    return "\n".join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def extract_review_section(html: str) -> str:
+    """
+    Return the slice of the page source that holds the review list.
+
+    Falls back to the full document when the markers are missing (e.g. Amazon
+    changed the layout), so parsing never silently returns nothing.
+    """
+    start = html.find(REVIEW_SECTION_START)
+    if start == -1:
+        return html
+    start = html.rfind("<", 0, start)
+
+    end = html.find(REVIEW_SECTION_END, start)
+    if end == -1:
+        return html[start:]
+    return html[start:html.rfind("<", start, end)]
+
+
+def has_next_page(html: str) -> bool:
+    """
+    True when the pagination bar offers an enabled "Next page" link.
+
+    A plain substring check on the pagination bar, so pagination decisions
+    never need a second parse of the page.
+    """
+    start = html.find(REVIEW_SECTION_END)
+    if start == -1:
+        return False
+    bar = html[start:html.find("</ul>", start)]
+    return "a-last" in bar and "a-disabled a-last" not in bar
+
+
+# "47% of reviews have 5 stars" on each row of the rating histogram
+_HISTOGRAM_ROW = re.compile(r'(\d+)% of reviews have (\d) stars?')
+_STAR_FILTER_NAMES = {5: "five_star", 4: "four_star", 3: "three_star", 2: "two_star", 1: "one_star"}
+
+
+def parse_rating_histogram(html: str) -> Dict[str, float]:
+    """Star filter -> percent of reviews, read from the page's rating histogram (empty if absent)"""
+    histogram = {}
+    for percent, stars in _HISTOGRAM_ROW.findall(html):
+        name = _STAR_FILTER_NAMES.get(int(stars))
+        if name:
+            histogram.setdefault(name, float(percent))
+    return histogram
+
+
+def build_record(review_id: str, fields: Dict[str, str]) -> ReviewRecord:
+    """Turn the hook -> text mapping of one review container into a ReviewRecord"""
+    star_text = next((fields[hook] for hook in STAR_HOOKS if hook in fields), "")
+    return ReviewRecord(
+        review_id=review_id or "",
+        title=fields.get(TITLE_HOOK, ""),
+        body=fields.get(BODY_HOOK, ""),
+        rating=parse_rating(star_text),
+        date=parse_review_date(fields.get(DATE_HOOK)),
+        verified=VERIFIED_HOOK in fields,
+        helpful_votes=parse_helpful_votes(fields.get(HELPFUL_HOOK)),
+    )
+
+
+class SoupReviewParser:
+    """BeautifulSoup + html.parser backend (pure Python fallback)"""
+
+    name = "html.parser"
+
+    def parse(self, html: str) -> List[ReviewRecord]:
+        soup = BeautifulSoup(extract_review_section(html), "html.parser")
+        records = []
+        for container in soup.find_all(attrs={"data-hook": REVIEW_HOOK}):
+            fields = {}
+            # Single walk over the container, keeping the first match per hook
+            for tag in container.find_all(attrs={"data-hook": FIELD_HOOKS.__contains__}):
+                hook = tag["data-hook"]
+                if hook not in fields:
+                    fields[hook] = clean_text(tag.get_text())
+            records.append(build_record(container.get("id"), fields))
+        return records
+
+
+class LxmlReviewParser:
+    """lxml backend walking each review container with XPath"""
+
+    name = "lxml"
+
+    def parse(self, html: str) -> List[ReviewRecord]:
+        section = extract_review_section(html)
+        if not section.strip():
+            return []
+
+        root = lxml.html.fromstring(section)
+        records = []
+        for container in root.xpath(f'//*[@data-hook="{REVIEW_HOOK}"]'):
+            fields = {}
+            for node in container.xpath(".//*[@data-hook]"):
+                hook = node.get("data-hook")
+                if hook in FIELD_HOOKS and hook not in fields:
+                    fields[hook] = clean_text(node.text_content())
+            records.append(build_record(container.get("id"), fields))
+        return records
+
+
+class SelectolaxReviewParser:
+    """selectolax (Lexbor) backend walking each review container with CSS"""
+
+    name = "selectolax"
+
+    def parse(self, html: str) -> List[ReviewRecord]:
+        tree = LexborHTMLParser(extract_review_section(html))
+        records = []
+        for container in tree.css(f'[data-hook="{REVIEW_HOOK}"]'):
+            fields = {}
+            for node in container.css("[data-hook]"):
+                hook = node.attributes.get("data-hook")
+                if hook in FIELD_HOOKS and hook not in fields:
+                    fields[hook] = clean_text(node.text(deep=True))
+            records.append(build_record(container.attributes.get("id"), fields))
+        return records
+
+
+# Registry in order of preference
+PARSER_BACKENDS = {
+    "selectolax": (SelectolaxReviewParser, SELECTOLAX_AVAILABLE),
+    "lxml": (LxmlReviewParser, LXML_AVAILABLE),
+    "html.parser": (SoupReviewParser, True),
+}
+
+
+def available_backends() -> List[str]:
+    """Names of the parser backends usable in this environment"""
+    return [name for name, (_, available) in PARSER_BACKENDS.items() if available]
+
+
+def get_review_parser(backend: str = None):
+    """
+    Return a parser instance for the requested backend.
+
+    With no backend given, ``REVIFY_PARSER_BACKEND`` is consulted and then the
+    fastest installed engine is used. Unknown or unavailable backends fall back
+    to ``html.parser`` with a warning instead of failing the scrape.
+    """
+    backend = backend or os.getenv("REVIFY_PARSER_BACKEND")
+
+    if backend:
+        parser_cls, available = PARSER_BACKENDS.get(backend, (None, False))
+        if parser_cls and available:
+            return parser_cls()
+        logger.warning(f"Parser backend '{backend}' not available, falling back to html.parser")
+        return SoupReviewParser()
+
+    name = available_backends()[0]
+    parser_cls, _ = PARSER_BACKENDS[name]
+    return parser_cls()
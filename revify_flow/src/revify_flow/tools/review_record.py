@@ -0,0 +1,88 @@
+"""
+Compact per-review record emitted by the review parsers.
+"""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+_RATING_PATTERN = re.compile(r"(\d+(?:[.,]\d+)?)")
+_HELPFUL_PATTERN = re.compile(r"([\d,]+)\s+(?:people|person)")
+_DATE_PATTERN = re.compile(r"\bon\s+(.+)$")
+_DATE_FORMATS = ("%d %B %Y", "%B %d, %Y", "%d %b %Y", "%b %d, %Y")
+
+
+class ReviewRecord:
+    """
+    A single scraped review.
+
+    Uses ``__slots__`` so a few thousand records stay small and attribute
+    access stays fast when they are fanned out to CSV, storage and prompts.
+    """
+
+    __slots__ = ("review_id", "title", "body", "rating", "date", "verified", "helpful_votes")
+
+    def __init__(
+        self,
+        review_id: str = "",
+        title: str = "",
+        body: str = "",
+        rating: float = 0.0,
+        date: str = "",
+        verified: bool = False,
+        helpful_votes: int = 0,
+    ):
+        self.review_id = review_id
+        self.title = title
+        self.body = body
+        self.rating = rating
+        self.date = date
+        self.verified = verified
+        self.helpful_votes = helpful_votes
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ReviewRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"ReviewRecord(review_id={self.review_id!r}, rating={self.rating}, title={self.title[:30]!r})"
+
+
+def parse_rating(text: Optional[str]) -> float:
+    """'4.0 out of 5 stars' -> 4.0 (0.0 when missing)"""
+    if not text:
+        return 0.0
+    match = _RATING_PATTERN.search(text)
+    return float(match.group(1).replace(",", ".")) if match else 0.0
+
+
+def parse_helpful_votes(text: Optional[str]) -> int:
+    """'One person found this helpful' -> 1, '1,204 people found this helpful' -> 1204"""
+    if not text:
+        return 0
+    match = _HELPFUL_PATTERN.search(text)
+    if match:
+        return int(match.group(1).replace(",", ""))
+    return 1 if text.lower().startswith("one ") else 0
+
+
+def parse_review_date(text: Optional[str]) -> str:
+    """
+    'Reviewed in India on 5 November 2025' -> '2025-11-05'.
+
+    Returns the original text when the date format is not recognised.
+    """
+    if not text:
+        return ""
+    match = _DATE_PATTERN.search(text)
+    raw_date = match.group(1).strip() if match else text.strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(raw_date, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return text.strip()
@@ -0,0 +1,273 @@
+"""
+Durable, indexed store of scraped reviews keyed by product and review id.
+
+Every scrape used to overwrite a single scraped_reviews.csv in the working
+directory, and every consumer re-read the whole file. Reviews are now upserted
+into an embedded SQLite database instead:
+
+- primary key (product_key, review_id): re-scraping a product updates rows in place
+- bulk inserts go through one ``executemany`` per scrape
+- analyses read their product's slice with an indexed query
+- WAL mode lets concurrent jobs write different products without clobbering each other
+
+Rows are keyed by ``amazon_urls.product_key`` (e.g. 'amazon.in:B01N54ZM9W').
+Databases from before schema version 2 named that column ``asin`` and held
+bare ASINs; they are migrated on open (see ``migrate``).
+
+- ``REVIFY_REVIEW_DB``: database path (default ``revify_reviews.db``)
+- ``REVIFY_LEGACY_MARKETPLACE``: marketplace for bare-ASIN rows during migration (default ``amazon.in``)
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Set
+
+import pandas as pd
+
+from src.revify_flow.tools.review_record import ReviewRecord
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_DB_PATH = "revify_reviews.db"
+DEFAULT_LEGACY_MARKETPLACE = "amazon.in"
+SCHEMA_VERSION = 2  # PRAGMA user_version; 2 renamed asin -> product_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    product_key   TEXT NOT NULL,
+    review_id     TEXT NOT NULL,
+    product_name  TEXT,
+    title         TEXT,
+    body          TEXT,
+    rating        REAL,
+    review_date   TEXT,
+    verified      INTEGER,
+    helpful_votes INTEGER,
+    scraped_at    REAL NOT NULL,
+    PRIMARY KEY (product_key, review_id)
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_product_scraped ON reviews (product_key, scraped_at);
+CREATE TABLE IF NOT EXISTS crawls (
+    product_key    TEXT PRIMARY KEY,
+    product_name   TEXT,
+    source_url     TEXT,
+    crawled_at     REAL NOT NULL,
+    target_reviews INTEGER,
+    review_count   INTEGER
+);
+"""
+
+_UPSERT = """
+INSERT INTO reviews (product_key, review_id, product_name, title, body, rating,
+                     review_date, verified, helpful_votes, scraped_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (product_key, review_id) DO UPDATE SET
+    product_name  = excluded.product_name,
+    title         = excluded.title,
+    body          = excluded.body,
+    rating        = excluded.rating,
+    review_date   = excluded.review_date,
+    verified      = excluded.verified,
+    helpful_votes = excluded.helpful_votes,
+    scraped_at    = excluded.scraped_at
+"""
+
+# Newest scrape first, then page order within a scrape
+_ORDER = "ORDER BY scraped_at DESC, rowid"
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def stable_review_id(record: ReviewRecord) -> str:
+    """The Amazon review id, or a content hash for reviews that did not expose one"""
+    if record.review_id:
+        return record.review_id
+    digest = hashlib.sha1(f"{record.title}\x1f{record.body}".encode("utf-8")).hexdigest()
+    return f"h{digest[:16]}"
+
+
+def reviews_before_known(records: Iterable[ReviewRecord], known_ids: Set[str]) -> List[ReviewRecord]:
+    """The leading records of a newest-first page that are not stored yet, compared by stored id"""
+    fresh = []
+    for record in records:
+        if stable_review_id(record) in known_ids:
+            break
+        fresh.append(record)
+    return fresh
+
+
+_BARE_ASIN = re.compile(r"^[A-Z0-9]{10}$")
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def migrate(conn: sqlite3.Connection):
+    """
+    Bring a database up to SCHEMA_VERSION.
+
+    Older stores named the key column ``asin``, and rows written before
+    canonical product keys hold a bare ASIN that lookups by product_key never
+    find. The column is renamed and those rows are rekeyed to
+    '<marketplace>:<ASIN>'. A review already stored under the new key wins.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            for table in ("reviews", "crawls"):
+                if "asin" in _columns(conn, table):
+                    conn.execute(f"ALTER TABLE {table} RENAME COLUMN asin TO product_key")
+            conn.execute("DROP INDEX IF EXISTS idx_reviews_asin_scraped")
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+
+            marketplace = os.getenv("REVIFY_LEGACY_MARKETPLACE", DEFAULT_LEGACY_MARKETPLACE)
+            keys = {row[0] for row in conn.execute("SELECT DISTINCT product_key FROM reviews")}
+            keys |= {row[0] for row in conn.execute("SELECT product_key FROM crawls")}
+            rekeyed = 0
+            for old in filter(_BARE_ASIN.match, keys):
+                new = f"{marketplace}:{old}"
+                for table in ("reviews", "crawls"):
+                    rekeyed += conn.execute(
+                        f"UPDATE OR IGNORE {table} SET product_key = ? WHERE product_key = ?", (new, old)
+                    ).rowcount
+                    conn.execute(f"DELETE FROM {table} WHERE product_key = ?", (old,))
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            if rekeyed:
+                logger.info(f"🗄️ Migrated review store to schema {SCHEMA_VERSION}, rekeyed {rekeyed} bare-ASIN rows")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+class ReviewStore:
+    """SQLite-backed review repository, safe to share between threads"""
+
+    def __init__(self, path: str = None):
+        self.path = os.path.abspath(path or os.getenv("REVIFY_REVIEW_DB", DEFAULT_DB_PATH))
+        self._local = threading.local()
+        migrate(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections must not cross threads, so keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def upsert_reviews(self, product_key: str, records: Iterable[ReviewRecord], product_name: str = None) -> int:
+        """Insert or update a batch of reviews for one product in a single transaction"""
+        scraped_at = time.time()
+        rows = [
+            (
+                product_key,
+                stable_review_id(r),
+                product_name,
+                r.title,
+                r.body,
+                r.rating,
+                r.date,
+                int(bool(r.verified)),
+                r.helpful_votes,
+                scraped_at,
+            )
+            for r in records
+        ]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany(_UPSERT, rows)
+        logger.info(f"🗄️ Upserted {len(rows)} reviews for {product_key} into {self.path}")
+        return len(rows)
+
+    def get_reviews(self, product_key: str, limit: int = None) -> List[ReviewRecord]:
+        """Reviews stored for a product, newest scrape first"""
+        query = (
+            "SELECT review_id, title, body, rating, review_date, verified, helpful_votes "
+            f"FROM reviews WHERE product_key = ? {_ORDER}"
+        )
+        params = [product_key]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        rows = self._connect().execute(query, params).fetchall()
+        return [
+            ReviewRecord(review_id, title, body, rating, review_date, bool(verified), helpful_votes)
+            for review_id, title, body, rating, review_date, verified, helpful_votes in rows
+        ]
+
+    def reviews_dataframe(self, product_key: str, limit: int = None) -> pd.DataFrame:
+        """A product's reviews with the scraped_reviews.csv column names the analysis expects"""
+        query = f"""
+            SELECT product_name  AS "name",
+                   'Amazon'      AS "brand",
+                   rating        AS "reviews.rating",
+                   title         AS "reviews.title",
+                   body          AS "reviews.text",
+                   review_date   AS "reviews.date",
+                   verified      AS "reviews.didPurchase",
+                   helpful_votes AS "reviews.numHelpful",
+                   review_id     AS "reviews.id"
+            FROM reviews WHERE product_key = ? {_ORDER}
+        """
+        params = [product_key]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return pd.read_sql_query(query, self._connect(), params=params)
+
+    def count(self, product_key: str) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM reviews WHERE product_key = ?", (product_key,)).fetchone()[0]
+
+    def review_ids(self, product_key: str) -> Set[str]:
+        """All stored review ids for a product"""
+        rows = self._connect().execute("SELECT review_id FROM reviews WHERE product_key = ?", (product_key,))
+        return {row[0] for row in rows}
+
+    def record_crawl(self, product_key: str, source_url: str, target_reviews: int, product_name: str = None):
+        """Remember when a product was last scraped, and for how many reviews"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawls VALUES (?, ?, ?, ?, ?, "
+                "(SELECT COUNT(*) FROM reviews WHERE product_key = ?))",
+                (product_key, product_name, source_url, time.time(), target_reviews, product_key),
+            )
+
+    def last_crawl(self, product_key: str) -> Optional[dict]:
+        row = self._connect().execute(
+            "SELECT product_name, source_url, crawled_at, target_reviews, review_count "
+            "FROM crawls WHERE product_key = ?", (product_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        product_name, source_url, crawled_at, target_reviews, review_count = row
+        return {
+            "product_key": product_key,
+            "product_name": product_name,
+            "source_url": source_url,
+            "crawled_at": crawled_at,
+            "target_reviews": target_reviews,
+            "review_count": review_count,
+        }
+
+
+def get_review_store(path: Optional[str] = None) -> ReviewStore:
+    """Process-wide store for ``path`` (default from REVIFY_REVIEW_DB)"""
+    path = os.path.abspath(path or os.getenv("REVIFY_REVIEW_DB", DEFAULT_DB_PATH))
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = ReviewStore(path)
+        return _stores[path]
@@ -0,0 +1,57 @@
+"""
+TTL cache over the review store: skip scraping products crawled recently.
+
+A crawl is fresh when it is younger than the TTL and asked for at least as
+many reviews as the current request. Products are matched by canonical key
+(marketplace + ASIN), so tracking parameters or /dp/ vs /gp/product/ URLs
+still hit the cache.
+
+- ``REVIFY_SCRAPE_CACHE_TTL_HOURS``: how long a crawl stays fresh (default 24, 0 disables)
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Optional
+
+from src.revify_flow.tools.amazon_urls import product_key
+from src.revify_flow.tools.review_store import get_review_store
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_TTL_HOURS = 24
+
+
+def cache_ttl_seconds() -> float:
+    return float(os.getenv("REVIFY_SCRAPE_CACHE_TTL_HOURS", DEFAULT_TTL_HOURS)) * 3600
+
+
+def freshness(url: str) -> Optional[dict]:
+    """Last crawl of this product with age and freshness metadata, or None if never crawled"""
+    crawl = get_review_store().last_crawl(product_key(url))
+    if crawl is None:
+        return None
+    ttl = cache_ttl_seconds()
+    age = time.time() - crawl["crawled_at"]
+    crawl.update({
+        "crawled_at_iso": datetime.fromtimestamp(crawl["crawled_at"]).isoformat(timespec="seconds"),
+        "age_seconds": round(age, 1),
+        "ttl_seconds": ttl,
+        "fresh": ttl > 0 and age < ttl,
+    })
+    return crawl
+
+
+def get_fresh_crawl(url: str, target_reviews: int = 0) -> Optional[dict]:
+    """Freshness metadata when the cached reviews can serve this request, else None"""
+    crawl = freshness(url)
+    if not crawl or not crawl["fresh"] or not crawl["review_count"]:
+        return None
+    if (crawl["target_reviews"] or 0) < target_reviews:
+        return None
+    logger.info(
+        f"⚡ Scrape cache hit for {crawl['product_key']}: {crawl['review_count']} reviews, "
+        f"crawled {crawl['age_seconds'] / 60:.0f} min ago"
+    )
+    return crawl
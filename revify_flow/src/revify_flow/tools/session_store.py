@@ -0,0 +1,148 @@
+"""
+Persistent store for authenticated Amazon browser sessions.
+
+After a confirmed login, the driver's cookies and localStorage are saved per
+marketplace host and account. The next run restores them into a fresh
+browser and checks the navbar greeting, which is cheap. The full
+email/password flow only runs when the saved session is missing, expired or
+rejected.
+
+- ``REVIFY_SESSION_DIR``: where sessions are kept (default ``.revify_sessions``)
+- ``REVIFY_SESSION_MAX_AGE_HOURS``: discard sessions older than this (default 72)
+- ``REVIFY_SESSION_CACHE=0``: disable the store entirely
+
+Session files hold live auth cookies, so they are written with owner-only
+permissions and must never be committed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_SESSION_DIR = ".revify_sessions"
+DEFAULT_MAX_AGE_HOURS = 72
+
+
+def is_signed_in(driver) -> bool:
+    """Read the navbar greeting ("Hello, sign in" vs "Hello, <name>") without navigating"""
+    try:
+        elements = driver.find_elements(By.ID, "nav-link-accountList-nav-line-1")
+        if not elements:
+            return False
+        greeting = elements[0].text.strip().lower()
+        return bool(greeting) and "sign in" not in greeting
+    except Exception:
+        return False
+
+
+class SessionStore:
+    """Saves and restores cookies + localStorage for a signed-in account"""
+
+    def __init__(self, username: str, directory: str = None, max_age_hours: float = None):
+        self.directory = directory or os.getenv("REVIFY_SESSION_DIR", DEFAULT_SESSION_DIR)
+        if max_age_hours is None:
+            max_age_hours = float(os.getenv("REVIFY_SESSION_MAX_AGE_HOURS", DEFAULT_MAX_AGE_HOURS))
+        self.max_age_seconds = max_age_hours * 3600
+        # Never put the raw account name in a filename
+        self._account_key = hashlib.sha256((username or "").encode("utf-8")).hexdigest()[:12]
+
+    def _path(self, url: str) -> str:
+        host = urlsplit(url).netloc.lower() or "amazon"
+        return os.path.join(self.directory, f"{host}_{self._account_key}.json")
+
+    def save(self, driver):
+        """Persist the current browser session after a confirmed login"""
+        try:
+            local_storage = driver.execute_script("return Object.assign({}, window.localStorage);") or {}
+        except Exception:
+            local_storage = {}
+
+        payload = {
+            "saved_at": time.time(),
+            "cookies": driver.get_cookies(),
+            "local_storage": local_storage,
+        }
+
+        path = self._path(driver.current_url)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+
+        logger.info(f"💾 Saved session ({len(payload['cookies'])} cookies) to {path}")
+
+    def load(self, url: str) -> Optional[dict]:
+        """Return the saved session for this host, or None if missing or expired"""
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable session file {path}: {e}")
+            return None
+
+        if time.time() - payload.get("saved_at", 0) > self.max_age_seconds:
+            logger.info("Saved session expired, a full login is required")
+            self.invalidate(url)
+            return None
+        return payload
+
+    def restore(self, driver) -> bool:
+        """
+        Load the saved session into a driver that is already on the target host.
+
+        Cookies can only be set for the current domain, so the caller must have
+        navigated there first and should reload afterwards. Returns True when a
+        session was applied.
+        """
+        payload = self.load(driver.current_url)
+        if not payload:
+            return False
+
+        now = time.time()
+        restored = 0
+        for cookie in payload.get("cookies", []):
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            # Selenium rejects the sameSite values Chrome reports for some cookies
+            cookie = {k: v for k, v in cookie.items() if k != "sameSite"}
+            try:
+                driver.add_cookie(cookie)
+                restored += 1
+            except Exception:
+                continue
+
+        for key, value in payload.get("local_storage", {}).items():
+            try:
+                driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);", key, value)
+            except Exception:
+                break
+
+        logger.info(f"🔑 Restored saved session ({restored} cookies)")
+        return restored > 0
+
+    def invalidate(self, url: str):
+        """Drop a session that Amazon no longer accepts"""
+        try:
+            os.remove(self._path(url))
+        except OSError:
+            pass
+
+
+def get_session_store(username: str) -> Optional[SessionStore]:
+    """Session store for this account, or None when disabled via REVIFY_SESSION_CACHE=0"""
+    if os.getenv("REVIFY_SESSION_CACHE", "1").lower() in ("0", "false", "no", "off"):
+        return None
+    return SessionStore(username)
@@ -0,0 +1,70 @@
+"""
+Load URL-addressed review pages concurrently in browser tabs.
+
+Clicking Next means one page load at a time. Because review pages can be
+addressed by page number, a batch of them is opened in background tabs of
+the already signed-in driver. The browser loads them in parallel, then each
+tab is read in order and closed. The batch size is the concurrency cap.
+
+- ``REVIFY_PAGE_CONCURRENCY``: tabs loaded at once (default 1, click-through
+  pagination; set it above 1 to opt in to tab loading)
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+from src.revify_flow.tools.page_readiness import PageWaitMetrics, wait_for_reviews
+
+logger = logging.getLogger('amazon_scraper')
+
+DEFAULT_PAGE_CONCURRENCY = 1
+
+
+def page_concurrency() -> int:
+    return max(1, int(os.getenv("REVIFY_PAGE_CONCURRENCY", DEFAULT_PAGE_CONCURRENCY)))
+
+
+def _open_tab(driver, url: str) -> Optional[str]:
+    """Open url in a background tab without waiting for it to load; return its handle"""
+    before = set(driver.window_handles)
+    driver.execute_script("window.open(arguments[0], '_blank');", url)
+    opened = [h for h in driver.window_handles if h not in before]
+    return opened[0] if opened else None
+
+
+def fetch_pages_in_tabs(driver, urls: List[str], metrics: PageWaitMetrics = None,
+                        first_page: int = 1) -> List[Optional[str]]:
+    """
+    Return the HTML of every url, in order, loading them all at once.
+
+    A page that never shows its review list comes back as None. The driver is
+    left on its original window.
+    """
+    main_handle = driver.current_window_handle
+    handles = []
+    try:
+        for url in urls:
+            handle = _open_tab(driver, url)
+            if handle is None:
+                # Pop-up blocked: load this one in a regular tab instead
+                driver.switch_to.new_window('tab')
+                handle = driver.current_window_handle
+                driver.get(url)
+                driver.switch_to.window(main_handle)
+            handles.append(handle)
+
+        pages = []
+        for offset, handle in enumerate(handles):
+            driver.switch_to.window(handle)
+            ready = wait_for_reviews(driver, metrics=metrics, page=first_page + offset)
+            pages.append(driver.page_source if ready else None)
+        return pages
+    finally:
+        for handle in handles:
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                continue
+        driver.switch_to.window(main_handle)
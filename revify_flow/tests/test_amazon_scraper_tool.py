@@ -0,0 +1,76 @@
+import re
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.revify_flow.tools.amazon_scraper_tool import AmazonScraperTool
+from src.revify_flow.tools.amazon_urls import product_key
+from src.revify_flow.tools.review_parser import get_review_parser
+from src.revify_flow.tools.review_record import ReviewRecord
+from src.revify_flow.tools.review_store import ReviewStore, stable_review_id
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[2] / "amazon_reviews_page.txt"
+URL = "https://www.amazon.in/dp/B01N54ZM9W"
+
+
+def _page_without_ids():
+    html = SAMPLE_PAGE.read_text(encoding="utf-8", errors="replace")
+    return re.sub(r'<li id="[^"]*" data-hook="review"', '<li data-hook="review"', html)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("REVIFY_REVIEW_DB", str(tmp_path / "reviews.db"))
+    monkeypatch.delenv("REVIFY_REPLAY_DIR", raising=False)
+    return tmp_path
+
+
+def _replay_pages(directory, html):
+    directory.mkdir()
+    for name in ("page1.html", "page2.html"):
+        (directory / name).write_text(html, encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def replay_dir(workdir):
+    return _replay_pages(workdir / "pages", SAMPLE_PAGE.read_text(encoding="utf-8", errors="replace"))
+
+
+@pytest.fixture
+def id_less_replay_dir(workdir):
+    return _replay_pages(workdir / "id_less", _page_without_ids())
+
+
+def test_replay_writes_csv_but_not_the_review_store(replay_dir, tmp_path):
+    result = AmazonScraperTool(replay_dir=str(replay_dir))._run(URL, target_reviews=15)
+
+    assert "Successfully scraped 15 reviews" in result
+    # Both captures are the same page, so the normalized export keeps its 10 reviews once
+    assert len(pd.read_csv(tmp_path / "scraped_reviews.csv")) == 10
+    assert ReviewStore(str(tmp_path / "reviews.db")).count(product_key(URL)) == 0
+
+
+def test_stream_stops_at_target_when_reviews_have_no_id(id_less_replay_dir):
+    tool = AmazonScraperTool(replay_dir=str(id_less_replay_dir))
+    pages = list(tool.iter_review_pages(URL, target_reviews=15))
+
+    assert [len(page) for page in pages] == [10, 5]
+
+
+def test_incremental_backfill_skips_streamed_reviews(id_less_replay_dir, tmp_path, monkeypatch):
+    streamed = get_review_parser().parse(_page_without_ids())
+    older = [ReviewRecord(title=f"Older {i}", body="Still fine", rating=4.0) for i in range(3)]
+    store = ReviewStore(str(tmp_path / "reviews.db"))
+    store.upsert_reviews(product_key(URL), streamed + older)
+    monkeypatch.setattr(AmazonScraperTool, "_incremental_ids",
+                        lambda self, url, incremental: store.review_ids(product_key(URL)))
+
+    tool = AmazonScraperTool(replay_dir=str(id_less_replay_dir / "page1.html"))
+    records = [r for page in tool.iter_review_pages(URL, target_reviews=15) for r in page]
+
+    ids = [stable_review_id(r) for r in records]
+    assert len(ids) == len(set(ids)) == 13
+    assert {r.title for r in records[10:]} == {r.title for r in older}
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+from src.revify_flow.tools.amazon_urls import MAX_PAGES_PER_FILTER, STAR_FILTERS, plan_review_pages
+from src.revify_flow.tools.review_parser import parse_rating_histogram
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[2] / "amazon_reviews_page.txt"
+
+
+def test_small_target_reads_unfiltered_list():
+    assert plan_review_pages(35) == [("all_stars", page) for page in range(1, 5)]
+
+
+def test_large_target_without_histogram_skips_star_filters():
+    plan = plan_review_pages(300)
+    assert plan == [("all_stars", page) for page in range(1, MAX_PAGES_PER_FILTER + 1)]
+
+
+def test_star_top_up_follows_rating_histogram():
+    histogram = {"five_star": 60, "four_star": 20, "three_star": 10, "two_star": 0, "one_star": 10}
+    plan = plan_review_pages(200, rating_histogram=histogram)
+
+    assert plan[:MAX_PAGES_PER_FILTER] == [("all_stars", page) for page in range(1, MAX_PAGES_PER_FILTER + 1)]
+    pages = {star: sum(1 for s, _ in plan if s == star) for star in STAR_FILTERS}
+    assert pages == {"five_star": 10, "four_star": 4, "three_star": 2, "two_star": 0, "one_star": 2}
+    # A truncated merge still favours the common ratings
+    first = [star for star, _ in plan[MAX_PAGES_PER_FILTER:MAX_PAGES_PER_FILTER + 5]]
+    assert first.count("five_star") > first.count("one_star")
+
+
+def test_parse_rating_histogram_from_sample_page():
+    html = SAMPLE_PAGE.read_text(encoding="utf-8", errors="replace")
+    assert parse_rating_histogram(html) == {
+        "five_star": 47.0, "four_star": 26.0, "three_star": 13.0, "two_star": 5.0, "one_star": 9.0,
+    }
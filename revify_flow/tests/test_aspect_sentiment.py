@@ -0,0 +1,54 @@
+from src.revify_flow.tools.aspect_sentiment import AspectSentimentEngine, template_verdict
+
+
+def _engine(*texts, rating=3):
+    return AspectSentimentEngine([{"reviews.title": "", "reviews.text": t, "reviews.rating": rating} for t in texts])
+
+
+def _points(stats):
+    return {p["point"]: p["sentiment"] for p in stats["key_points"]}
+
+
+def test_opinions_stay_with_the_aspect_of_their_clause():
+    engine = _engine("Battery is fine but sound is muffled.")
+
+    battery = engine.feature_stats("Battery Life")
+    assert battery["sentiment"] == "Positive"
+    assert _points(battery) == {"fine": "positive"}
+
+    sound = engine.feature_stats("Sound Quality")
+    assert sound["sentiment"] == "Negative"
+    assert _points(sound) == {"muffled": "negative"}
+
+
+def test_negation_flips_polarity():
+    stats = _engine("The battery is not good.", rating=5).feature_stats("Battery")
+    assert stats["sentiment_distribution"] == {"positive": 0, "negative": 1, "neutral": 0}
+    assert _points(stats) == {"not good": "negative"}
+
+
+def test_negation_does_not_cross_a_clause_break():
+    stats = _engine("Not what I expected however the battery is great.").feature_stats("Battery")
+    assert _points(stats) == {"great": "positive"}
+
+
+def test_neutral_wording_falls_back_to_rating():
+    stats = _engine("The battery is a battery.", rating=5).feature_stats("Battery")
+    assert stats["sentiment_distribution"]["positive"] == 1
+
+
+def test_unmentioned_feature_has_templated_verdict():
+    stats = _engine("Lovely colour.").feature_stats("Battery")
+    assert stats["mentions"] == 0
+    assert template_verdict(stats) == "No reviews mention this feature."
+
+
+def test_speed_words_take_their_polarity_from_context():
+    drains = _engine("Battery drains fast.", rating=3).feature_stats("Battery")
+    assert drains["sentiment"] == "Negative"
+    assert _points(drains) == {"drains": "negative"}
+    assert "fast" not in template_verdict(drains)
+
+    charges = _engine("Charges fast.", rating=5).feature_stats("Battery")
+    assert charges["sentiment"] == "Positive"
+    assert charges["key_points"] == []
@@ -0,0 +1,48 @@
+from src.revify_flow.tools.chunk_planner import ChunkPacker, estimate_tokens, plan_chunks
+
+
+def words(text):
+    return len(text.split())
+
+
+def review(n_words, i=0):
+    return {"reviews.title": f"r{i}", "reviews.text": " ".join(["word"] * n_words)}
+
+
+def render(r):
+    return r["reviews.text"]
+
+
+def test_chunks_fill_up_to_budget_in_order():
+    reviews = [review(n, i) for i, n in enumerate([4, 4, 3, 6, 2, 9])]
+    chunks, packer = plan_chunks(reviews, budget=10, tokenizer=words, render=render)
+
+    assert [[r["reviews.title"] for r in c] for c in chunks] == [["r0", "r1"], ["r2", "r3"], ["r4"], ["r5"]]
+    assert packer.chunk_tokens == [8, 9, 2, 9]
+    assert all(tokens <= 10 for tokens in packer.chunk_tokens)
+    summary = packer.summary()
+    assert summary["calls"] == 4 and summary["tokens"] == 28 and summary["truncated"] == 0
+
+
+def test_max_reviews_caps_chunk_size():
+    chunks, _ = plan_chunks([review(1, i) for i in range(7)], budget=100, tokenizer=words,
+                            max_reviews=3, render=render)
+    assert [len(c) for c in chunks] == [3, 3, 1]
+
+
+def test_oversized_review_is_truncated_to_fit():
+    packer = ChunkPacker(budget=10, tokenizer=words, render=render)
+    assert packer.add(review(3)) is None
+    # Starts a new chunk and hands back the previous one
+    assert len(packer.add(review(50))) == 1
+    last = packer.flush()
+    assert packer.flush() is None
+
+    assert len(last) == 1 and words(last[0]["reviews.text"]) <= 10
+    assert packer.truncated == 1
+    assert max(packer.chunk_tokens) <= 10
+
+
+def test_estimate_tokens_counts_words():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("one two three") >= 3
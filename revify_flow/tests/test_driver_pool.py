@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from src.revify_flow.tools.driver_pool import DriverPool, DriverPoolTimeout
+
+
+class FakeDriver:
+    """Answers the pool's liveness probe and records quit()"""
+
+    def __init__(self):
+        self.closed = False
+
+    def execute_script(self, script):
+        if self.closed:
+            raise RuntimeError("browser closed")
+        return 1
+
+    def close(self):
+        self.closed = True
+
+    def quit(self):
+        self.closed = True
+
+
+def test_acquire_times_out_when_every_driver_is_busy():
+    pool = DriverPool(FakeDriver, size=1, timeout=0.1)
+    driver = pool.acquire()
+    start = time.monotonic()
+    with pytest.raises(DriverPoolTimeout, match="REVIFY_DRIVER_POOL_SIZE"):
+        pool.acquire()
+    assert time.monotonic() - start < 2
+    pool.release(driver)
+    assert pool.acquire() is driver
+
+
+def test_waiting_acquire_gets_the_released_driver():
+    pool = DriverPool(FakeDriver, size=1, timeout=5)
+    driver = pool.acquire()
+    threading.Timer(0.05, pool.release, args=(driver,)).start()
+    assert pool.acquire() is driver
+
+
+def test_driver_context_recycles_on_error():
+    pool = DriverPool(FakeDriver, size=1, timeout=0.1)
+    with pytest.raises(ValueError):
+        with pool.driver() as driver:
+            raise ValueError("scrape failed")
+    assert driver.closed
+    assert pool.acquire() is not driver
+
+
+def test_quitting_a_dead_driver_does_not_block_the_pool():
+    quitting, finish_quit = threading.Event(), threading.Event()
+
+    class SlowQuitDriver(FakeDriver):
+        def quit(self):
+            quitting.set()
+            finish_quit.wait(5)
+            super().quit()
+
+    pool = DriverPool(SlowQuitDriver, size=2, timeout=5)
+    dead, busy = pool.acquire(), pool.acquire()
+    pool.release(dead)
+    dead.closed = True
+
+    replacement = []
+    worker = threading.Thread(target=lambda: replacement.append(pool.acquire()))
+    worker.start()
+    assert quitting.wait(2)
+
+    # Another scrape finishes and the next one starts while the browser is still quitting
+    start = time.monotonic()
+    pool.release(busy)
+    assert pool.acquire(timeout=1) is busy
+    assert time.monotonic() - start < 1
+
+    finish_quit.set()
+    worker.join(2)
+    assert replacement and replacement[0] is not dead
@@ -0,0 +1,57 @@
+from src.revify_flow.tools.feature_retrieval import (
+    SYNONYM_WEIGHT, FeatureEvidenceIndex, feature_terms, format_evidence, load_synonyms, split_sentences, stem,
+)
+
+REVIEWS = [
+    {"reviews.title": "Battery life", "reviews.text": "The battery lasts two days. Sound is fine.", "reviews.rating": 5},
+    {"reviews.title": "Meh", "reviews.text": "Charging is slow. Looks nice.", "reviews.rating": 3},
+    {"reviews.title": "Battery battery", "reviews.text": "Battery died, battery drains fast.", "reviews.rating": 1},
+    {"reviews.title": "Comfortable", "reviews.text": "Fits well and feels soft.", "reviews.rating": 4},
+]
+
+
+def test_stem_matches_plural_and_verb_forms():
+    assert stem("batteries") == stem("battery")
+    assert stem("charging") == stem("charged") == stem("charges")
+
+
+def test_feature_terms_weight_synonyms_lower():
+    terms = feature_terms("Battery Life", load_synonyms())
+    assert terms[stem("battery")] == 1.0
+    assert terms[stem("charging")] == SYNONYM_WEIGHT
+    # Generic words are dropped unless nothing else is left
+    assert stem("quality") not in feature_terms("Build Quality", {})
+    assert feature_terms("Quality", {}) == {stem("quality"): 1.0}
+
+
+def test_search_ranks_by_bm25_and_returns_review_order():
+    index = FeatureEvidenceIndex(REVIEWS)
+    assert len(index) == sum(len(split_sentences(r["reviews.title"])) + len(split_sentences(r["reviews.text"]))
+                             for r in REVIEWS)
+
+    best = index.search("Battery", top_k=1)
+    # Two mentions plus a synonym ("drains") beat two bare mentions
+    assert [e.sentence for e in best] == ["Battery died, battery drains fast."]
+
+    evidence = index.search("Battery", top_k=10)
+    assert [e.review_id for e in evidence] == sorted(e.review_id for e in evidence)
+    assert {e.review_id for e in evidence} == {1, 2, 3}
+    assert index.search("Bluetooth", top_k=10) == []
+
+
+def test_synonym_match_scores_at_synonym_weight():
+    index = FeatureEvidenceIndex([
+        {"reviews.text": "Battery works great."},
+        {"reviews.text": "Charger works great."},
+        {"reviews.text": "Strap works great."},
+    ])
+    own, synonym = index.search("Battery", top_k=5)
+    assert (own.review_id, synonym.review_id) == (1, 2)
+    assert abs(synonym.score - own.score * SYNONYM_WEIGHT) < 1e-9
+
+
+def test_format_evidence_lines():
+    evidence = FeatureEvidenceIndex(REVIEWS).search("comfort", top_k=5)
+    lines = format_evidence(evidence).splitlines()
+    assert lines[0] == "review|rating|sentence"
+    assert lines[1:] == ["4|4|Comfortable", "4|4|Fits well and feels soft."]
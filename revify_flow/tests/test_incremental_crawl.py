@@ -0,0 +1,31 @@
+import re
+from pathlib import Path
+
+from src.revify_flow.tools.review_parser import get_review_parser
+from src.revify_flow.tools.review_store import ReviewStore, reviews_before_known, stable_review_id
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[2] / "amazon_reviews_page.txt"
+PRODUCT = "amazon.in:B01N54ZM9W"
+
+
+def _page_without_ids():
+    html = SAMPLE_PAGE.read_text(encoding="utf-8", errors="replace")
+    return re.sub(r'<li id="[^"]*" data-hook="review"', '<li data-hook="review"', html)
+
+
+def test_incremental_stop_matches_reviews_without_dom_id(tmp_path):
+    records = get_review_parser("html.parser").parse(_page_without_ids())
+    assert len(records) > 3
+    assert not any(r.review_id for r in records)
+
+    store = ReviewStore(str(tmp_path / "reviews.db"))
+    store.upsert_reviews(PRODUCT, records[2:])
+    known_ids = store.review_ids(PRODUCT)
+    assert known_ids == {stable_review_id(r) for r in records[2:]}
+
+    assert reviews_before_known(records, known_ids) == records[:2]
+
+
+def test_incremental_stop_keeps_whole_page_when_nothing_is_known():
+    records = get_review_parser("html.parser").parse(_page_without_ids())
+    assert reviews_before_known(records, set()) == records
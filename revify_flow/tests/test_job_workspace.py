@@ -0,0 +1,57 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from src.revify_flow.tools.job_workspace import METADATA_FILE, JobWorkspace, prune_workspaces
+
+logger = logging.getLogger('amazon_scraper')
+
+
+def _log_from_thread(name, message):
+    thread = threading.Thread(target=logger.warning, args=(message,), name=name)
+    thread.start()
+    thread.join()
+
+
+def test_job_records_go_only_to_the_job_log(tmp_path):
+    shared = logging.FileHandler(tmp_path / "shared.log", encoding="utf-8")
+    logging.getLogger().addHandler(shared)
+    try:
+        workspace = JobWorkspace(root=str(tmp_path / "workspaces"), cleanup="never")
+        job_log = workspace.attach_log()
+        _log_from_thread(workspace.thread_name("scrape"), "job line")
+        _log_from_thread("other-thread", "other line")
+        workspace.close()
+        _log_from_thread(workspace.thread_name("late"), "after close")
+    finally:
+        logging.getLogger().removeHandler(shared)
+        shared.close()
+
+    shared_text = (tmp_path / "shared.log").read_text(encoding="utf-8")
+    job_text = open(job_log, encoding="utf-8").read()
+    assert "job line" in job_text and "job line" not in shared_text
+    assert "other line" in shared_text and "other line" not in job_text
+    assert "after close" in shared_text
+
+
+def test_prune_uses_recorded_finish_time_not_mtime(tmp_path):
+    root = str(tmp_path / "workspaces")
+    old = JobWorkspace(job_id="old", root=root, cleanup="never")
+    old.close(succeeded=False)
+    recent = JobWorkspace(job_id="recent", root=root, cleanup="never")
+    recent.close(succeeded=False)
+
+    # Finished long ago, but touched since
+    with open(old.path(METADATA_FILE), encoding="utf-8") as f:
+        metadata = json.load(f)
+    metadata["finished_at"] = time.time() - 10 * 3600
+    old.write_json(METADATA_FILE, metadata)
+    old.write_text("notes.txt", "looked at today")
+    # Finished just now, though the directory mtime is old
+    os.utime(recent.directory, (time.time() - 10 * 3600,) * 2)
+
+    assert prune_workspaces(root, max_age_hours=5) == 1
+    assert not os.path.exists(old.directory)
+    assert os.path.exists(recent.directory)
@@ -0,0 +1,67 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.revify_flow.tools import llm_cache
+from src.revify_flow.tools.llm_cache import LLMResponseCache, cached_kickoff, crew_cache_key
+
+
+class ScriptedCrew:
+    """Crew-shaped object whose kickoff returns the scripted answers in turn"""
+
+    def __init__(self, *answers):
+        self.agents = [SimpleNamespace(llm="test-model", role="analyst", goal="analyze", backstory="")]
+        self.tasks = [SimpleNamespace(description="Analyze {features}", expected_output="JSON", agent=self.agents[0])]
+        self.answers = list(answers)
+        self.calls = 0
+
+    def kickoff(self, inputs=None):
+        self.calls += 1
+        return SimpleNamespace(raw=self.answers.pop(0))
+
+
+def is_json(raw):
+    json.loads(raw)
+    return True
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("REVIFY_LLM_CACHE", raising=False)
+    cache = LLMResponseCache(str(tmp_path / "cache.db"), ttl_hours=1, max_mb=1)
+    monkeypatch.setattr(llm_cache, "_cache", cache)
+    return cache
+
+
+def test_valid_response_is_replayed(cache):
+    crew = ScriptedCrew('{"ok": 1}')
+    inputs = {"features": "battery"}
+    assert cached_kickoff(crew, inputs, validate=is_json).raw == '{"ok": 1}'
+    assert cached_kickoff(crew, inputs, validate=is_json).raw == '{"ok": 1}'
+    assert crew.calls == 1
+
+
+def test_response_failing_validation_is_not_cached(cache):
+    crew = ScriptedCrew("Sorry, here is my analysis", '{"ok": 1}')
+    inputs = {"features": "battery"}
+    assert cached_kickoff(crew, inputs, validate=is_json).raw == "Sorry, here is my analysis"
+    assert cache.get(crew_cache_key(crew, inputs)) is None
+    assert cached_kickoff(crew, inputs, validate=is_json).raw == '{"ok": 1}'
+    assert crew.calls == 2
+
+
+def test_stale_invalid_entry_is_dropped_on_lookup(cache):
+    crew = ScriptedCrew('{"ok": 1}')
+    inputs = {"features": "battery"}
+    cache.put(crew_cache_key(crew, inputs), "not json")
+    assert cached_kickoff(crew, inputs, validate=is_json).raw == '{"ok": 1}'
+    assert cache.metrics()["rejected"] == 1
+
+
+def test_bypass_skips_lookup_but_refreshes_entry(cache):
+    crew = ScriptedCrew('{"v": 1}', '{"v": 2}')
+    inputs = {"features": "battery"}
+    cached_kickoff(crew, inputs)
+    assert cached_kickoff(crew, inputs, bypass=True).raw == '{"v": 2}'
+    assert cache.get(crew_cache_key(crew, inputs)) == '{"v": 2}'
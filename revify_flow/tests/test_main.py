@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.revify_flow.main import ChunkSummarizer, _reduce_groups, analysis_mode, reduce_summaries
+from src.revify_flow.tools.prompt_encoding import prompt_savings, record_prompt_savings, track_prompt_savings
+
+
+def test_analysis_mode_defaults_to_summaries(monkeypatch):
+    monkeypatch.delenv("REVIFY_ANALYSIS_MODE", raising=False)
+    assert analysis_mode() == "summaries"
+
+
+def test_analysis_mode_is_opt_in(monkeypatch):
+    monkeypatch.setenv("REVIFY_ANALYSIS_MODE", "Evidence")
+    assert analysis_mode() == "evidence"
+    monkeypatch.setenv("REVIFY_ANALYSIS_MODE", "quick")
+    with pytest.raises(ValueError):
+        analysis_mode()
+
+
+def test_reduce_groups_respect_fan_in_and_budget():
+    summaries = [f"s{i}" for i in range(7)]
+    groups = _reduce_groups(summaries, [10] * 7, fan_in=3, budget=100)
+    assert groups == [["s0", "s1", "s2"], ["s3", "s4", "s5"], ["s6"]]
+
+    groups = _reduce_groups(summaries, [40] * 7, fan_in=4, budget=100)
+    assert [len(g) for g in groups] == [2, 2, 2, 1]
+    assert sum(groups, []) == summaries
+
+
+def test_reduce_groups_always_pair_oversized_summaries():
+    # Two summaries over budget are still merged, otherwise the reduce would never shrink
+    assert _reduce_groups(["a", "b", "c"], [80, 80, 80], fan_in=4, budget=100) == [["a", "b"], ["c"]]
+
+
+def test_reduce_summaries_keeps_summaries_that_fit():
+    team = SimpleNamespace(chunk_summary_agent=lambda: SimpleNamespace(llm="gpt-4o-mini"))
+    summaries = ["one two", "three four"]
+    assert reduce_summaries(summaries, team, token_budget=100, tokenizer=lambda s: len(s.split())) == summaries
+
+
+def test_reduce_summaries_rejects_fan_in_below_two():
+    with pytest.raises(ValueError):
+        reduce_summaries(["a", "b"], team=None, fan_in=1)
+
+
+def test_chunk_summarizer_workers_count_towards_the_callers_job():
+    agent = SimpleNamespace(copy=lambda: agent)
+    savings = prompt_savings([{"reviews.title": "Good", "reviews.text": "Fine"}], tokenizer=len)
+
+    def summarize(agent, chunk, label):
+        record_prompt_savings(savings)
+        return label
+
+    job = track_prompt_savings()
+    with ChunkSummarizer(agent, max_in_flight=3, summarize=summarize) as summarizer:
+        for chunk in range(4):
+            summarizer.submit(chunk)
+        assert summarizer.results() == [f"chunk summary {i}" for i in range(1, 5)]
+    assert job.totals()["prompts"] == 4
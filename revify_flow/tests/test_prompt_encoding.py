@@ -0,0 +1,74 @@
+import threading
+
+from src.revify_flow.tools.prompt_encoding import (
+    PromptSavingsMeter, cell, encode_reviews, get_prompt_savings, prompt_savings, record_prompt_savings,
+    track_prompt_savings,
+)
+
+REVIEWS = [
+    {"name": "Rockerz 450", "brand": "boAt", "reviews.rating": 5.0,
+     "reviews.title": "Great|bass", "reviews.text": "Punchy sound.\nBattery lasts a week."},
+    {"name": "Rockerz 450", "brand": "boAt", "reviews.rating": 2.0,
+     "reviews.title": "Broke", "reviews.text": "Left cup died\r\nafter a month"},
+]
+
+
+def test_cell_strips_separators_and_newlines():
+    assert cell("a|b\nc\r\nd") == "a b c d"
+    assert cell(5.0) == "5"
+    assert cell(float("nan")) == ""
+    assert cell(None) == ""
+
+
+def test_one_line_per_review_with_constant_fields_hoisted():
+    lines = encode_reviews(REVIEWS).split("\n")
+    assert lines == [
+        "Product: Rockerz 450 | Brand: boAt",
+        "id|rating|title|text",
+        "1|5|Great bass|Punchy sound. Battery lasts a week.",
+        "2|2|Broke|Left cup died after a month",
+    ]
+    assert all(line.count("|") == 3 for line in lines[1:])
+
+
+def test_varying_fields_stay_on_each_review():
+    mixed = [dict(REVIEWS[0]), dict(REVIEWS[1], name="Rockerz 550")]
+    lines = encode_reviews(mixed).split("\n")
+    assert lines[0] == "Brand: boAt"
+    assert lines[2].startswith("1|5|[Rockerz 450] Great bass|")
+
+
+def test_meter_totals_savings():
+    meter = PromptSavingsMeter()
+    savings = prompt_savings(REVIEWS, tokenizer=len)
+    assert savings["saved_tokens"] > 0
+    meter.add(savings)
+    meter.add(savings)
+
+    totals = meter.totals()
+    assert totals["prompts"] == 2
+    assert totals["saved_tokens"] == 2 * savings["saved_tokens"]
+    assert totals["saved_pct"] == savings["saved_pct"]
+
+
+def test_concurrent_jobs_count_only_their_own_prompts():
+    savings = prompt_savings(REVIEWS, tokenizer=len)
+    before = get_prompt_savings().totals()["prompts"]
+    both_started = threading.Barrier(2)
+    jobs = {}
+
+    def job(name, prompts):
+        meter = track_prompt_savings()
+        both_started.wait(5)
+        for _ in range(prompts):
+            record_prompt_savings(savings)
+        jobs[name] = meter.totals()["prompts"]
+
+    threads = [threading.Thread(target=job, args=(name, n)) for name, n in (("a", 2), ("b", 5))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+
+    assert jobs == {"a": 2, "b": 5}
+    assert get_prompt_savings().totals()["prompts"] - before == 7
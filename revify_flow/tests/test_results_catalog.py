@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from src.revify_flow.tools.columnar_store import PYARROW_AVAILABLE, write_feature_analyses
+from src.revify_flow.tools.results_catalog import ResultsCatalog
+
+needs_pyarrow = pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+
+ANALYSES = [
+    {"feature": "Battery", "sentiment": "Positive", "verdict": "lasts two days.", "key_points": []},
+    {"feature": "Sound", "sentiment": "Mixed", "verdict": "bass is weak.",
+     "key_points": [{"point": "weak bass", "frequency": 3}]},
+]
+
+
+@needs_pyarrow
+def test_import_columnar_catalogs_analyses_from_parquet(tmp_path, monkeypatch):
+    monkeypatch.setenv("REVIFY_COLUMNAR_DIR", str(tmp_path / "columnar"))
+    monkeypatch.chdir(tmp_path)
+    write_feature_analyses("amazon.in:B01N54ZM9W", ANALYSES, "output/feature_analysis_job1.json")
+
+    catalog = ResultsCatalog(str(tmp_path / "results.db"))
+    assert catalog.import_columnar() == 1
+    assert catalog.import_columnar() == 0
+
+    result = catalog.latest("amazon.in:B01N54ZM9W")
+    assert result["path"] == os.path.abspath("output/feature_analysis_job1.json")
+    assert result["features"] == ["Battery", "Sound"]
+    assert result["summary"] == "lasts two days. Bass is weak."
+
+
+def test_summaries_keep_results_with_the_same_filename(tmp_path):
+    catalog = ResultsCatalog(str(tmp_path / "results.db"))
+    first = tmp_path / "jobs" / "job1" / "feature_analysis.json"
+    second = tmp_path / "jobs" / "job2" / "feature_analysis.json"
+    catalog.record(str(first), ANALYSES[:1], created_at=1.0)
+    catalog.record(str(second), ANALYSES[1:], created_at=2.0)
+
+    assert catalog.summaries() == {str(first): "lasts two days.", str(second): "bass is weak."}
+    assert [r["filename"] for r in catalog.list_results()] == ["feature_analysis.json"] * 2
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import pandas as pd
+
+from src.revify_flow.tools.review_normalizer import (
+    RATING_COL, TEXT_COL, TITLE_COL, normalize_review_dicts, normalize_reviews,
+)
+from src.revify_flow.tools.review_parser import get_review_parser
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[2] / "amazon_reviews_page.txt"
+
+
+def sample_frame():
+    records = get_review_parser().parse(SAMPLE_PAGE.read_text(encoding="utf-8"))
+    return pd.DataFrame({
+        TITLE_COL: [r.title for r in records],
+        TEXT_COL: [r.body for r in records],
+    }), records
+
+
+def test_rating_parsed_from_title_prefix():
+    df, records = sample_frame()
+    out = normalize_reviews(df)
+
+    assert len(out) == len(records)
+    assert out[RATING_COL].tolist() == [r.rating for r in records]
+    assert out[TITLE_COL].iloc[0] == "Shoes"
+    assert not out[TITLE_COL].str.contains("out of 5 stars").any()
+    assert (out["reviews.tokens"] > 0).all()
+
+
+def test_rating_column_wins_over_title():
+    df = pd.DataFrame({
+        TITLE_COL: ["4,0 out of 5 stars Decent", "2.0 out of 5 stars Meh"],
+        TEXT_COL: ["Fine", "Broke fast"],
+        RATING_COL: [None, 5],
+    })
+    assert normalize_reviews(df)[RATING_COL].tolist() == [4.0, 5.0]
+
+
+def test_boilerplate_and_empty_reviews_dropped():
+    df = pd.DataFrame({
+        TITLE_COL: ["Great", "", None],
+        TEXT_COL: ["Loud   and\nclear Read more", "The media could not be loaded.", None],
+        RATING_COL: [5, 1, 3],
+    })
+    out = normalize_reviews(df)
+    assert out[TEXT_COL].tolist() == ["Loud and clear"]
+
+
+def test_near_duplicates_dropped_within_and_across_batches():
+    df = pd.DataFrame({
+        TITLE_COL: ["Good", "good!", "Good"],
+        TEXT_COL: ["Good quality", "GOOD quality.", "Bad quality"],
+        RATING_COL: [5, 5, 2],
+    })
+    seen = set()
+    assert normalize_reviews(df, seen_keys=seen)[TEXT_COL].tolist() == ["Good quality", "Bad quality"]
+
+    again = normalize_review_dicts(
+        [{TITLE_COL: "Good", TEXT_COL: "good quality", RATING_COL: 5},
+         {TITLE_COL: "New", TEXT_COL: "Still fine", RATING_COL: 4}],
+        seen_keys=seen,
+    )
+    assert [r[TEXT_COL] for r in again] == ["Still fine"]
+    assert set(again[0]) == {TITLE_COL, TEXT_COL, RATING_COL}
@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pytest
+
+from src.revify_flow.tools.review_parser import (
+    available_backends, extract_review_section, get_review_parser, has_next_page,
+)
+
+SAMPLE_PAGE = Path(__file__).resolve().parents[2] / "amazon_reviews_page.txt"
+
+
+@pytest.fixture(scope="module")
+def html():
+    return SAMPLE_PAGE.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="module")
+def reference(html):
+    return get_review_parser("html.parser").parse(html)
+
+
+def test_sample_page_reference_records(reference):
+    assert len(reference) == 10
+    first = reference[0]
+    assert first.review_id == "R3QJEQJED94073"
+    assert first.rating == 5.0
+    assert first.date == "2025-11-05"
+    assert first.verified
+    assert sum(r.helpful_votes for r in reference) == 1
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_agree_on_sample_page(backend, html, reference):
+    assert get_review_parser(backend).parse(html) == reference
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_review_section_holds_every_review(backend, html, reference):
+    section = extract_review_section(html)
+    assert len(section) < len(html) / 5
+    assert get_review_parser(backend).parse(section) == reference
+
+
+def test_unknown_backend_falls_back_to_html_parser():
+    assert type(get_review_parser("nope")).__name__ == "SoupReviewParser"
+
+
+def test_has_next_page(html):
+    # The sample is the last page: its "Next page" link is disabled
+    assert not has_next_page(html)
+    assert has_next_page(html.replace('class="a-disabled a-last"', 'class="a-last"'))
+    assert not has_next_page("<html><body>no reviews</body></html>")
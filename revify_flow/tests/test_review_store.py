@@ -0,0 +1,54 @@
+import sqlite3
+
+from src.revify_flow.tools.review_record import ReviewRecord
+from src.revify_flow.tools.review_store import SCHEMA_VERSION, ReviewStore
+
+# Schema written by stores that keyed rows by bare ASIN
+LEGACY_SCHEMA = """
+CREATE TABLE reviews (
+    asin TEXT NOT NULL, review_id TEXT NOT NULL, product_name TEXT, title TEXT, body TEXT,
+    rating REAL, review_date TEXT, verified INTEGER, helpful_votes INTEGER, scraped_at REAL NOT NULL,
+    PRIMARY KEY (asin, review_id)
+);
+CREATE INDEX idx_reviews_asin_scraped ON reviews (asin, scraped_at);
+CREATE TABLE crawls (
+    asin TEXT PRIMARY KEY, product_name TEXT, source_url TEXT, crawled_at REAL NOT NULL,
+    target_reviews INTEGER, review_count INTEGER
+);
+"""
+
+
+def _legacy_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO reviews VALUES (?, ?, 'Phone', ?, 'body', 5, NULL, 1, 0, ?)",
+        [("B01N54ZM9W", "R1", "old one", 1.0), ("B01N54ZM9W", "R2", "old two", 1.0),
+         ("amazon.in:B01N54ZM9W", "R2", "new two", 2.0), ("https://example.com/item", "R9", "no asin", 1.0)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_legacy_bare_asin_rows_are_rekeyed(tmp_path, monkeypatch):
+    monkeypatch.delenv("REVIFY_LEGACY_MARKETPLACE", raising=False)
+    path = str(tmp_path / "reviews.db")
+    _legacy_db(path)
+
+    store = ReviewStore(path)
+    assert store.review_ids("amazon.in:B01N54ZM9W") == {"R1", "R2"}
+    assert store.count("B01N54ZM9W") == 0
+    # The row already stored under the canonical key wins
+    titles = {r.review_id: r.title for r in store.get_reviews("amazon.in:B01N54ZM9W")}
+    assert titles == {"R1": "old one", "R2": "new two"}
+    assert store.count("https://example.com/item") == 1
+    assert store._connect().execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+
+def test_new_store_is_keyed_by_product_key(tmp_path):
+    path = str(tmp_path / "reviews.db")
+    store = ReviewStore(path)
+    store.upsert_reviews("amazon.com:B000000001", [ReviewRecord("R1", "t", "b", 4.0, None, True, 0)])
+    # Reopening a current database leaves it alone
+    store = ReviewStore(path)
+    assert store.review_ids("amazon.com:B000000001") == {"R1"}
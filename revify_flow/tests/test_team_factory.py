@@ -0,0 +1,33 @@
+import pytest
+
+from src.revify_flow.crews.team_revify.team_factory import TeamFactory
+
+
+@pytest.fixture(scope="module")
+def factory():
+    return TeamFactory()
+
+
+def test_task_copies_configured_fields(factory):
+    template = factory.prototype.comprehensive_review_analysis_task()
+    template.output_file = "output/analysis.json"
+    template.async_execution = True
+    try:
+        task = factory.task("comprehensive_review_analysis_task")
+    finally:
+        template.output_file = None
+        template.async_execution = False
+
+    assert task is not template and task.id != template.id
+    assert task.output_file == "output/analysis.json"
+    assert task.async_execution is True
+    assert task.name == template.name
+    assert task.description == template.description
+    assert task.output is None
+
+
+def test_task_is_bound_to_this_threads_agent(factory):
+    task = factory.task("analyze_feature_task")
+    template = factory.prototype.analyze_feature_task()
+    assert task.agent is not template.agent
+    assert task.agent is factory.agent("review_analysis_agent")
@@ -2,7 +2,14 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from bs4 import BeautifulSoup
-import time 
+import os
+import sys
+
+# Shared readiness checks live in the revify_flow package
+REVIFY_FLOW_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "revify_flow")
+if REVIFY_FLOW_DIR not in sys.path:
+    sys.path.insert(0, REVIFY_FLOW_DIR)
+from src.revify_flow.tools.page_readiness import wait_for_reviews
 
 # Set up the Selenium driver
 def setup_driver():
@@ -23,7 +30,9 @@ def scrape_reviews(url):
     
     try:
         driver.get(url)
-        time.sleep(20)  # Wait for the page to load
+        # Wait for the reviews to render instead of a flat 20 s
+        if not wait_for_reviews(driver, timeout=20):
+            print("⚠️ Reviews did not load within 20 s, parsing what is there")
         
         # Use pandas to extract the main table
         tables = driver.page_source
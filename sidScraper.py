@@ -7,7 +7,15 @@ from bs4 import BeautifulSoup
 import time
 from dotenv import load_dotenv
 import os
+import sys
 from amazoncaptcha import AmazonCaptcha
+
+# Optional raw page archive shared with the revify_flow scraper (REVIFY_PAGE_ARCHIVE_DIR)
+REVIFY_FLOW_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "revify_flow")
+if REVIFY_FLOW_DIR not in sys.path:
+    sys.path.insert(0, REVIFY_FLOW_DIR)
+from src.revify_flow.tools.page_archive import get_page_archive
+
 load_dotenv()
 username = os.getenv('NUMBER')
 password = os.getenv('PASSWORD')
@@ -101,6 +109,7 @@ def scrape_reviews(url):
     review_titles = []
     reviews = []
     ratings=[]
+    page_archive = get_page_archive()
     while(a!=0):
         a-=1
         time.sleep(2)
@@ -109,8 +118,8 @@ def scrape_reviews(url):
         tables = driver.page_source
 
         soup = BeautifulSoup(tables, 'html.parser')
-        with open('amazon_reviews_page.txt', 'w', encoding='utf-8') as f:
-            f.write(tables)
+        if page_archive is not None:
+            page_archive.submit(tables)
         ret_bodies = soup.find_all('span', {'data-hook': 'review-body'})
         ret_titles = soup.find_all('a', {'data-hook': 'review-title'})  
         ret_ratings= soup.find_all('span', class_='a-icon-alt')  